@@ -0,0 +1,142 @@
+"""Compare the vectorized dashboard aggregation with the previous per-lead loops.
+
+Usage: python benchmarks/bench_aggregation.py [--sizes 10000 100000 1000000] [--json out.json]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from src.aggregation import dashboard_metrics
+from src.google_ads_client import CAMPAIGN_PERFORMANCE_SCHEMA, LEAD_INSIGHTS_SCHEMA
+from src.records import ColumnarRows
+
+START_DATE = date(2024, 1, 1)
+DAYS = 90
+
+
+def make_leads(count, seed=0):
+    """Build a synthetic lead insights result with count rows."""
+    rng = random.Random(seed)
+    leads = ColumnarRows(LEAD_INSIGHTS_SCHEMA.fields)
+    types = ['PHONE_CALL', 'MESSAGE', 'BOOKING']
+    statuses = ['NEW', 'ACTIVE', 'BOOKED', 'DECLINED', 'WIPED_OUT']
+    credit_states = ['PENDING', 'CREDITED', 'UNSPECIFIED']
+
+    for _ in range(count):
+        day = START_DATE + timedelta(days=rng.randrange(DAYS))
+        leads.append((
+            rng.choice(types), f'category_{rng.randrange(40)}', f'service_{rng.randrange(200)}',
+            rng.choice(statuses), rng.random() < 0.7, rng.choice(credit_states),
+            day.isoformat(), rng.randrange(24), day.strftime('%A').upper(),
+            rng.randrange(5000000, 90000000) / 1000000, rng.random() < 0.2, rng.random() * 100,
+            [], []
+        ))
+
+    return leads
+
+
+def make_performance(days=DAYS):
+    performance = ColumnarRows(CAMPAIGN_PERFORMANCE_SCHEMA.fields)
+    for offset in range(days):
+        day = START_DATE + timedelta(days=offset)
+        performance.append((
+            1, 'Local Services', 'ENABLED', day.isoformat(),
+            1000, 50, 120.0, 5, 500.0, 2.4, 0.05, 2.4, 24.0, 0.8, 'MAXIMIZE_LEADS', None, []
+        ))
+    return performance
+
+
+def legacy_dashboard(performance_records, lead_records, start_date, end_date):
+    """The per-lead loops and list-of-dicts DataFrame the dashboard used before."""
+    total_leads = len(lead_records)
+    total_cost = sum(lead['metrics']['cost'] for lead in lead_records) if lead_records else 0
+    impressions = sum(row['metrics']['impressions'] for row in performance_records)
+    conversion_rate = (total_leads / impressions * 100) if impressions > 0 else 0
+    avg_cost_per_lead = total_cost / total_leads if total_leads > 0 else 0
+
+    dates = pd.date_range(start=start_date, end=end_date)
+    leads_by_date = {day.strftime('%Y-%m-%d'): 0 for day in dates}
+    for lead in lead_records:
+        day = datetime.strptime(lead['timing']['date'][:10], '%Y-%m-%d').strftime('%Y-%m-%d')
+        leads_by_date[day] += 1
+
+    cost_by_category = {}
+    for lead in lead_records:
+        category = lead['lead_info']['category']
+        cost_by_category[category] = cost_by_category.get(category, 0) + lead['metrics']['cost']
+
+    df = pd.DataFrame([{**lead['lead_info'], **lead['metrics']} for lead in lead_records])
+    breakdowns = {
+        'lead_types': df['type'].value_counts().to_dict(),
+        'lead_status': df['status'].value_counts().to_dict(),
+        'categories': df['category'].value_counts().to_dict(),
+        'credit_states': df['credit_state'].value_counts().to_dict()
+    }
+
+    return conversion_rate, avg_cost_per_lead, leads_by_date, cost_by_category, breakdowns
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - started
+
+
+def run(sizes):
+    start_date = START_DATE.isoformat()
+    end_date = (START_DATE + timedelta(days=DAYS - 1)).isoformat()
+    performance = make_performance()
+    performance_records = performance.to_records()
+
+    results = []
+    for size in sizes:
+        leads = make_leads(size)
+
+        dict_build_seconds = timed(leads.to_records)
+        lead_records = leads.to_records()
+        legacy_seconds = timed(legacy_dashboard, performance_records, lead_records, start_date, end_date)
+        del lead_records
+        vectorized_seconds = timed(dashboard_metrics, performance, leads, start_date, end_date)
+
+        results.append({
+            'leads': size,
+            'dict_build_seconds': dict_build_seconds,
+            'legacy_seconds': legacy_seconds,
+            'vectorized_seconds': vectorized_seconds,
+            'speedup': legacy_seconds / vectorized_seconds if vectorized_seconds else None
+        })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    results = run(args.sizes)
+
+    print(f"{'leads':>10} {'dict build':>12} {'legacy':>10} {'vectorized':>12} {'speedup':>8}")
+    for result in results:
+        print(
+            f"{result['leads']:>10} {result['dict_build_seconds']:>11.3f}s {result['legacy_seconds']:>9.3f}s "
+            f"{result['vectorized_seconds']:>11.3f}s {result['speedup']:>7.1f}x"
+        )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'benchmark': 'aggregation', 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""Benchmark every GoogleAdsClient fetcher and the main Flask routes against a synthetic GoogleAdsService.
+
+For each fetcher: rows/sec, peak traced memory, and time spent streaming
+rows from the service vs converting them vs aggregating the result. For
+each route: end-to-end latency through the Flask test client.
+
+Usage: python benchmarks/bench_fetchers.py [--sizes 1000 100000 1000000] [--days 90] [--geos 500] [--json out.json]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Measure the code paths themselves: no cache, no day partitions, no rollups, no pacing
+os.environ.setdefault('ENABLE_CACHE', 'false')
+os.environ.setdefault('ENABLE_SYNC', 'false')
+os.environ.setdefault('ENABLE_ROLLUPS', 'false')
+os.environ.setdefault('RATE_LIMIT_DEVELOPER_QPS', '1000000')
+os.environ.setdefault('RATE_LIMIT_DEVELOPER_BURST', '1000000')
+os.environ.setdefault('RATE_LIMIT_CUSTOMER_QPS', '1000000')
+os.environ.setdefault('RATE_LIMIT_CUSTOMER_BURST', '1000000')
+
+from fake_ads import FakeGoogleAdsClientLib, FakeGoogleAdsService, install
+
+from src.aggregation import LEAD_STATISTICS_FIELDS, cost_by_category, lead_metrics, lead_trend
+from src.google_ads_client import LEAD_STATISTICS_SCHEMA, GoogleAdsClient
+
+CUSTOMER_ID = '1234567890'
+
+
+def fetcher_specs(client, start_date, end_date):
+    """(name, fetch, aggregate) for every fetcher.
+
+    fetch() returns the fetcher's result; aggregate(result), when given,
+    runs the aggregation the app applies to it.
+    """
+    def dashboard(leads):
+        lead_metrics(leads)
+        lead_trend(leads, start_date, end_date)
+        cost_by_category(leads)
+
+    return [
+        ('lead_statistics', lambda: client._fetch(
+            'lead_statistics', CUSTOMER_ID,
+            client._lead_statistics_query('custom', start_date, end_date), LEAD_STATISTICS_SCHEMA
+        ), lambda leads: lead_metrics(leads, LEAD_STATISTICS_FIELDS)),
+        ('lead_conversations', lambda: client.get_lead_conversations(CUSTOMER_ID, '1'), None),
+        ('employee_data', lambda: client.get_employee_data(CUSTOMER_ID), None),
+        ('campaign_data', lambda: client.get_campaign_data(CUSTOMER_ID), None),
+        ('detailed_lead_data', lambda: client.get_detailed_lead_data(CUSTOMER_ID, 'custom', start_date, end_date, as_columns=True), None),
+        ('lead_conversations_detailed', lambda: client.get_lead_conversations_detailed(CUSTOMER_ID), None),
+        ('verification_artifacts', lambda: client.get_verification_artifacts(CUSTOMER_ID), None),
+        ('employees', lambda: client.get_employees(CUSTOMER_ID), None),
+        ('campaign_performance', lambda: client.get_campaign_performance(CUSTOMER_ID, start_date, end_date, as_columns=True),
+         lambda rows: client.summarize_rows(rows.to_records())),
+        ('lead_insights', lambda: client.get_lead_insights(CUSTOMER_ID, start_date, end_date, as_columns=True), dashboard),
+        ('geographic_performance', lambda: client.get_geographic_performance(CUSTOMER_ID, start_date, end_date, as_columns=True),
+         lambda rows: client.summarize_rows(rows.to_records())),
+        ('competitor_insights', lambda: client.get_competitor_insights(CUSTOMER_ID), None)
+    ]
+
+
+def timed(fn, repeat=1):
+    """Return (best seconds, last result) over repeat runs."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def peak_memory(fn):
+    """Peak bytes allocated by Python while fn runs."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_fetchers(service, start_date, end_date, repeat):
+    client = GoogleAdsClient(credentials={'developer_token': 'benchmark'})
+    client.client = FakeGoogleAdsClientLib(service)
+
+    return [
+        bench_fetcher(service, name, fetch, aggregate, repeat)
+        for name, fetch, aggregate in fetcher_specs(client, start_date, end_date)
+    ]
+
+
+def bench_fetcher(service, name, fetch, aggregate, repeat):
+    """Measure one fetcher; its result is released before the next one runs."""
+    # Warm up, which also builds the service's row pool for this query
+    fetch()
+    query = service.last_query
+
+    stream_seconds, _ = timed(lambda: sum(len(batch.results) for batch in service.search_stream(CUSTOMER_ID, query)), repeat)
+    fetch_seconds, result = timed(fetch, repeat)
+    aggregate_seconds = timed(lambda: aggregate(result), repeat)[0] if aggregate else None
+    rows = len(result)
+
+    return {
+        'fetcher': name,
+        'rows': rows,
+        'fetch_seconds': fetch_seconds,
+        'stream_seconds': stream_seconds,
+        'conversion_seconds': max(0.0, fetch_seconds - stream_seconds),
+        'aggregation_seconds': aggregate_seconds,
+        'rows_per_second': rows / fetch_seconds if fetch_seconds else None,
+        'peak_memory_bytes': peak_memory(fetch)
+    }
+
+
+def route_specs(start_date, end_date):
+    """(name, method, path, JSON body) for each benchmarked route."""
+    body = {'customer_id': CUSTOMER_ID, 'start_date': start_date, 'end_date': end_date}
+    query = f'customer_id={CUSTOMER_ID}&start_date={start_date}&end_date={end_date}'
+    return [
+        ('campaigns_performance', 'POST', '/api/campaigns/performance', body),
+        ('campaigns_performance_normalized', 'POST', '/api/campaigns/performance', dict(body, normalized=True)),
+        ('leads_insights', 'POST', '/api/leads/insights', body),
+        ('leads_insights_normalized', 'POST', '/api/leads/insights', dict(body, normalized=True)),
+        ('campaigns_geographic', 'POST', '/api/campaigns/geographic', body),
+        ('export_csv', 'GET', f'/api/export/csv?{query}', None),
+        ('export_parquet', 'GET', f'/api/export/parquet?{query}', None),
+        ('portfolio_lead_insights', 'POST', '/api/portfolio/lead_insights',
+         dict(body, customer_ids=[CUSTOMER_ID, '2234567890', '3234567890']))
+    ]
+
+
+def bench_routes(service, start_date, end_date, repeat):
+    install(service)
+    from src.app import app
+
+    # Distinct credentials per service, so the app pools a fresh client for it
+    client = app.test_client()
+    client.post('/api/initialize', json={'developer_token': 'benchmark', 'refresh_token': f'benchmark-{id(service)}'})
+
+    results = []
+    for name, method, path, body in route_specs(start_date, end_date):
+        def request():
+            response = client.open(path, method=method, json=body)
+            return response.status_code, len(response.get_data())
+
+        request()
+        seconds, (status, size) = timed(request, repeat)
+        results.append({'route': name, 'status': status, 'seconds': seconds, 'response_bytes': size})
+
+    return results
+
+
+def run(sizes, days, geos, repeat):
+    end = date(2024, 3, 31)
+    start_date = (end - timedelta(days=days - 1)).isoformat()
+    end_date = end.isoformat()
+
+    results = []
+    for size in sizes:
+        service = FakeGoogleAdsService(rows=size, days=days, geos=geos)
+        results.append({
+            'rows_per_query': size,
+            'fetchers': bench_fetchers(service, start_date, end_date, repeat),
+            'routes': bench_routes(service, start_date, end_date, repeat)
+        })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000])
+    parser.add_argument('--days', type=int, default=90)
+    parser.add_argument('--geos', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.days, args.geos, args.repeat)
+
+    for result in results:
+        print(f"\n{result['rows_per_query']} rows per query")
+        print(f"{'fetcher':<28} {'rows/s':>12} {'stream':>9} {'convert':>9} {'aggregate':>10} {'peak MB':>9}")
+        for row in result['fetchers']:
+            aggregate = f"{row['aggregation_seconds']:.3f}s" if row['aggregation_seconds'] is not None else '-'
+            print(
+                f"{row['fetcher']:<28} {row['rows_per_second']:>12,.0f} {row['stream_seconds']:>8.3f}s "
+                f"{row['conversion_seconds']:>8.3f}s {aggregate:>10} {row['peak_memory_bytes'] / 1e6:>9.1f}"
+            )
+        print(f"{'route':<34} {'status':>6} {'latency':>9} {'bytes':>12}")
+        for row in result['routes']:
+            print(f"{row['route']:<34} {row['status']:>6} {row['seconds']:>8.3f}s {row['response_bytes']:>12,}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'benchmark': 'fetchers',
+                'python': platform.python_version(),
+                'config': {'sizes': args.sizes, 'days': args.days, 'geos': args.geos, 'repeat': args.repeat},
+                'results': results
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
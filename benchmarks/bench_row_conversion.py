@@ -0,0 +1,124 @@
+"""Benchmark converting API rows from proto-plus messages vs raw protobuf messages (USE_PROTO_PLUS).
+
+Rows are real GoogleAdsRow protobuf messages from the synthetic
+GoogleAdsService. For each fetcher and mode: rows/sec for the columnar
+fetch (get_* with as_columns) and the streamed dicts (stream_*), and
+the time spent in conversion, net of handing the rows out.
+
+Usage: python benchmarks/bench_row_conversion.py [--rows 20000] [--repeat 3] [--json out.json]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import date, timedelta
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Measure the conversion itself: no cache, no day partitions, no rollups, no pacing
+os.environ.setdefault('ENABLE_CACHE', 'false')
+os.environ.setdefault('ENABLE_SYNC', 'false')
+os.environ.setdefault('ENABLE_ROLLUPS', 'false')
+
+from bench_fetchers import CUSTOMER_ID, timed
+from fake_ads import FakeGoogleAdsClientLib, FakeGoogleAdsService
+
+from src.google_ads_client import GoogleAdsClient
+from src.serialization import to_plain
+
+MODES = (('proto_plus', True), ('raw', False))
+
+
+def fetcher_specs(client, start_date, end_date):
+    """(name, columnar fetch, streamed fetch) for every RowSchema-based fetcher."""
+    return [
+        ('detailed_lead_data',
+         lambda: client.get_detailed_lead_data(CUSTOMER_ID, 'custom', start_date, end_date, as_columns=True),
+         lambda: client.stream_detailed_lead_data(CUSTOMER_ID, 'custom', start_date, end_date)),
+        ('campaign_performance',
+         lambda: client.get_campaign_performance(CUSTOMER_ID, start_date, end_date, as_columns=True),
+         lambda: client.stream_campaign_performance(CUSTOMER_ID, start_date, end_date)),
+        ('lead_insights',
+         lambda: client.get_lead_insights(CUSTOMER_ID, start_date, end_date, as_columns=True),
+         lambda: client.stream_lead_insights(CUSTOMER_ID, start_date, end_date))
+    ]
+
+
+def client_for(service, use_proto_plus):
+    client = GoogleAdsClient(credentials={'developer_token': 'benchmark'}, use_proto_plus=use_proto_plus)
+    client.client = FakeGoogleAdsClientLib(service, use_proto_plus=use_proto_plus)
+    return client
+
+
+def run(rows, repeat):
+    end_date = date.today()
+    start_date = end_date - timedelta(days=89)
+    service = FakeGoogleAdsService(rows=rows, protobuf=True)
+
+    results = []
+    outputs = {}
+    for mode, use_proto_plus in MODES:
+        client = client_for(service, use_proto_plus)
+        ga_service = client.client.get_service('GoogleAdsService')
+
+        for name, fetch, stream in fetcher_specs(client, start_date, end_date):
+            # Warm up, which also builds the service's row pool and the compiled accessors
+            outputs[name, mode] = to_plain(fetch().to_records()[:100])
+            query = service.last_query
+
+            stream_seconds, _ = timed(lambda: sum(len(batch.results) for batch in ga_service.search_stream(CUSTOMER_ID, query)), repeat)
+            columns_seconds, result = timed(fetch, repeat)
+            records_seconds, _ = timed(lambda: sum(1 for _ in stream()), repeat)
+            count = len(result)
+
+            results.append({
+                'fetcher': name,
+                'mode': mode,
+                'rows': count,
+                'stream_seconds': stream_seconds,
+                'columns_seconds': columns_seconds,
+                'records_seconds': records_seconds,
+                'columns_rows_per_second': count / columns_seconds if columns_seconds else None,
+                'records_rows_per_second': count / records_seconds if records_seconds else None,
+                'conversion_seconds': max(0.0, columns_seconds - stream_seconds)
+            })
+            del result
+
+    # Both modes must produce the same values
+    for name, _, _ in fetcher_specs(None, start_date, end_date):
+        if outputs[name, 'proto_plus'] != outputs[name, 'raw']:
+            raise AssertionError(f"{name}: raw protobuf rows converted differently from proto-plus rows")
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    results = run(args.rows, args.repeat)
+
+    print(f"{'fetcher':<22} {'mode':<11} {'rows':>8} {'columns rows/s':>15} {'records rows/s':>15} {'conversion':>11}")
+    for result in results:
+        print(
+            f"{result['fetcher']:<22} {result['mode']:<11} {result['rows']:>8} {result['columns_rows_per_second']:>15,.0f} "
+            f"{result['records_rows_per_second']:>15,.0f} {result['conversion_seconds']:>10.3f}s"
+        )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'benchmark': 'row_conversion',
+                'python': platform.python_version(),
+                'rows_per_query': args.rows,
+                'results': results
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+"""Measure the app's cold start: import time, time to first response and baseline RSS, and fail on regressions.
+
+Every sample is a fresh interpreter that imports src.app, then answers
+/api/check-status and a first data request (lead insights against the
+synthetic GoogleAdsService) through the Flask test client. Both the
+default lazy mode and PRELOAD_DEPENDENCIES=true (what a pre-fork master
+does) are measured; medians are reported.
+
+With --baseline (a previous --json output) the run fails when a median
+is more than --tolerance above the baseline; --max-import-seconds,
+--max-first-response-seconds and --max-rss-mb are absolute budgets.
+
+Usage: python benchmarks/bench_startup.py [--samples 5] [--json startup.json]
+                                          [--baseline startup.json --tolerance 0.25] [--max-import-seconds 0.5]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(BENCHMARK_DIR))
+
+MODES = {'lazy': 'false', 'preload': 'true'}
+METRICS = ('import_seconds', 'first_response_seconds', 'first_data_response_seconds', 'process_seconds', 'import_rss_bytes', 'rss_bytes')
+
+# Increases smaller than this are noise, whatever the tolerance
+NOISE_FLOOR = {'seconds': 0.02, 'bytes': 5e6}
+
+
+def rss_bytes():
+    """Resident set size of this process (Linux; peak RSS elsewhere)."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def child():
+    """One cold start, printed as a JSON line."""
+    started = time.perf_counter()
+    from src.app import app
+    import_seconds = time.perf_counter() - started
+    import_rss = rss_bytes()
+
+    from fake_ads import FakeGoogleAdsService, install
+    install(FakeGoogleAdsService(rows=1000))
+    client = app.test_client()
+
+    started = time.perf_counter()
+    status = client.get('/api/check-status').status_code
+    first_response_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    client.post('/api/initialize', json={'developer_token': 'benchmark', 'refresh_token': 'benchmark'})
+    data_status = client.post('/api/leads/insights', json={
+        'customer_id': '1234567890', 'start_date': '2024-01-01', 'end_date': '2024-03-31'
+    }).status_code
+    first_data_response_seconds = time.perf_counter() - started
+
+    print(json.dumps({
+        'import_seconds': import_seconds,
+        'first_response_seconds': first_response_seconds,
+        'first_data_response_seconds': first_data_response_seconds,
+        'import_rss_bytes': import_rss,
+        'rss_bytes': rss_bytes(),
+        'statuses': [status, data_status]
+    }))
+
+
+def sample(mode, directory):
+    env = dict(
+        os.environ,
+        PRELOAD_DEPENDENCIES=MODES[mode],
+        SECRET_KEY='benchmark',
+        CACHE_PATH=os.path.join(directory, 'results.sqlite3'),
+        SYNC_PATH=os.path.join(directory, 'partitions.sqlite3'),
+        ROLLUP_PATH=os.path.join(directory, 'rollups.sqlite3')
+    )
+    for name in ('RATE_LIMIT_DEVELOPER_QPS', 'RATE_LIMIT_DEVELOPER_BURST', 'RATE_LIMIT_CUSTOMER_QPS', 'RATE_LIMIT_CUSTOMER_BURST'):
+        env.setdefault(name, '1000000')
+
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child'],
+        env=env, cwd=directory, capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result['process_seconds'] = time.perf_counter() - started
+
+    if result['statuses'] != [200, 200]:
+        raise SystemExit(f"{mode}: unexpected response statuses {result['statuses']}")
+    return result
+
+
+def run(samples):
+    results = {}
+    for mode in MODES:
+        runs = []
+        for _ in range(samples):
+            with tempfile.TemporaryDirectory(prefix='bench-startup-') as directory:
+                runs.append(sample(mode, directory))
+        results[mode] = {metric: statistics.median(run[metric] for run in runs) for metric in METRICS}
+    return results
+
+
+def regressions(results, baseline, tolerance, budgets):
+    """Descriptions of every median over its baseline (plus tolerance) or, in lazy mode, its absolute budget."""
+    failures = []
+    for mode, medians in results.items():
+        for metric, value in medians.items():
+            previous = (baseline or {}).get(mode, {}).get(metric)
+            noise = NOISE_FLOOR[metric.rsplit('_', 1)[1]]
+            if previous and value > previous * (1 + tolerance) and value - previous > noise:
+                failures.append(f"{mode} {metric}: {value:.4g} > baseline {previous:.4g} +{tolerance:.0%}")
+
+            # Preloading trades startup for the first request on purpose, so budgets apply to lazy starts
+            budget = budgets.get(metric) if mode == 'lazy' else None
+            if budget is not None and value > budget:
+                failures.append(f"{mode} {metric}: {value:.4g} > budget {budget:.4g}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--samples', type=int, default=5)
+    parser.add_argument('--baseline', help='Previous --json output to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative increase over the baseline')
+    parser.add_argument('--max-import-seconds', type=float)
+    parser.add_argument('--max-first-response-seconds', type=float)
+    parser.add_argument('--max-rss-mb', type=float)
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, BENCHMARK_DIR)
+        child()
+        return
+
+    results = run(args.samples)
+
+    print(f"{'mode':<9} {'import':>9} {'first resp':>11} {'first data':>11} {'process':>9} {'import RSS':>11} {'RSS':>9}")
+    for mode, medians in results.items():
+        print(
+            f"{mode:<9} {medians['import_seconds']:>8.3f}s {medians['first_response_seconds']:>10.3f}s "
+            f"{medians['first_data_response_seconds']:>10.3f}s {medians['process_seconds']:>8.3f}s "
+            f"{medians['import_rss_bytes'] / 1e6:>8.1f} MB {medians['rss_bytes'] / 1e6:>6.1f} MB"
+        )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'benchmark': 'startup',
+                'python': platform.python_version(),
+                'samples': args.samples,
+                **results
+            }, f, indent=2)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    budgets = {
+        'import_seconds': args.max_import_seconds,
+        'first_response_seconds': args.max_first_response_seconds,
+        'import_rss_bytes': args.max_rss_mb * 1e6 if args.max_rss_mb else None
+    }
+    failures = regressions(results, baseline, args.tolerance, budgets)
+    if failures:
+        print('\nStartup regressions:\n  ' + '\n  '.join(failures))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,286 @@
+"""Synthetic stand-in for GoogleAdsService, used by the benchmarks and the load test.
+
+Rows are built from the SELECT list of each GAQL query, so every fetcher
+(and every field projection) works without credentials. They mimic
+proto-plus messages: nested attribute access, IntEnum enum values with
+UNSPECIFIED/UNKNOWN members, micros as ints and repeated fields as lists.
+Fields filtered with IN (...) cycle through the listed values. With
+protobuf=True rows are real GoogleAdsRow protobuf messages instead,
+handed out raw or wrapped in proto-plus depending on the client's
+use_proto_plus setting; fields the API does not have are left out.
+"""
+import enum
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+
+SELECT = re.compile(r'SELECT\s+(.*?)\s+FROM\s+(\w+)', re.S)
+DATE_RANGE = re.compile(r"BETWEEN '(\d{4}-\d{2}-\d{2})[^']*' AND '(\d{4}-\d{2}-\d{2})")
+LIMIT = re.compile(r'LIMIT (\d+)')
+IN_LIST = re.compile(r"([a-z_.]+) IN \(([^)]*)\)")
+
+ENUM_VALUES = {
+    'type': ('PHONE_CALL', 'MESSAGE', 'BOOKING'),
+    'lead_type': ('PHONE_CALL', 'MESSAGE', 'BOOKING'),
+    'status': ('ENABLED', 'PAUSED', 'REMOVED'),
+    'lead_status': ('NEW', 'ACTIVE', 'BOOKED', 'DECLINED', 'EXPIRED', 'CONSUMER_DECLINED', 'WIPED_OUT'),
+    'credit_state': ('PENDING', 'CREDITED'),
+    'day_of_week': ('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY'),
+    'conversation_channel': ('PHONE_CALL', 'MESSAGE', 'EMAIL', 'SMS'),
+    'participant_type': ('ADVERTISER', 'CONSUMER'),
+    'artifact_type': ('LICENSE', 'INSURANCE', 'BACKGROUND_CHECK'),
+    'bidding_strategy_type': ('MAXIMIZE_CONVERSIONS', 'MANUAL_CPA', 'MANUAL_CPC'),
+    'period': ('DAILY', 'CUSTOM_PERIOD'),
+    'location_type': ('AREA_OF_INTEREST', 'LOCATION_OF_PRESENCE'),
+    'targeting_location_type': ('AREA_OF_INTEREST', 'LOCATION_OF_PRESENCE'),
+    'role': ('OWNER', 'EMPLOYEE')
+}
+ENUMS = {
+    leaf: enum.IntEnum(''.join(part.title() for part in leaf.split('_')), ('UNSPECIFIED', 'UNKNOWN') + names, start=0)
+    for leaf, names in ENUM_VALUES.items()
+}
+
+INT_FIELDS = ('impressions', 'clicks', 'year_started_practicing', 'call_duration_millis')
+MICROS_FIELDS = ('average_cpc', 'average_cost', 'cost_per_conversion')
+FLOAT_FIELDS = (
+    'conversions', 'conversions_value', 'ctr', 'optimization_score', 'optimization_score_weight',
+    'search_impression_share', 'search_rank_lost_impression_share', 'search_budget_lost_impression_share',
+    'conversion_rate'
+)
+REPEATED_FIELDS = (
+    'category_bids', 'granular_license_statuses', 'granular_insurance_statuses', 'university_degrees',
+    'residencies', 'fellowships', 'languages_spoken', 'attachment_urls'
+)
+
+
+class Message:
+    """Attribute bag standing in for a proto-plus message."""
+
+    def __init__(self, fields):
+        self.__dict__.update(fields)
+
+
+class Batch:
+    """One SearchGoogleAdsStreamResponse."""
+
+    def __init__(self, results):
+        self.results = results
+
+
+class FakeGoogleAdsService:
+    """Answers search_stream with synthetic rows for any GAQL query.
+
+    rows is the number of rows per query (or a callable taking the FROM
+    resource). Dates are spread over the query's segments.date range (or
+    the last days days), and rows cycle through a pool of pool_size
+    distinct rows so generating them does not dominate the measurements.
+    latency seconds are slept before the first batch of every call.
+    """
+
+    def __init__(self, rows=1000, batch_size=10000, latency=0.0, days=90, geos=500, categories=40,
+                 campaigns=10, pool_size=4096, seed=0, protobuf=False):
+        self.rows = rows
+        self.batch_size = batch_size
+        self.latency = latency
+        self.days = days
+        self.geos = geos
+        self.categories = categories
+        self.campaigns = campaigns
+        self.pool_size = pool_size
+        self.seed = seed
+        self.protobuf = protobuf
+        self.calls = 0
+        self.last_query = None
+
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def search_stream(self, customer_id, query):
+        with self._lock:
+            self.calls += 1
+            self.last_query = query
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        resource = SELECT.search(query).group(2)
+        limit = LIMIT.search(query)
+        count = self.rows(resource) if callable(self.rows) else self.rows
+        if limit:
+            count = min(count, int(limit.group(1)))
+
+        pool = self._pool(query, min(count, self.pool_size))
+        for start in range(0, count, self.batch_size):
+            end = min(count, start + self.batch_size)
+            yield Batch([pool[index % len(pool)] for index in range(start, end)])
+
+    def _pool(self, query, size):
+        key = (query, size)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._build_pool(query, size)
+            with self._lock:
+                if len(self._pools) > 64:
+                    self._pools.clear()
+                self._pools[key] = pool
+        return pool
+
+    def _build_pool(self, query, size):
+        fields = [field.strip() for field in SELECT.search(query).group(1).split(',')]
+        date_range = DATE_RANGE.search(query)
+        if date_range:
+            first = date.fromisoformat(date_range.group(1))
+            days = (date.fromisoformat(date_range.group(2)) - first).days + 1
+        else:
+            days = self.days
+            first = date.today() - timedelta(days=days - 1)
+
+        in_lists = {
+            field: [value.strip().strip("'") for value in values.split(',')]
+            for field, values in IN_LIST.findall(query)
+        }
+
+        rng = random.Random(self.seed)
+        pool = []
+        for index in range(max(size, 1)):
+            day = first + timedelta(days=index % max(days, 1))
+            # Campaign and customer attributes are the same on every row of the entity, as in the API
+            campaign_id = rng.randrange(self.campaigns) + 1
+            entities = {'campaign': (random.Random(campaign_id), campaign_id), 'customer': (random.Random(0), 0)}
+            tree = {}
+            for field in fields:
+                path = field.split('.')
+                target = tree
+                for key in path[:-1]:
+                    target = target.setdefault(key, {})
+                if field in in_lists:
+                    target[path[-1]] = in_lists[field][index % len(in_lists[field])]
+                elif field == 'campaign.id':
+                    target[path[-1]] = campaign_id
+                elif path[0] in entities:
+                    entity_rng, entity_index = entities[path[0]]
+                    target[path[-1]] = self._value(path[-1], entity_rng, entity_index, day)
+                elif path[-1] == 'id':
+                    # Leads, conversations etc. have one id per row; campaigns repeat
+                    target[path[-1]] = index + 1
+                else:
+                    target[path[-1]] = self._value(path[-1], rng, index, day)
+            pool.append(_protobuf_row(tree) if self.protobuf else _message(tree))
+
+        return pool
+
+    def _value(self, leaf, rng, index, day):
+        if leaf == 'date':
+            return day.isoformat()
+        if leaf.endswith('date_time') or leaf in ('timestamp', 'update_time'):
+            return f"{day.isoformat()} {rng.randrange(24):02d}:{rng.randrange(60):02d}:00"
+        if leaf == 'hour':
+            return rng.randrange(24)
+        if leaf in ENUMS:
+            members = list(ENUMS[leaf])[2:]
+            return members[rng.randrange(len(members))]
+        if leaf in ('category_id', 'category'):
+            return f"xcat:service_area_business_{rng.randrange(self.categories)}"
+        if leaf in ('service_id', 'service'):
+            return f"service_{rng.randrange(self.categories * 5)}"
+        if leaf in ('location_name', 'canonical_name'):
+            geo = rng.randrange(self.geos)
+            return f"Geo {geo}" if leaf == 'location_name' else f"Geo {geo},State {geo % 50},United States"
+        if leaf == 'country_criterion_id':
+            return 2840
+        if leaf == 'id' or leaf.endswith('_id'):
+            return rng.randrange(self.campaigns) + 1 if leaf == 'id' else rng.randrange(1, 10 ** 9)
+        if leaf.endswith('_micros') or leaf in MICROS_FIELDS:
+            return rng.randrange(5000000, 90000000)
+        if leaf in INT_FIELDS:
+            return rng.randrange(1000)
+        if leaf in FLOAT_FIELDS:
+            return round(rng.random() * 10, 4)
+        if leaf == 'lead_charged':
+            return rng.random() < 0.7
+        if leaf in REPEATED_FIELDS:
+            return [f"{leaf}_{rng.randrange(10)}" for _ in range(rng.randrange(3))]
+        return f"{leaf}_{index % 1000}"
+
+
+class FakeGoogleAdsClientLib:
+    """Stands in for google.ads.googleads.client.GoogleAdsClient."""
+
+    service = None
+
+    def __init__(self, service=None, use_proto_plus=True):
+        self.service = service or FakeGoogleAdsClientLib.service
+        self.use_proto_plus = use_proto_plus
+
+    @classmethod
+    def load_from_dict(cls, config, version=None):
+        return cls(use_proto_plus=config.get('use_proto_plus', True))
+
+    def get_service(self, name, version=None):
+        if self.service.protobuf and self.use_proto_plus:
+            return ProtoPlusService(self.service)
+        return self.service
+
+
+class ProtoPlusService:
+    """Hands out a protobuf-backed service's rows wrapped in proto-plus, as the library does with use_proto_plus."""
+
+    def __init__(self, service):
+        self.service = service
+
+    def search_stream(self, customer_id, query):
+        wrap = _row_type().wrap
+        for batch in self.service.search_stream(customer_id, query):
+            yield Batch([wrap(row) for row in batch.results])
+
+
+def install(service):
+    """Make GoogleAdsClient.initialize_client load clients backed by service instead of the real library."""
+    from src import google_ads_client
+
+    FakeGoogleAdsClientLib.service = service
+    google_ads_client.GoogleAdsClientLib = FakeGoogleAdsClientLib
+
+
+def _message(tree):
+    return Message({key: _message(value) if isinstance(value, dict) else value for key, value in tree.items()})
+
+
+def _row_type():
+    from google.ads.googleads.v25.services.types.google_ads_service import GoogleAdsRow
+    return GoogleAdsRow
+
+
+def _protobuf_row(tree):
+    row = _row_type().pb()()
+    _fill(row, tree)
+    return row
+
+
+def _fill(message, tree):
+    fields = message.DESCRIPTOR.fields_by_name
+    for key, value in tree.items():
+        field = fields.get(key)
+        if field is None:
+            continue
+        if isinstance(value, dict):
+            if field.message_type is not None and not field.is_repeated:
+                _fill(getattr(message, key), value)
+        elif field.is_repeated:
+            if field.message_type is not None:
+                for _ in value:
+                    getattr(message, key).add()
+            elif field.type == field.TYPE_STRING:
+                getattr(message, key).extend(value)
+        elif field.enum_type is not None:
+            member = field.enum_type.values_by_name.get(getattr(value, 'name', None))
+            # Names the API does not have fall back to its first value after UNSPECIFIED and UNKNOWN
+            values = field.enum_type.values
+            setattr(message, key, member.number if member else values[min(2, len(values) - 1)].number)
+        elif field.message_type is None:
+            try:
+                setattr(message, key, value)
+            except (TypeError, ValueError):
+                pass
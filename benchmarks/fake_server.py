@@ -0,0 +1,42 @@
+"""Serve the app against the synthetic GoogleAdsService, for load testing without credentials.
+
+Usage: python benchmarks/fake_server.py [--port 5055]
+   or: gunicorn --chdir benchmarks --workers 4 --threads 8 fake_server:app
+
+The fake is configured by FAKE_ROWS (rows per query), FAKE_LATENCY
+(seconds slept per upstream call), FAKE_DAYS and FAKE_GEOS.
+"""
+import argparse
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Upstream pacing is the fake's latency, not the production rate limits
+for name in ('RATE_LIMIT_DEVELOPER_QPS', 'RATE_LIMIT_DEVELOPER_BURST', 'RATE_LIMIT_CUSTOMER_QPS', 'RATE_LIMIT_CUSTOMER_BURST'):
+    os.environ.setdefault(name, '1000000')
+
+from fake_ads import FakeGoogleAdsService, install
+
+install(FakeGoogleAdsService(
+    rows=int(os.getenv('FAKE_ROWS', 5000)),
+    latency=float(os.getenv('FAKE_LATENCY', 0.05)),
+    days=int(os.getenv('FAKE_DAYS', 90)),
+    geos=int(os.getenv('FAKE_GEOS', 500))
+))
+
+from src.app import app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+
+    app.run(host=args.host, port=args.port, threaded=True, debug=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,345 @@
+"""Drive concurrent dashboard traffic at the app and report latency percentiles, throughput, errors and RSS.
+
+The app is started in a subprocess against the synthetic GoogleAdsService
+(see fake_server.py), either on the Werkzeug threaded server or under
+gunicorn (gunicorn.conf.py, with the app preloaded) with the given
+workers and threads. Requests are sent open-loop at --rate per second,
+and latency is measured from each request's scheduled start, so a
+saturated server shows up as growing latency instead of a lower request
+rate.
+
+Usage: python benchmarks/load_test.py [--rate 20] [--duration 30] [--latency 0.05] [--rows 5000]
+                                      [--mix performance=4,insights=3,geographic=2,csv=1]
+                                      [--server gunicorn --workers 4 --threads 8] [--json out.json]
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+CUSTOMER_ID = '1234567890'
+CREDENTIALS = {'developer_token': 'load-test', 'refresh_token': 'load-test'}
+START_DATE = '2024-01-01'
+END_DATE = '2024-03-31'
+
+ROUTES = {
+    'performance': ('POST', '/api/campaigns/performance'),
+    'insights': ('POST', '/api/leads/insights'),
+    'geographic': ('POST', '/api/campaigns/geographic'),
+    'csv': ('GET', '/api/export/csv')
+}
+
+
+def parse_mix(text):
+    """Parse 'performance=4,insights=3' into {route: weight}."""
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name not in ROUTES:
+            raise SystemExit(f"Unknown route in mix: {name} (choose from {', '.join(ROUTES)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def start_server(args, port):
+    """Start the app on the fake in a subprocess and wait until it answers."""
+    directory = tempfile.mkdtemp(prefix='load-test-')
+    env = dict(
+        os.environ,
+        FAKE_ROWS=str(args.rows),
+        FAKE_LATENCY=str(args.latency),
+        SECRET_KEY='load-test',
+        ENABLE_CACHE='true' if args.cache else 'false',
+        ENABLE_SYNC='false',
+        CACHE_PATH=os.path.join(directory, 'results.sqlite3'),
+        ROLLUP_PATH=os.path.join(directory, 'rollups.sqlite3'),
+        CREDENTIAL_STORE_PATH=os.path.join(directory, 'credentials.sqlite3')
+    )
+
+    if args.server == 'gunicorn':
+        command = [
+            sys.executable, '-m', 'gunicorn', '--config', os.path.join(os.path.dirname(BENCHMARK_DIR), 'gunicorn.conf.py'),
+            '--chdir', BENCHMARK_DIR,
+            '--workers', str(args.workers), '--threads', str(args.threads),
+            '--bind', f'127.0.0.1:{port}', '--log-level', 'warning', 'fake_server:app'
+        ]
+    else:
+        command = [sys.executable, os.path.join(BENCHMARK_DIR, 'fake_server.py'), '--port', str(port)]
+
+    # stderr goes to a file, so a crashed server's traceback (or signal) can be reported
+    stderr = open(os.path.join(directory, 'server.stderr'), 'w+')
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=stderr)
+    process.stderr_file = stderr
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(server_exit_message(process))
+        try:
+            requests.get(f'http://127.0.0.1:{port}/api/check-status', timeout=1)
+            return process
+        except requests.ConnectionError:
+            time.sleep(0.2)
+
+    process.kill()
+    raise SystemExit("Server did not start within 30 seconds")
+
+
+def server_exit_message(process, tail=40):
+    """How the server process exited, with the end of its stderr."""
+    code = process.returncode
+    status = f"killed by signal {-code}" if code < 0 else f"exited with code {code}"
+
+    process.stderr_file.seek(0)
+    lines = process.stderr_file.read().splitlines()[-tail:]
+    return f"Server {status}" + (":\n  " + "\n  ".join(lines) if lines else " (no stderr output)")
+
+
+def process_tree_rss(pid):
+    """Resident set size in bytes of pid and all its descendants (Linux only; None elsewhere)."""
+    if not os.path.isdir('/proc'):
+        return None
+
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f'/proc/{current}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+        except OSError:
+            continue
+
+    return total
+
+
+class LoadGenerator:
+    """Open-loop request driver that records one sample per request."""
+
+    def __init__(self, base_url, mix, concurrency, seed=0):
+        self.base_url = base_url
+        self.mix = mix
+        self.samples = []
+        self.reinitializations = 0
+        self.in_flight = 0
+
+        self._pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='load')
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+
+    def run(self, rate, duration, server=None):
+        """Schedule rate requests per second for duration seconds and wait for them to finish.
+
+        Scheduling stops early when the server process exits.
+        """
+        routes = list(self.mix)
+        weights = [self.mix[route] for route in routes]
+        started = time.monotonic()
+
+        for index in range(int(rate * duration)):
+            if server is not None and server.poll() is not None:
+                break
+
+            scheduled = started + index / rate
+            delay = scheduled - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            route = self._random.choices(routes, weights)[0]
+            with self._lock:
+                self.in_flight += 1
+            self._pool.submit(self._request, route, scheduled)
+
+        self._pool.shutdown(wait=True)
+        return time.monotonic() - started
+
+    def _session(self):
+        """Per-thread HTTP session whose cookie is bound to an initialized client."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            self._initialize(session)
+        return session
+
+    def _initialize(self, session):
+        session.post(f'{self.base_url}/api/initialize', json=CREDENTIALS, timeout=30)
+
+    def _request(self, route, scheduled):
+        method, path = ROUTES[route]
+        body = {'customer_id': CUSTOMER_ID, 'start_date': START_DATE, 'end_date': END_DATE}
+        sample = {'route': route, 'status': None, 'bytes': 0, 'error': None}
+
+        sent = time.monotonic()
+        try:
+            session = self._session()
+            response = self._send(session, method, path, body)
+
+            # Only needed when a worker cannot restore the client from the credential store
+            if response.status_code == 400 and 'not initialized' in response.text:
+                with self._lock:
+                    self.reinitializations += 1
+                self._initialize(session)
+                response = self._send(session, method, path, body)
+
+            sample['status'] = response.status_code
+            sample['bytes'] = len(response.content)
+            if response.status_code >= 400:
+                sample['error'] = f'HTTP {response.status_code}'
+        except requests.RequestException as e:
+            sample['error'] = f'{type(e).__name__}: {e}'
+
+        finished = time.monotonic()
+        sample['latency'] = finished - scheduled
+        sample['service_time'] = finished - sent
+        sample['finished'] = finished
+
+        with self._lock:
+            self.samples.append(sample)
+            self.in_flight -= 1
+
+    def _send(self, session, method, path, body):
+        url = f'{self.base_url}{path}'
+        if method == 'GET':
+            return session.get(url, params=body, timeout=120)
+        return session.post(url, json=body, timeout=120)
+
+
+def sample_resources(generator, pid, interval, stop, timeline):
+    """Record RSS, completed requests and in-flight requests every interval seconds until stop is set."""
+    started = time.monotonic()
+    while not stop.wait(interval):
+        with generator._lock:
+            completed = len(generator.samples)
+            errors = sum(1 for sample in generator.samples if sample['error'])
+            in_flight = generator.in_flight
+        timeline.append({
+            'seconds': round(time.monotonic() - started, 3),
+            'rss_bytes': process_tree_rss(pid),
+            'completed': completed,
+            'errors': errors,
+            'in_flight': in_flight
+        })
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not values:
+        return None
+    index = max(0, min(len(values) - 1, int(round(fraction * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+def summarize(samples, elapsed):
+    latencies = sorted(sample['latency'] for sample in samples)
+    errors = sum(1 for sample in samples if sample['error'])
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': errors / len(samples) if samples else 0,
+        'throughput': len(samples) / elapsed if elapsed else None,
+        'p50_ms': _ms(percentile(latencies, 0.50)),
+        'p95_ms': _ms(percentile(latencies, 0.95)),
+        'p99_ms': _ms(percentile(latencies, 0.99)),
+        'max_ms': _ms(latencies[-1] if latencies else None),
+        'mean_bytes': sum(sample['bytes'] for sample in samples) / len(samples) if samples else 0
+    }
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rate', type=float, default=20, help='Requests per second')
+    parser.add_argument('--duration', type=float, default=30, help='Seconds of load')
+    parser.add_argument('--concurrency', type=int, default=64, help='Client threads')
+    parser.add_argument('--mix', default='performance=4,insights=3,geographic=2,csv=1')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds per upstream call in the fake')
+    parser.add_argument('--rows', type=int, default=5000, help='Rows per upstream query in the fake')
+    parser.add_argument('--cache', action='store_true', help='Enable the result cache')
+    parser.add_argument('--server', choices=('werkzeug', 'gunicorn'), default='werkzeug')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--sample-interval', type=float, default=1.0)
+    parser.add_argument('--json', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    server = start_server(args, args.port)
+
+    try:
+        generator = LoadGenerator(f'http://127.0.0.1:{args.port}', mix, args.concurrency)
+        timeline = [{'seconds': 0, 'rss_bytes': process_tree_rss(server.pid), 'completed': 0, 'errors': 0, 'in_flight': 0}]
+        stop = threading.Event()
+        sampler = threading.Thread(
+            target=sample_resources, args=(generator, server.pid, args.sample_interval, stop, timeline), daemon=True
+        )
+        sampler.start()
+
+        elapsed = generator.run(args.rate, args.duration, server)
+
+        stop.set()
+        sampler.join()
+
+        # Results against a dead server are just connection errors: report the crash instead
+        if server.poll() is not None:
+            raise SystemExit(server_exit_message(server))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+        server.stderr_file.close()
+
+    overall = summarize(generator.samples, elapsed)
+    routes = {route: summarize([s for s in generator.samples if s['route'] == route], elapsed) for route in mix}
+    rss = [point['rss_bytes'] for point in timeline if point['rss_bytes'] is not None]
+
+    print(f"{'route':<12} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, stats in list(routes.items()) + [('all', overall)]:
+        print(
+            f"{name:<12} {stats['requests']:>9} {stats['errors']:>7} {stats['throughput']:>8.1f} "
+            f"{stats['p50_ms'] or 0:>9.1f} {stats['p95_ms'] or 0:>9.1f} {stats['p99_ms'] or 0:>9.1f}"
+        )
+    if rss:
+        print(f"server RSS: start {rss[0] / 1e6:.1f} MB, peak {max(rss) / 1e6:.1f} MB, end {rss[-1] / 1e6:.1f} MB")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'benchmark': 'load',
+                'config': {key: value for key, value in vars(args).items() if key != 'json'},
+                'elapsed_seconds': elapsed,
+                'reinitializations': generator.reinitializations,
+                'overall': overall,
+                'routes': routes,
+                'timeline': timeline
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""gunicorn settings for the production serve mode (python run.py --serve).
+
+Every setting comes from the environment:
+  WEB_WORKERS             worker processes (default: CPU count)
+  WEB_THREADS             threads per worker (default: 8)
+  WEB_PRELOAD             import the app once in the master before forking (default: true)
+  WEB_TIMEOUT             seconds before a silent worker is killed and replaced (default: 120)
+  WEB_GRACEFUL_TIMEOUT    seconds workers get to finish in-flight requests on restart/shutdown (default: 30)
+  WEB_MAX_REQUESTS        recycle a worker after this many requests, 0 to never (default: 0)
+
+Send SIGHUP to the master to replace every worker gracefully, SIGTERM to
+drain and stop. With WEB_PRELOAD, new code is only picked up by a new
+master (SIGUSR2, then SIGTERM to the old one).
+"""
+import multiprocessing
+import os
+
+wsgi_app = 'src.app:app'
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', 5000)}"
+
+worker_class = 'gthread'
+workers = int(os.getenv('WEB_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.getenv('WEB_THREADS', 8))
+
+preload_app = os.getenv('WEB_PRELOAD', 'true').lower() == 'true'
+timeout = int(os.getenv('WEB_TIMEOUT', 120))
+graceful_timeout = int(os.getenv('WEB_GRACEFUL_TIMEOUT', 30))
+keepalive = 5
+max_requests = int(os.getenv('WEB_MAX_REQUESTS', 0))
+max_requests_jitter = max_requests // 10
+
+accesslog = '-'
+loglevel = os.getenv('LOG_LEVEL', 'info').lower()
+
+# Read by the app: rate limits are split between the workers
+os.environ['SERVE_WORKERS'] = str(workers)
+
+# Any worker can serve any session: clients are restored from credentials stored on disk
+os.environ.setdefault('ENABLE_CREDENTIAL_STORE', 'true')
+
+# A preloading master imports the heavy dependencies once for all workers
+if preload_app:
+    os.environ.setdefault('PRELOAD_DEPENDENCIES', 'true')
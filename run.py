@@ -1,24 +1,39 @@
+import argparse
 import os
 import sys
 
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Add the project root directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_DIR)
 
-from src.app import app
+def serve():
+    """Replace this process with a gunicorn master configured by gunicorn.conf.py."""
+    os.chdir(PROJECT_DIR)
+    os.execv(sys.executable, [sys.executable, '-m', 'gunicorn', '--config', os.path.join(PROJECT_DIR, 'gunicorn.conf.py')])
 
 def main():
     """Main function to run the application."""
+    parser = argparse.ArgumentParser(description='Google Ads analytics dashboard')
+    parser.add_argument('--serve', action='store_true', help='Run the production server (gunicorn, see gunicorn.conf.py)')
+    args = parser.parse_args()
+
     try:
+        if args.serve:
+            serve()
+
+        from src.app import app
+
         # Get port from environment or use default
         port = int(os.getenv('PORT', 5000))
-        
-        # Run the application
+
+        # Run the development server
         app.run(
             host='0.0.0.0',
             port=port,
-            debug=True
+            debug=os.getenv('FLASK_ENV', 'development') == 'development'
         )
-    
+
     except Exception as e:
         print(f"Error starting the application: {str(e)}")
         sys.exit(1)
@@ -0,0 +1,140 @@
+import enum
+
+# numpy and pandas are imported where they are used, so importing this module
+# (and the app) stays cheap until the first aggregation
+
+# Where each logical lead field lives in the ColumnarRows of each fetcher
+LEAD_INSIGHTS_FIELDS = {
+    'date': 'timing.date',
+    'type': 'lead_info.type',
+    'status': 'lead_info.status',
+    'category': 'lead_info.category',
+    'credit_state': 'lead_info.credit_state',
+    'cost': 'metrics.cost',
+    'conversions': 'metrics.conversions'
+}
+
+LEAD_STATISTICS_FIELDS = {
+    'date': 'creation_time',
+    'type': 'type',
+    'status': 'status',
+    'category': 'category',
+    'credit_state': 'credit_state',
+    'cost': 'cost',
+    'conversions': 'conversions'
+}
+
+
+def lead_metrics(leads, fields=LEAD_INSIGHTS_FIELDS):
+    """Compute lead totals, rates and status/type/category/credit-state breakdowns."""
+    total_leads = len(leads)
+    if not total_leads:
+        return {}
+
+    cost = _numeric(leads.column(fields['cost']))
+    conversions = _numeric(leads.column(fields['conversions']))
+
+    metrics = {
+        'total_leads': total_leads,
+        'total_cost': float(cost.sum()),
+        'total_conversions': float(conversions.sum()),
+        'lead_types': _counts(leads.column(fields['type'])),
+        'lead_status': _counts(leads.column(fields['status'])),
+        'categories': _counts(leads.column(fields['category'])),
+        'credit_states': _counts(leads.column(fields['credit_state']))
+    }
+    metrics['avg_cost_per_lead'] = metrics['total_cost'] / total_leads
+    metrics['conversion_rate'] = (metrics['total_conversions'] / total_leads) * 100
+
+    return metrics
+
+
+def lead_trend(leads, start_date, end_date, fields=LEAD_INSIGHTS_FIELDS):
+    """Count leads per day over start_date..end_date, including days without leads."""
+    import pandas as pd
+
+    dates = pd.date_range(start=start_date, end=end_date).strftime('%Y-%m-%d')
+
+    if len(leads):
+        lead_dates = pd.Series(leads.column(fields['date']), dtype='string').str.slice(0, 10)
+        counts = lead_dates.value_counts().reindex(dates, fill_value=0)
+    else:
+        counts = pd.Series(0, index=dates)
+
+    return {
+        'dates': list(dates),
+        'leads': [int(count) for count in counts.to_numpy()]
+    }
+
+
+def cost_by_category(leads, fields=LEAD_INSIGHTS_FIELDS):
+    """Sum lead cost per category, highest first (ties by label)."""
+    if not len(leads):
+        return {'categories': [], 'values': []}
+
+    import pandas as pd
+
+    costs = pd.Series(_numeric(leads.column(fields['cost'])))
+    categories = pd.Series(leads.column(fields['category']), dtype=object)
+    totals = _ranked((_label(category), float(value)) for category, value in costs.groupby(categories, sort=False).sum().items())
+
+    return {
+        'categories': [category for category, _ in totals],
+        'values': [value for _, value in totals]
+    }
+
+
+def dashboard_metrics(performance, leads, start_date, end_date, fields=LEAD_INSIGHTS_FIELDS):
+    """Compute every dashboard aggregate from columnar campaign performance and lead results."""
+    total_leads = len(leads)
+    total_cost = float(_numeric(leads.column(fields['cost'])).sum()) if total_leads else 0
+    impressions = float(_numeric(performance.column('metrics.impressions')).sum()) if len(performance) else 0
+
+    breakdowns = lead_metrics(leads, fields)
+
+    return {
+        'metrics': {
+            'total_leads': total_leads,
+            'total_cost': total_cost,
+            'conversion_rate': (total_leads / impressions * 100) if impressions > 0 else 0,
+            'avg_cost_per_lead': total_cost / total_leads if total_leads > 0 else 0
+        },
+        'breakdowns': {
+            'lead_types': breakdowns.get('lead_types', {}),
+            'lead_status': breakdowns.get('lead_status', {}),
+            'categories': breakdowns.get('categories', {}),
+            'credit_states': breakdowns.get('credit_states', {})
+        },
+        'trend_data': lead_trend(leads, start_date, end_date, fields),
+        'cost_distribution': cost_by_category(leads, fields)
+    }
+
+
+def _numeric(values):
+    """Convert a column to a float array, treating missing values as 0."""
+    import numpy as np
+
+    try:
+        return np.nan_to_num(np.asarray(values, dtype=np.float64))
+    except (TypeError, ValueError):
+        import pandas as pd
+        return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').fillna(0).to_numpy(dtype=np.float64)
+
+
+def _counts(values):
+    """Count occurrences of each value, keyed by a JSON-friendly label, most frequent first (ties by label)."""
+    import pandas as pd
+
+    counts = pd.Series(values, dtype=object).value_counts(sort=False)
+    return dict(_ranked((_label(key), int(count)) for key, count in counts.items()))
+
+
+def _ranked(totals):
+    """Order (label, total) pairs by total descending, then by label, so every path emits the same order."""
+    return sorted(totals, key=lambda item: (-item[1], str(item[0])))
+
+
+def _label(value):
+    if isinstance(value, enum.Enum):
+        return value.name
+    return value
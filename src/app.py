@@ -1,20 +1,429 @@
-from flask import Flask, render_template, jsonify, request, send_file, session
-from .google_ads_client import GoogleAdsClient
-import pandas as pd
-from datetime import datetime, timedelta
-import json
+from flask import Flask, Response, g, has_request_context, render_template, jsonify, request, session
+from flask.json.provider import DefaultJSONProvider
+from .aggregation import dashboard_metrics
+from .concurrency import QueryExecutor
+from .exporters import COLUMNAR_EXPORTS, columnar_chunks, csv_chunks, gzip_chunks, prime
+from .client_pool import ClientPool
+from .credential_store import CredentialStore
+from .google_ads_client import CAMPAIGN_PERFORMANCE_DIMENSIONS, LEAD_INSIGHTS_DIMENSIONS, LEAD_INSIGHTS_SCHEMA, GoogleAdsClient
+from .loaders import LeadConversationLoader
+from .pagination import keyset_page
+from .metrics import HTTP_PHASE_SECONDS, HTTP_RESPONSE_BYTES, HTTP_SECONDS, REGISTRY
+from .preload import preload
+from .profiling import ProfileStore, RequestProfile, parse_modes
+from .resilience import CircuitOpenError, UpstreamGuard
+from .responses import MIN_COMPRESS_BYTES, compress, negotiate_encoding, strong_etag
+from .responses import dumps as json_dumps, loads as json_loads
+from .result_cache import ResultCache
+from .rollups import RollupStore
+from .serialization import to_plain
+from .sync_engine import DayPartitionSync
+from contextlib import contextmanager
+import importlib.util
+import math
 import os
 import secrets
+import time
+import uuid
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by responses.dumps (orjson when installed) that records encoding time as the route's 'encode' phase.
+
+    Enums encode by name, timestamps as ISO 8601, ColumnarRows as a list
+    of records and NormalizedRows as their normalized payload (keys,
+    dimensions and rows).
+    """
+
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj, kwargs.get('sort_keys', self.sort_keys)).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return json_loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj, self.sort_keys), mimetype=self.mimetype)
+
+    def _encode(self, obj, sort_keys):
+        started = time.perf_counter()
+        try:
+            return json_dumps(obj, sort_keys=sort_keys, indent=self.compact is False or (self.compact is None and self._app.debug))
+        finally:
+            if has_request_context() and request.url_rule is not None:
+                HTTP_PHASE_SECONDS.observe(time.perf_counter() - started, route=route_name(), phase='encode')
+
+def create_credential_store():
+    """Create the credential store shared by worker processes from environment settings.
+
+    Off unless ENABLE_CREDENTIAL_STORE=true, which gunicorn.conf.py sets
+    by default: it keeps API secrets on disk.
+    """
+    if os.getenv('ENABLE_CREDENTIAL_STORE', 'false').lower() != 'true':
+        return None
+
+    return CredentialStore(
+        os.getenv('CREDENTIAL_STORE_PATH', os.path.join('cache', 'credentials.sqlite3')),
+        max_age=int(os.getenv('CREDENTIAL_MAX_AGE', 7 * 86400))
+    )
+
+credential_store = create_credential_store()
 
 app = Flask(__name__)
-app.secret_key = secrets.token_hex(16)
+# Without SECRET_KEY, workers share (and restarts keep) a key generated once in the credential store
+app.secret_key = os.getenv('SECRET_KEY') or (credential_store.secret('session') if credential_store else secrets.token_hex(16))
+app.json = TimedJSONProvider(app)
+
+def create_result_cache():
+    """Create the on-disk result cache from environment settings."""
+    if os.getenv('ENABLE_CACHE', 'true').lower() != 'true':
+        return None
+
+    return ResultCache(
+        os.getenv('CACHE_PATH', os.path.join('cache', 'results.sqlite3')),
+        max_bytes=int(os.getenv('CACHE_MAX_MB', 256)) * 1024 * 1024,
+        default_ttl=int(os.getenv('CACHE_TIMEOUT', 600)),
+        stale_ttl=int(os.getenv('CACHE_STALE_TIMEOUT', 3600))
+    )
+
+def create_partition_sync():
+    """Create the per-day partition store from environment settings."""
+    if os.getenv('ENABLE_SYNC', 'true').lower() != 'true':
+        return None
+
+    return DayPartitionSync(
+        os.getenv('SYNC_PATH', os.path.join('cache', 'partitions.sqlite3')),
+        settlement_days=int(os.getenv('SYNC_SETTLEMENT_DAYS', 3))
+    )
+
+def create_rollup_store():
+    """Create the pre-aggregated lead and campaign cubes from environment settings."""
+    if os.getenv('ENABLE_ROLLUPS', 'true').lower() != 'true':
+        return None
+
+    return RollupStore(
+        os.getenv('ROLLUP_PATH', os.path.join('cache', 'rollups.sqlite3')),
+        settlement_days=int(os.getenv('SYNC_SETTLEMENT_DAYS', 3))
+    )
+
+def create_upstream_guard():
+    """Create the rate limiter, retry policy and circuit breaker shared by all clients.
+
+    The rate limits are for the whole server: each of SERVE_WORKERS worker
+    processes (set by gunicorn.conf.py) enforces its share of them.
+    """
+    workers = max(1, int(os.getenv('SERVE_WORKERS', 1)))
+    return UpstreamGuard(
+        developer_rate=float(os.getenv('RATE_LIMIT_DEVELOPER_QPS', 10)) / workers,
+        developer_burst=max(1, int(os.getenv('RATE_LIMIT_DEVELOPER_BURST', 20)) // workers),
+        customer_rate=float(os.getenv('RATE_LIMIT_CUSTOMER_QPS', 2)) / workers,
+        customer_burst=max(1, int(os.getenv('RATE_LIMIT_CUSTOMER_BURST', 5)) // workers),
+        max_attempts=int(os.getenv('RETRY_MAX_ATTEMPTS', 4)),
+        base_delay=float(os.getenv('RETRY_BASE_DELAY', 1)),
+        max_delay=float(os.getenv('RETRY_MAX_DELAY', 30)),
+        breaker_threshold=int(os.getenv('BREAKER_THRESHOLD', 3)),
+        breaker_reset=float(os.getenv('BREAKER_RESET_TIMEOUT', 30))
+    )
+
+def throttled_response(error):
+    """503 with Retry-After for calls rejected while the API is throttling us."""
+    response = jsonify({'error': str(error)})
+    response.headers['Retry-After'] = str(math.ceil(error.retry_after))
+    return response, 503
+
+result_cache = create_result_cache()
+partition_sync = create_partition_sync()
+rollup_store = create_rollup_store()
+upstream_guard = create_upstream_guard()
+
+# One initialized client per tenant (credential set), sharing the cache, partition and rollup stores
+client_pool = ClientPool(
+    lambda tenant: GoogleAdsClient(
+        cache=result_cache, sync=partition_sync, tenant=tenant, guard=upstream_guard, rollups=rollup_store,
+        use_proto_plus=os.getenv('USE_PROTO_PLUS', 'true').lower() == 'true'
+    ),
+    idle_timeout=int(os.getenv('CLIENT_POOL_IDLE_TIMEOUT', 1800)),
+    max_clients=int(os.getenv('CLIENT_POOL_MAX_CLIENTS', 100)),
+    store=credential_store
+)
+
+def create_profile_store():
+    """Ring buffer for on-demand request profiles; None unless PROFILE_TOKEN is set."""
+    if not os.getenv('PROFILE_TOKEN'):
+        return None
+    return ProfileStore(
+        os.getenv('PROFILE_PATH', 'cache/profiles'),
+        max_profiles=int(os.getenv('PROFILE_MAX_PROFILES', 50))
+    )
+
+profile_store = create_profile_store()
+
+def profiling_authorized():
+    """Whether the request carries the profiling token (X-Profile-Token header or profile_token query parameter)."""
+    if profile_store is None:
+        return False
+    token = request.headers.get('X-Profile-Token') or request.args.get('profile_token') or ''
+    # Compared as bytes: compare_digest rejects non-ASCII str operands with a TypeError
+    return secrets.compare_digest(token.encode('utf-8'), os.getenv('PROFILE_TOKEN').encode('utf-8'))
+
+def current_client():
+    """Return the pooled GoogleAdsClient for this session's tenant, or None."""
+    tenant = session.get('tenant')
+    if tenant is None:
+        return None
+    return client_pool.get(tenant)
+
+def conversation_loader(google_ads_client, customer_id):
+    """The current request's LeadConversationLoader for customer_id, so repeated lookups share its memo."""
+    loaders = g.setdefault('conversation_loaders', {})
+    if customer_id not in loaders:
+        loaders[customer_id] = LeadConversationLoader(
+            google_ads_client, customer_id, chunk_size=LEAD_CONVERSATIONS_CHUNK_SIZE
+        )
+    return loaders[customer_id]
+
+# Lead listing: page size limits, sortable fields and filter parameters (query parameter -> field)
+LEADS_PAGE_SIZE = int(os.getenv('LEADS_PAGE_SIZE', 100))
+LEADS_MAX_PAGE_SIZE = int(os.getenv('LEADS_MAX_PAGE_SIZE', 1000))
+LEAD_SORT_FIELDS = ('creation_time', 'lead_type', 'lead_status', 'category_id')
+LEAD_FILTERS = {'type': 'lead_type', 'status': 'lead_status', 'category': 'category_id'}
+
+# Leads per batched conversation query
+LEAD_CONVERSATIONS_CHUNK_SIZE = int(os.getenv('LEAD_CONVERSATIONS_CHUNK_SIZE', 500))
+
+# Shared pool for running a route's independent upstream queries in parallel
+query_executor = QueryExecutor(
+    max_workers=int(os.getenv('QUERY_WORKERS', 8)),
+    default_timeout=int(os.getenv('QUERY_TIMEOUT', 60))
+)
+
+# Fetchers available to the portfolio endpoint, and whether they take a date range
+PORTFOLIO_FETCHERS = {
+    'campaign_performance': True,
+    'lead_insights': True,
+    'geographic_performance': True,
+    'competitor_insights': False,
+    'campaign_data': False,
+    'verification_artifacts': False
+}
+PORTFOLIO_MAX_CONCURRENCY = int(os.getenv('PORTFOLIO_MAX_CONCURRENCY', 4))
+
+# Rows per chunk when streaming exports
+EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', 1000))
+
+# Columnar export formats: file extension and mimetype
+COLUMNAR_EXPORT_FORMATS = {
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'arrow': ('arrows', 'application/vnd.apache.arrow.stream')
+}
+
+# Scraped by Prometheus alongside the per-request and per-fetch metrics
+REGISTRY.callback('google_ads_client_pool_clients', 'Clients in the per-tenant pool.', client_pool.size)
+REGISTRY.callback(
+    'google_ads_client_pool_lookups_total', 'Client pool lookups by result (restores are misses served from the credential store).',
+    lambda: {('hit',): client_pool.stats['hits'], ('miss',): client_pool.stats['misses'], ('restore',): client_pool.stats['restores']},
+    'counter', ('result',)
+)
+REGISTRY.callback(
+    'google_ads_upstream_events_total', 'Upstream guard events: calls, retries, throttled, rejected, breaker_trips, paced.',
+    lambda: {(event,): upstream_guard.stats[event] for event in ('calls', 'retries', 'throttled', 'rejected', 'breaker_trips', 'paced')},
+    'counter', ('event',)
+)
+if result_cache is not None:
+    REGISTRY.callback('google_ads_result_cache_bytes', 'Size of the on-disk result cache.', result_cache.size)
+
+def route_name():
+    """The matched URL rule, so metrics are labelled per route rather than per URL."""
+    return request.url_rule.rule if request.url_rule else 'unmatched'
+
+@contextmanager
+def phase(name):
+    """Record the time spent in a phase of the current request."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        HTTP_PHASE_SECONDS.observe(time.perf_counter() - started, route=route_name(), phase=name)
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.before_request
+def start_profile():
+    # Opt-in: X-Profile: cpu|memory|cpu,memory (or ?profile=...) with a valid token
+    modes = parse_modes(request.headers.get('X-Profile') or request.args.get('profile'))
+    if not modes or not profiling_authorized():
+        return
 
-# Initialize without credentials
-google_ads_client = GoogleAdsClient()
+    g.profile = RequestProfile(
+        uuid.uuid4().hex, modes,
+        sample_interval=float(os.getenv('PROFILE_SAMPLE_INTERVAL', 0.005)),
+        memory_frames=int(os.getenv('PROFILE_MEMORY_FRAMES', 10))
+    )
+    g.profile.start()
+
+@app.after_request
+def finish_profile(response):
+    profile = g.pop('profile', None)
+    if profile is None:
+        return response
+
+    details = {'method': request.method, 'path': request.path, 'route': route_name(), 'status': response.status_code}
+
+    def save():
+        # After the last chunk, so streamed exports are profiled end to end
+        report = profile.finish()
+        report.update(details)
+        profile_store.save(report)
+
+    response.headers['X-Profile-Id'] = profile.request_id
+    response.call_on_close(save)
+    return response
+
+@app.after_request
+def record_request_metrics(response):
+    route = route_name()
+    started = g.get('request_started', time.perf_counter())
+    labels = {'route': route, 'method': request.method, 'status': response.status_code}
+
+    if not response.is_streamed:
+        HTTP_SECONDS.observe(time.perf_counter() - started, **labels)
+        HTTP_RESPONSE_BYTES.observe(response.content_length or 0, route=route)
+        return response
+
+    # Streamed bodies are measured once the last chunk has gone out
+    sent = [0]
+
+    def counted(chunks):
+        for chunk in chunks:
+            sent[0] += len(chunk)
+            yield chunk
+
+    def record():
+        HTTP_SECONDS.observe(time.perf_counter() - started, **labels)
+        HTTP_RESPONSE_BYTES.observe(sent[0], route=route)
+
+    response.response = counted(response.response)
+    response.call_on_close(record)
+    return response
+
+# Heavy dependencies load on first use; a pre-fork server (gunicorn --preload)
+# loads them once in the master instead, with PRELOAD_DEPENDENCIES=true
+if os.getenv('PRELOAD_DEPENDENCIES', 'false').lower() == 'true':
+    preload()
+
+# Compress JSON API responses for clients that accept gzip (or brotli, when installed)
+RESPONSE_COMPRESSION = os.getenv('RESPONSE_COMPRESSION', 'true').lower() == 'true'
+
+@app.after_request
+def finalize_api_response(response):
+    # Registered last so it runs first: metrics see the bytes actually sent
+    if (not request.path.startswith('/api/') or response.status_code != 200 or response.is_streamed
+            or response.direct_passthrough or response.mimetype != 'application/json'):
+        return response
+
+    body = response.get_data()
+    encoding = negotiate_encoding(request.headers.get('Accept-Encoding')) if RESPONSE_COMPRESSION else None
+    if len(body) < MIN_COMPRESS_BYTES:
+        encoding = None
+
+    response.vary.add('Accept-Encoding')
+    if request.method in ('GET', 'HEAD'):
+        # Data routes tag the data version (versioned_response); anything else gets a strong
+        # validator of the representation, where a different content coding is a different tag
+        if response.get_etag()[0] is None:
+            etag = strong_etag(body)
+            response.set_etag(f"{etag}-{encoding}" if encoding else etag)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.make_conditional(request)
+        if response.status_code == 304:
+            return response
+
+    if encoding:
+        with phase('compress'):
+            response.set_data(compress(body, encoding))
+        response.headers['Content-Encoding'] = encoding
+
+    return response
+
+def request_params():
+    """A data route's parameters: the JSON body of a POST, or the query string of a GET.
+
+    In a query string, fields is comma-separated and normalized is 'true' or '1'.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return request.json or {}
+
+    params = request.args.to_dict()
+    if params.get('fields'):
+        params['fields'] = params['fields'].split(',')
+    params['normalized'] = params.get('normalized', '').lower() in ('true', '1')
+    return params
+
+def versioned_response(version, build):
+    """Answer a GET of cached data, revalidated against the version of the data rather than the rendered body.
+
+    version() returns the data's version without fetching it (None unless
+    it is cached and fresh; see GoogleAdsClient.data_version). When the
+    request's If-None-Match already names it, the answer is a 304 with no
+    fetch and no serialization. Otherwise build() renders the response,
+    which gets a weak ETag (the same across content codings) for the
+    version served. POSTs are just built.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return build()
+
+    def etag(data_version):
+        return None if data_version is None else strong_etag(f"{request.full_path}|{data_version}".encode('utf-8'))
+
+    tag = etag(version())
+    if tag is not None and request.if_none_match.contains_weak(tag):
+        response = app.response_class(status=304)
+    else:
+        response = app.make_response(build())
+        if response.status_code != 200:
+            return response
+        # Not cached before this request: tag the entry the fetch just stored
+        tag = tag or etag(version())
+        if tag is None:
+            return response
+
+    response.set_etag(tag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.vary.add('Accept-Encoding')
+    return response
 
 # Serve static files from the static directory
 app.static_folder = 'static'
 
+@app.route('/metrics')
+def prometheus_metrics():
+    return Response(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/api/profiles')
+def list_profiles():
+    if profile_store is None:
+        return jsonify({'error': 'Not found'}), 404
+    if not profiling_authorized():
+        return jsonify({'error': 'Invalid profiling token'}), 403
+    return jsonify(profile_store.list())
+
+@app.route('/api/profiles/<request_id>')
+def get_profile(request_id):
+    if profile_store is None:
+        return jsonify({'error': 'Not found'}), 404
+    if not profiling_authorized():
+        return jsonify({'error': 'Invalid profiling token'}), 403
+
+    report = profile_store.get(request_id)
+    if report is None:
+        return jsonify({'error': f'No profile for request {request_id}'}), 404
+
+    # Collapsed stacks as plain text, for flamegraph.pl or speedscope
+    if request.args.get('format') == 'collapsed':
+        return Response(report.get('collapsed', ''), content_type='text/plain; charset=utf-8')
+    return jsonify(report)
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -23,119 +432,280 @@ def index():
 def initialize_client():
     try:
         credentials = request.json
-        success = google_ads_client.initialize_client(credentials)
-        return jsonify({'success': success})
+        tenant = client_pool.register(credentials)
+        if tenant is not None:
+            session['tenant'] = tenant
+        return jsonify({'success': tenant is not None})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
 @app.route('/api/check-status', methods=['GET'])
 def check_status():
-    return jsonify({'initialized': google_ads_client.is_initialized()})
+    google_ads_client = current_client()
+    return jsonify({
+        'initialized': google_ads_client is not None,
+        'coalescing': google_ads_client.single_flight.stats if google_ads_client else None,
+        'pool': dict(client_pool.stats, clients=client_pool.size(), hit_rate=client_pool.hit_rate()),
+        'upstream': upstream_guard.stats
+    })
 
-@app.route('/api/campaigns/performance', methods=['POST'])
+@app.route('/api/campaigns/performance', methods=['GET', 'POST'])
 def campaign_performance():
-    if not google_ads_client.is_initialized():
+    google_ads_client = current_client()
+    if google_ads_client is None:
         return jsonify({'error': 'Client not initialized'}), 400
         
     try:
-        data = request.json
+        data = request_params()
         customer_id = data.get('customer_id')
         start_date = data.get('start_date')
         end_date = data.get('end_date')
+        normalized = bool(data.get('normalized'))
+
+        def version():
+            performance = google_ads_client.data_version('campaign_performance', customer_id, start_date, end_date)
+            leads = google_ads_client.data_version('lead_insights', customer_id, start_date, end_date)
+            return f"{performance}|{leads}" if performance and leads else None
+
+        def build():
+            # Get campaign performance and lead data for the period concurrently
+            with phase('fetch'):
+                results = query_executor.run_parallel({
+                    'performance': lambda: google_ads_client.get_campaign_performance(
+                        customer_id, start_date, end_date, as_columns=True
+                    ),
+                    'leads': lambda: google_ads_client.get_lead_insights(
+                        customer_id, start_date, end_date, as_columns=True
+                    )
+                })
+            performance_data = results['performance']
+            lead_data = results['leads']
+            
+            if not len(performance_data) or not len(lead_data):
+                return jsonify({'error': 'No data available'}), 404
+                
+            # Metrics, trend, cost distribution and breakdowns in vectorized passes
+            with phase('aggregation'):
+                dashboard = dashboard_metrics(performance_data, lead_data, start_date, end_date)
+            
+            if normalized:
+                # Campaign attributes and customer settings go out once instead of on every row
+                performance_data = performance_data.normalize(CAMPAIGN_PERFORMANCE_DIMENSIONS)
+                lead_data = lead_data.normalize(LEAD_INSIGHTS_DIMENSIONS)
+
+            return jsonify({
+                'performance': performance_data,
+                'leads': lead_data,
+                **dashboard
+            })
+
+        return versioned_response(version, build)
         
-        # Get campaign performance data
-        performance_data = google_ads_client.get_campaign_performance(
-            customer_id, start_date, end_date
+    except TimeoutError as e:
+        return jsonify({'error': str(e)}), 504
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except CircuitOpenError as e:
+        return throttled_response(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/dashboard')
+def dashboard():
+    google_ads_client = current_client()
+    if google_ads_client is None:
+        return jsonify({'error': 'Client not initialized'}), 400
+
+    try:
+        return jsonify(google_ads_client.get_dashboard(
+            request.args.get('customer_id'), request.args.get('start_date'), request.args.get('end_date')
+        ))
+    except CircuitOpenError as e:
+        return throttled_response(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/trends')
+def trends():
+    google_ads_client = current_client()
+    if google_ads_client is None:
+        return jsonify({'error': 'Client not initialized'}), 400
+
+    charged = request.args.get('charged')
+    filters = {
+        'category_id': request.args.get('category'),
+        'lead_type': request.args.get('type'),
+        'lead_status': request.args.get('status'),
+        'charged': None if charged is None else charged.lower() in ('1', 'true')
+    }
+
+    try:
+        return jsonify(google_ads_client.get_lead_trend(
+            request.args.get('customer_id'), request.args.get('start_date'), request.args.get('end_date'),
+            request.args.get('granularity', 'day'), **filters
+        ))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except CircuitOpenError as e:
+        return throttled_response(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/leads')
+def list_leads():
+    google_ads_client = current_client()
+    if google_ads_client is None:
+        return jsonify({'error': 'Client not initialized'}), 400
+
+    customer_id = request.args.get('customer_id')
+    sort = request.args.get('sort', 'creation_time')
+    if sort not in LEAD_SORT_FIELDS:
+        return jsonify({'error': f"sort must be one of {', '.join(LEAD_SORT_FIELDS)}"}), 400
+
+    try:
+        limit = max(1, min(int(request.args.get('limit', LEADS_PAGE_SIZE)), LEADS_MAX_PAGE_SIZE))
+        filters = {
+            field: set(request.args[param].split(','))
+            for param, field in LEAD_FILTERS.items() if request.args.get(param)
+        }
+
+        # Pages are cut from the (cached) result set for the whole range
+        leads = google_ads_client.get_detailed_lead_data(
+            customer_id, 'custom', request.args.get('start_date'), request.args.get('end_date'), as_columns=True
         )
-        
-        # Get lead data for the period
-        lead_data = google_ads_client.get_lead_insights(
-            customer_id, start_date, end_date
+        page, next_cursor, total = keyset_page(
+            leads, sort, 'id', limit,
+            cursor=request.args.get('cursor'),
+            descending=request.args.get('order', 'desc') != 'asc',
+            filters=filters
         )
-        
-        if not performance_data or not lead_data:
-            return jsonify({'error': 'No data available'}), 404
-            
-        # Calculate metrics
-        total_leads = len(lead_data['leads'])
-        total_cost = sum(lead['cost'] for lead in lead_data['leads']) if lead_data['leads'] else 0
-        conversion_rate = (total_leads / performance_data['impressions'] * 100) if performance_data.get('impressions', 0) > 0 else 0
-        avg_cost_per_lead = total_cost / total_leads if total_leads > 0 else 0
-        
-        # Prepare trend data
-        dates = pd.date_range(start=start_date, end=end_date)
-        leads_by_date = {date.strftime('%Y-%m-%d'): 0 for date in dates}
-        for lead in lead_data['leads']:
-            date = datetime.strptime(lead['creation_time'][:10], '%Y-%m-%d').strftime('%Y-%m-%d')
-            leads_by_date[date] += 1
-        
-        # Prepare cost distribution data
-        cost_by_category = {}
-        for lead in lead_data['leads']:
-            category = lead['category']
-            cost_by_category[category] = cost_by_category.get(category, 0) + lead['cost']
-        
-        return jsonify({
-            'performance': performance_data,
-            'leads': lead_data,
-            'metrics': {
-                'total_leads': total_leads,
-                'total_cost': total_cost,
-                'conversion_rate': conversion_rate,
-                'avg_cost_per_lead': avg_cost_per_lead
-            },
-            'trend_data': {
-                'dates': list(leads_by_date.keys()),
-                'leads': list(leads_by_date.values())
-            },
-            'cost_distribution': {
-                'categories': list(cost_by_category.keys()),
-                'values': list(cost_by_category.values())
-            }
-        })
-        
+        return jsonify({'leads': page, 'next_cursor': next_cursor, 'total': total})
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except CircuitOpenError as e:
+        return throttled_response(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/leads/insights', methods=['POST'])
+@app.route('/api/leads/insights', methods=['GET', 'POST'])
 def lead_insights():
-    if not google_ads_client.is_initialized():
+    google_ads_client = current_client()
+    if google_ads_client is None:
         return jsonify({'error': 'Client not initialized'}), 400
         
     try:
-        data = request.json
+        data = request_params()
         customer_id = data.get('customer_id')
         start_date = data.get('start_date')
         end_date = data.get('end_date')
-        
-        insights = google_ads_client.get_lead_insights(
-            customer_id, start_date, end_date
+        fields = data.get('fields')
+
+        def build():
+            insights = google_ads_client.get_lead_insights(
+                customer_id, start_date, end_date, as_columns=True, fields=fields, normalized=bool(data.get('normalized'))
+            )
+            return jsonify(insights)
+
+        return versioned_response(
+            lambda: google_ads_client.data_version('lead_insights', customer_id, start_date, end_date, fields), build
         )
-        return jsonify(insights)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except CircuitOpenError as e:
+        return throttled_response(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/campaigns/geographic', methods=['POST'])
+@app.route('/api/campaigns/geographic', methods=['GET', 'POST'])
 def geographic_performance():
-    if not google_ads_client.is_initialized():
+    google_ads_client = current_client()
+    if google_ads_client is None:
         return jsonify({'error': 'Client not initialized'}), 400
         
     try:
-        data = request.json
+        data = request_params()
         customer_id = data.get('customer_id')
         start_date = data.get('start_date')
         end_date = data.get('end_date')
-        
-        geo_data = google_ads_client.get_geographic_performance(
-            customer_id, start_date, end_date
+        fields = data.get('fields')
+
+        def build():
+            geo_data = google_ads_client.get_geographic_performance(
+                customer_id, start_date, end_date, as_columns=True, fields=fields, normalized=bool(data.get('normalized'))
+            )
+            return jsonify(geo_data)
+
+        return versioned_response(
+            lambda: google_ads_client.data_version('geographic_performance', customer_id, start_date, end_date, fields), build
         )
-        return jsonify(geo_data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except CircuitOpenError as e:
+        return throttled_response(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/portfolio/<fetcher>', methods=['POST'])
+def portfolio(fetcher):
+    google_ads_client = current_client()
+    if google_ads_client is None:
+        return jsonify({'error': 'Client not initialized'}), 400
+
+    if fetcher not in PORTFOLIO_FETCHERS:
+        return jsonify({'error': f'Unknown fetcher: {fetcher}'}), 404
+
+    data = request.json or {}
+    customer_ids = data.get('customer_ids') or []
+    if not customer_ids:
+        return jsonify({'error': 'customer_ids is required'}), 400
+
+    max_concurrency = data.get('max_concurrency', PORTFOLIO_MAX_CONCURRENCY)
+    try:
+        if isinstance(max_concurrency, (bool, float)):
+            raise ValueError(max_concurrency)
+        max_concurrency = int(max_concurrency)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'max_concurrency must be an integer'}), 400
+    max_concurrency = max(1, min(max_concurrency, PORTFOLIO_MAX_CONCURRENCY))
+    kwargs = {}
+    if PORTFOLIO_FETCHERS[fetcher]:
+        kwargs = {'start_date': data.get('start_date'), 'end_date': data.get('end_date')}
+
+    def generate():
+        # One JSON line per customer as it completes, then the portfolio totals
+        summaries = []
+        for item in google_ads_client.batch_fetch(fetcher, customer_ids, max_concurrency, **kwargs):
+            summaries.append({key: value for key, value in item.items() if key != 'result'})
+            yield json_dumps(to_plain(item)) + b'\n'
+
+        yield json_dumps({'portfolio': google_ads_client.summarize_portfolio(summaries)}) + b'\n'
+
+    return Response(generate(), mimetype='application/x-ndjson')
+
+@app.route('/api/leads/conversations', methods=['POST'])
+def lead_conversations():
+    google_ads_client = current_client()
+    if google_ads_client is None:
+        return jsonify({'error': 'Client not initialized'}), 400
+
+    data = request.json or {}
+    customer_id = data.get('customer_id')
+    lead_ids = data.get('lead_ids') or []
+    if not lead_ids:
+        return jsonify({'error': 'lead_ids is required'}), 400
+
+    try:
+        conversations = conversation_loader(google_ads_client, customer_id).load_many(lead_ids)
+        return jsonify(to_plain(conversations))
+    except CircuitOpenError as e:
+        return throttled_response(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/campaigns/competitor-insights', methods=['POST'])
 def competitor_insights():
-    if not google_ads_client.is_initialized():
+    google_ads_client = current_client()
+    if google_ads_client is None:
         return jsonify({'error': 'Client not initialized'}), 400
         
     try:
@@ -148,12 +718,15 @@ def competitor_insights():
             customer_id, start_date, end_date
         )
         return jsonify(competitor_data)
+    except CircuitOpenError as e:
+        return throttled_response(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/leads/<lead_id>', methods=['GET'])
 def get_lead_details(lead_id):
-    if not google_ads_client.is_initialized():
+    google_ads_client = current_client()
+    if google_ads_client is None:
         return jsonify({'error': 'Client not initialized'}), 400
         
     customer_id = request.args.get('customer_id')
@@ -161,45 +734,89 @@ def get_lead_details(lead_id):
     try:
         lead_details = google_ads_client.get_lead_details(customer_id, lead_id)
         return jsonify(lead_details)
+    except CircuitOpenError as e:
+        return throttled_response(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/export/csv')
 def export_csv():
-    if not google_ads_client.is_initialized():
+    google_ads_client = current_client()
+    if google_ads_client is None:
         return jsonify({'error': 'Client not initialized'}), 400
         
     customer_id = request.args.get('customer_id')
     start_date = request.args.get('start_date')
     end_date = request.args.get('end_date')
     
+    compress = request.args.get('compress') == 'gzip'
+    fields = [field for field in request.args.get('fields', '').split(',') if field]
+    
     try:
-        # Get lead data
-        lead_data = google_ads_client.get_lead_insights(
-            customer_id, start_date, end_date
-        )
+        schema = LEAD_INSIGHTS_SCHEMA.project(fields)
         
-        # Convert to DataFrame
-        df = pd.DataFrame(lead_data['leads'])
+        # Stream lead rows in batches straight into CSV chunks
+        batches = prime(google_ads_client.stream_lead_insights(
+            customer_id, start_date, end_date, batch_size=EXPORT_BATCH_SIZE, fields=schema.fields
+        ))
+        chunks = csv_chunks(batches, schema.fields)
         
-        # Create temporary file
-        temp_file = 'temp_export.csv'
-        df.to_csv(temp_file, index=False)
+        filename = f'leads_export_{start_date}_to_{end_date}.csv'
+        mimetype = 'text/csv'
+        if compress:
+            chunks = gzip_chunks(chunks)
+            filename += '.gz'
+            mimetype = 'application/gzip'
         
-        # Send file and remove it after
-        return_data = send_file(
-            temp_file,
-            mimetype='text/csv',
-            as_attachment=True,
-            download_name=f'leads_export_{start_date}_to_{end_date}.csv'
+        return Response(
+            chunks,
+            mimetype=mimetype,
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
         )
         
-        @return_data.call_on_close
-        def cleanup():
-            os.remove(temp_file)
-            
-        return return_data
-        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except CircuitOpenError as e:
+        return throttled_response(e)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/export/<fmt>')
+def export_columnar(fmt):
+    if fmt not in COLUMNAR_EXPORT_FORMATS:
+        return jsonify({'error': f'Unsupported export format: {fmt}'}), 404
+
+    google_ads_client = current_client()
+    if google_ads_client is None:
+        return jsonify({'error': 'Client not initialized'}), 400
+
+    customer_id = request.args.get('customer_id')
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    resource = request.args.get('resource', 'lead_insights')
+
+    if resource not in COLUMNAR_EXPORTS:
+        return jsonify({'error': f'Unsupported export resource: {resource}'}), 400
+
+    if importlib.util.find_spec('pyarrow') is None:
+        return jsonify({'error': f'{fmt} export requires pyarrow'}), 501
+
+    try:
+        # One row group (or record batch) per batch of rows streamed from the API
+        stream = getattr(google_ads_client, f'stream_{resource}')
+        batches = prime(stream(customer_id, start_date, end_date, batch_size=EXPORT_BATCH_SIZE))
+        extension, mimetype = COLUMNAR_EXPORT_FORMATS[fmt]
+
+        return Response(
+            columnar_chunks(batches, resource, fmt),
+            mimetype=mimetype,
+            headers={
+                'Content-Disposition': f'attachment; filename={resource}_{start_date}_to_{end_date}.{extension}'
+            }
+        )
+
+    except CircuitOpenError as e:
+        return throttled_response(e)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
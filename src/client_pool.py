@@ -0,0 +1,131 @@
+import hashlib
+import threading
+import time
+
+
+class ClientPool:
+    """Thread-safe pool of initialized GoogleAdsClient instances, one per tenant.
+
+    A tenant is identified by a hash of its credentials, so users sharing
+    credentials share one client (and its service stubs and gRPC channel)
+    while different credentials never replace each other. Clients unused
+    for idle_timeout seconds are evicted, as are the least recently used
+    ones once more than max_clients are pooled.
+
+    With a CredentialStore, registered credentials are persisted, and a
+    tenant missing from the pool (registered with another worker process,
+    or evicted) gets a client restored from the store on lookup.
+    """
+
+    def __init__(self, factory, idle_timeout=1800, max_clients=100, store=None):
+        """factory(tenant) must return a new, uninitialized GoogleAdsClient."""
+        self.factory = factory
+        self.idle_timeout = idle_timeout
+        self.max_clients = max_clients
+        self.store = store
+        self.stats = {'hits': 0, 'misses': 0, 'restores': 0, 'evictions': 0}
+
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._last_used = {}
+
+    @staticmethod
+    def tenant_key(credentials):
+        """Derive a stable tenant key from the identifying parts of a credentials dict."""
+        parts = [
+            str(credentials.get(name) or '')
+            for name in ('developer_token', 'client_id', 'client_secret', 'refresh_token', 'login_customer_id')
+        ]
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()[:32]
+
+    def register(self, credentials):
+        """Return the tenant key for credentials, creating and initializing a client if needed.
+
+        A pooled (or restored) client whose credentials differ from these
+        is replaced by one built from them. Returns None when a new client
+        fails to initialize.
+        """
+        tenant = self.tenant_key(credentials)
+        client = self.get(tenant)
+        if client is not None and client.credentials == credentials:
+            return tenant
+
+        if self._add(tenant, credentials, replace=client is not None) is None:
+            return None
+
+        if self.store is not None:
+            self.store.save(tenant, credentials)
+        return tenant
+
+    def get(self, tenant):
+        """Return the pooled client for a tenant, or None when it is unknown or was evicted.
+
+        With a store, an unpooled tenant's client is restored from its stored credentials.
+        """
+        with self._lock:
+            self._evict()
+            client = self._clients.get(tenant)
+            if client is not None:
+                self.stats['hits'] += 1
+                self._last_used[tenant] = time.monotonic()
+                return client
+            self.stats['misses'] += 1
+
+        credentials = self.store.load(tenant) if self.store is not None and tenant else None
+        if credentials is None:
+            return None
+
+        client = self._add(tenant, credentials)
+        if client is not None:
+            self.stats['restores'] += 1
+        return client
+
+    def remove(self, tenant):
+        """Drop a tenant's client from the pool (and its stored credentials)."""
+        with self._lock:
+            self._clients.pop(tenant, None)
+            self._last_used.pop(tenant, None)
+
+        if self.store is not None:
+            self.store.remove(tenant)
+
+    def size(self):
+        """Number of pooled clients."""
+        with self._lock:
+            return len(self._clients)
+
+    def hit_rate(self):
+        """Fraction of lookups that found a pooled client."""
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    def _add(self, tenant, credentials, replace=False):
+        """Initialize and pool a client for tenant; returns the pooled client, or None when it fails to initialize.
+
+        Unless replace is set, a client pooled for tenant meanwhile is kept.
+        """
+        client = self.factory(tenant)
+        if not client.initialize_client(credentials):
+            return None
+
+        with self._lock:
+            if replace:
+                self._clients[tenant] = client
+            else:
+                client = self._clients.setdefault(tenant, client)
+            self._last_used[tenant] = time.monotonic()
+            self._evict()
+            return client
+
+    def _evict(self):
+        """Drop idle clients, then the least recently used ones over max_clients. Caller holds the lock."""
+        now = time.monotonic()
+        by_age = sorted(self._last_used, key=self._last_used.get)
+
+        for tenant in by_age:
+            idle = now - self._last_used[tenant] > self.idle_timeout
+            if not idle and len(self._clients) <= self.max_clients:
+                break
+            del self._clients[tenant]
+            del self._last_used[tenant]
+            self.stats['evictions'] += 1
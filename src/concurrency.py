@@ -0,0 +1,111 @@
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+
+from .profiling import bind
+
+
+class QueryExecutor:
+    """Run independent GoogleAdsClient calls in parallel on a shared thread pool.
+
+    Route latency becomes the slowest of the upstream calls instead of
+    their sum. Calls that have not started when another call fails or
+    times out are cancelled; calls already running finish in the
+    background and their results are discarded.
+    """
+
+    def __init__(self, max_workers=8, default_timeout=60):
+        """Create the thread pool used for upstream queries."""
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ads-query')
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedule a single call and return its Future."""
+        return self._pool.submit(bind(fn), *args, **kwargs)
+
+    def run_parallel(self, calls, timeout=None, timeouts=None):
+        """Run named zero-argument callables concurrently and return {name: result}.
+
+        timeout applies to every call unless overridden by name in
+        timeouts. Raises TimeoutError as soon as a call misses its
+        deadline, or re-raises the exception of the first call to fail,
+        without waiting for the calls still running.
+        """
+        timeouts = timeouts or {}
+        started = time.monotonic()
+        futures = {name: self._pool.submit(bind(call)) for name, call in calls.items()}
+        limits = {name: timeouts.get(name, timeout or self.default_timeout) for name in futures}
+
+        try:
+            pending = set(futures.values())
+            while pending:
+                deadline = min(started + limits[name] for name, future in futures.items() if future in pending)
+                done, pending = wait(pending, timeout=max(0, deadline - time.monotonic()), return_when=FIRST_EXCEPTION)
+
+                for future in futures.values():
+                    if future in done and future.exception() is not None:
+                        raise future.exception()
+
+                now = time.monotonic()
+                for name, future in futures.items():
+                    if future in pending and started + limits[name] <= now:
+                        raise TimeoutError(f"Query '{name}' timed out after {limits[name]} seconds")
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+        return {name: future.result() for name, future in futures.items()}
+
+    def shutdown(self, wait=True):
+        """Stop accepting work and optionally wait for running calls."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class SingleFlight:
+    """Collapse concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the call; callers arriving while it is
+    in flight wait for it and get the same result or exception. Nothing
+    is remembered once the call finishes.
+    """
+
+    def __init__(self, on_coalesced=None):
+        """on_coalesced(key), when given, is called for every caller that joins an in-flight call."""
+        self.on_coalesced = on_coalesced
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.stats = {'calls': 0, 'coalesced': 0}
+
+    def do(self, key, fn):
+        """Return fn(), sharing one execution with concurrent callers using the same key."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+                self.stats['calls'] += 1
+            else:
+                self.stats['coalesced'] += 1
+
+        if not leader:
+            if self.on_coalesced is not None:
+                self.on_coalesced(key)
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def in_flight(self):
+        """Number of distinct calls currently running."""
+        with self._lock:
+            return len(self._in_flight)
@@ -1,6 +1,5 @@
 import os
 import yaml
-from flask import session
 
 class ConfigManager:
     def __init__(self, config_dir):
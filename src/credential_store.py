@@ -0,0 +1,75 @@
+import json
+import os
+import secrets
+import threading
+import time
+
+from .storage import connect
+
+
+class CredentialStore:
+    """SQLite store of tenant credentials shared by all worker processes.
+
+    A tenant registered with one worker can be served by any other: a
+    worker that has no pooled client for it restores one from here. Entries
+    unused for max_age seconds are dropped. The database holds secrets in
+    the clear, so it is created readable by its owner only.
+    """
+
+    def __init__(self, path, max_age=7 * 86400):
+        """Open (or create) the credential store at path."""
+        self.path = path
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+
+        # Create the file owner-only before SQLite opens it
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+
+        self._conn = connect(path)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS tenants (
+                tenant TEXT PRIMARY KEY,
+                credentials TEXT NOT NULL,
+                used_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS secrets (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def save(self, tenant, credentials):
+        """Store (or replace) a tenant's credentials."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tenants VALUES (?, ?, ?)", (tenant, json.dumps(credentials), time.time())
+            )
+            self._conn.commit()
+
+    def load(self, tenant):
+        """Return a tenant's credentials, or None when unknown or expired."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("DELETE FROM tenants WHERE used_at < ?", (now - self.max_age,))
+            entry = self._conn.execute("SELECT credentials FROM tenants WHERE tenant = ?", (tenant,)).fetchone()
+            if entry is not None:
+                self._conn.execute("UPDATE tenants SET used_at = ? WHERE tenant = ?", (now, tenant))
+            self._conn.commit()
+
+        return json.loads(entry[0]) if entry is not None else None
+
+    def remove(self, tenant):
+        """Forget a tenant's credentials."""
+        with self._lock:
+            self._conn.execute("DELETE FROM tenants WHERE tenant = ?", (tenant,))
+            self._conn.commit()
+
+    def secret(self, name):
+        """A random secret generated once and then shared by every worker (e.g. the session signing key)."""
+        with self._lock:
+            self._conn.execute("INSERT OR IGNORE INTO secrets VALUES (?, ?)", (name, secrets.token_hex(32)))
+            self._conn.commit()
+            return self._conn.execute("SELECT value FROM secrets WHERE name = ?", (name,)).fetchone()[0]
@@ -0,0 +1,214 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date
+from itertools import chain
+
+from .serialization import to_plain
+
+
+# Columnar export layout per fetcher: (source field, column name, column kind)
+COLUMNAR_EXPORTS = {
+    'lead_insights': (
+        ('lead_info.type', 'lead_type', 'category'),
+        ('lead_info.category', 'category_id', 'category'),
+        ('lead_info.service', 'service_id', 'category'),
+        ('lead_info.status', 'lead_status', 'category'),
+        ('lead_info.charged', 'lead_charged', 'bool'),
+        ('lead_info.credit_state', 'credit_state', 'category'),
+        ('timing.date', 'date', 'date'),
+        ('timing.hour', 'hour', 'int'),
+        ('timing.day_of_week', 'day_of_week', 'category'),
+        ('metrics.cost', 'cost_micros', 'micros'),
+        ('metrics.conversions', 'conversions', 'float'),
+        ('metrics.conversion_value', 'conversion_value', 'float'),
+        ('verification_status.license_status', 'license_status', 'json'),
+        ('verification_status.insurance_status', 'insurance_status', 'json')
+    ),
+    'campaign_performance': (
+        ('campaign_id', 'campaign_id', 'int'),
+        ('campaign_name', 'campaign_name', 'category'),
+        ('status', 'status', 'category'),
+        ('date', 'date', 'date'),
+        ('metrics.impressions', 'impressions', 'int'),
+        ('metrics.clicks', 'clicks', 'int'),
+        ('metrics.cost', 'cost_micros', 'micros'),
+        ('metrics.conversions', 'conversions', 'float'),
+        ('metrics.conversion_value', 'conversion_value', 'float'),
+        ('metrics.avg_cpc', 'avg_cpc_micros', 'micros'),
+        ('metrics.ctr', 'ctr', 'float'),
+        ('metrics.avg_cost', 'avg_cost_micros', 'micros'),
+        ('metrics.cost_per_conversion', 'cost_per_conversion_micros', 'micros'),
+        ('optimization_score', 'optimization_score', 'float'),
+        ('bidding_strategy', 'bidding_strategy', 'category'),
+        ('target_cpa', 'target_cpa_micros', 'micros'),
+        ('category_bids', 'category_bids', 'json')
+    ),
+    'geographic_performance': (
+        ('campaign.id', 'campaign_id', 'int'),
+        ('campaign.name', 'campaign_name', 'category'),
+        ('location.name', 'location_name', 'category'),
+        ('location.targeting_type', 'targeting_type', 'category'),
+        ('location.country_id', 'country_criterion_id', 'int'),
+        ('location.location_type', 'location_type', 'category'),
+        ('location.canonical_name', 'canonical_name', 'category'),
+        ('metrics.impressions', 'impressions', 'int'),
+        ('metrics.clicks', 'clicks', 'int'),
+        ('metrics.cost', 'cost_micros', 'micros'),
+        ('metrics.conversions', 'conversions', 'float'),
+        ('metrics.conversion_value', 'conversion_value', 'float')
+    )
+}
+
+
+def prime(batches):
+    """Pull the first batch eagerly so upstream errors surface before a response starts.
+
+    Returns an iterator over all batches, including the first.
+    """
+    batches = iter(batches)
+    first = next(batches, None)
+    if first is None:
+        return iter(())
+    return chain([first], batches)
+
+
+def flatten_record(record, paths):
+    """Return the values of a nested dict record at each split dotted path."""
+    values = []
+    for path in paths:
+        value = record
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        values.append(value)
+    return values
+
+
+def csv_chunks(batches, fields):
+    """Yield CSV text chunks: a header row, then one chunk per batch of records."""
+    paths = [tuple(field.split('.')) for field in fields]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(fields)
+    yield _drain(buffer)
+
+    for batch in batches:
+        for record in batch:
+            writer.writerow([_csv_value(value) for value in flatten_record(record, paths)])
+        yield _drain(buffer)
+
+
+def gzip_chunks(chunks):
+    """Gzip-compress a stream of text chunks on the fly."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _drain(buffer):
+    text = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return text
+
+
+def _csv_value(value):
+    value = to_plain(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+def columnar_chunks(batches, resource, fmt='parquet'):
+    """Yield a Parquet file (one row group per batch) or an Arrow IPC stream as bytes chunks.
+
+    Requires pyarrow; raises ImportError when it is not installed.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = COLUMNAR_EXPORTS[resource]
+    paths = [tuple(field.split('.')) for field, _, _ in columns]
+    schema = pa.schema([(name, _arrow_type(pa, kind)) for _, name, kind in columns])
+
+    sink = _ChunkSink()
+    if fmt == 'parquet':
+        writer = pq.ParquetWriter(sink, schema, compression='zstd')
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    try:
+        for batch in batches:
+            values = [flatten_record(record, paths) for record in batch]
+            arrays = [
+                _arrow_array(pa, [row[index] for row in values], kind)
+                for index, (_, _, kind) in enumerate(columns)
+            ]
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back through drain()."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _arrow_type(pa, kind):
+    return {
+        'category': pa.dictionary(pa.int32(), pa.string()),
+        'bool': pa.bool_(),
+        'int': pa.int64(),
+        'float': pa.float64(),
+        'micros': pa.int64(),
+        'date': pa.date32(),
+        'json': pa.string()
+    }[kind]
+
+
+def _arrow_array(pa, values, kind):
+    """Convert one column of API values into an Arrow array of the given kind."""
+    values = [to_plain(value) for value in values]
+
+    if kind == 'category':
+        return pa.array([None if value is None else str(value) for value in values], pa.string()).dictionary_encode()
+    if kind == 'micros':
+        return pa.array([None if value is None else round(value * 1000000) for value in values], pa.int64())
+    if kind == 'date':
+        return pa.array([None if value is None else date.fromisoformat(str(value)[:10]) for value in values], pa.date32())
+    if kind == 'json':
+        return pa.array([None if value is None else json.dumps(value) for value in values], pa.string())
+    if kind == 'int':
+        return pa.array([None if value is None else int(value) for value in values], pa.int64())
+    if kind == 'float':
+        return pa.array([None if value is None else float(value) for value in values], pa.float64())
+
+    return pa.array([None if value is None else bool(value) for value in values], pa.bool_())
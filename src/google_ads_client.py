@@ -1,20 +1,306 @@
-from google.ads.googleads.client import GoogleAdsClient as GoogleAdsClientLib
-from google.ads.googleads.errors import GoogleAdsException
-import os
+import importlib
+import threading
+import time
 from datetime import datetime, timedelta
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+
+from .aggregation import LEAD_STATISTICS_FIELDS, dashboard_metrics, lead_metrics, lead_trend
+from .concurrency import SingleFlight
+from .metrics import CACHE_REQUESTS, COALESCED_FETCHES, FETCH_ROWS, FETCH_SECONDS, UPSTREAM_ERRORS
+from .profiling import bind
+from .query_builder import GaqlQuery
+from .records import RowSchema
+from .resilience import error_codes
+
+ADDITIVE_METRICS = ('impressions', 'clicks', 'cost', 'conversions', 'conversion_value')
+
+LEAD_STATISTICS_SCHEMA = RowSchema((
+    ('id', 'lead.id', lambda row: row.lead.id),
+    ('lead_id', 'lead.lead_id', lambda row: row.lead.lead_id),
+    ('type', 'lead.type', lambda row: row.lead.type),
+    ('status', 'lead.status', lambda row: row.lead.status),
+    ('creation_time', 'lead.creation_date_time', lambda row: row.lead.creation_date_time),
+    ('category', 'lead.category', lambda row: row.lead.category),
+    ('service', 'lead.service', lambda row: row.lead.service),
+    ('business_name', 'lead.business_name', lambda row: row.lead.business_name),
+    ('phone', 'lead.contact_info.phone_number', lambda row: row.lead.contact_info.phone_number),
+    ('email', 'lead.contact_info.email', lambda row: row.lead.contact_info.email),
+    ('credit_state', 'lead.credit_info.credit_state', lambda row: row.lead.credit_info.credit_state),
+    ('credit_update_time', 'lead.credit_info.update_time', lambda row: row.lead.credit_info.update_time),
+    ('cost', 'metrics.cost_micros', lambda row: row.metrics.cost_micros / 1000000),
+    ('conversions', 'metrics.conversions', lambda row: row.metrics.conversions)
+))
+
+DETAILED_LEAD_SCHEMA = RowSchema((
+    ('id', 'local_services_lead.id', lambda row: row.local_services_lead.id),
+    ('lead_type', 'local_services_lead.lead_type', lambda row: row.local_services_lead.lead_type),
+    ('category_id', 'local_services_lead.category_id', lambda row: row.local_services_lead.category_id),
+    ('service_id', 'local_services_lead.service_id', lambda row: row.local_services_lead.service_id),
+    ('contact_details', 'local_services_lead.contact_details', lambda row: row.local_services_lead.contact_details),
+    ('lead_status', 'local_services_lead.lead_status', lambda row: row.local_services_lead.lead_status),
+    ('creation_time', 'local_services_lead.creation_date_time', lambda row: row.local_services_lead.creation_date_time),
+    ('locale', 'local_services_lead.locale', lambda row: row.local_services_lead.locale),
+    ('lead_charged', 'local_services_lead.lead_charged', lambda row: row.local_services_lead.lead_charged),
+    ('credit_state', 'local_services_lead.credit_details.credit_state', lambda row: row.local_services_lead.credit_details.credit_state),
+    ('credit_update_time', 'local_services_lead.credit_details.credit_state_last_update_date_time', lambda row: row.local_services_lead.credit_details.credit_state_last_update_date_time)
+))
+
+CAMPAIGN_PERFORMANCE_SCHEMA = RowSchema((
+    ('campaign_id', 'campaign.id', lambda row: row.campaign.id),
+    ('campaign_name', 'campaign.name', lambda row: row.campaign.name),
+    ('status', 'campaign.status', lambda row: row.campaign.status),
+    ('date', 'segments.date', lambda row: row.segments.date),
+    ('metrics.impressions', 'metrics.impressions', lambda row: row.metrics.impressions),
+    ('metrics.clicks', 'metrics.clicks', lambda row: row.metrics.clicks),
+    ('metrics.cost', 'metrics.cost_micros', lambda row: row.metrics.cost_micros / 1000000),
+    ('metrics.conversions', 'metrics.conversions', lambda row: row.metrics.conversions),
+    ('metrics.conversion_value', 'metrics.conversions_value', lambda row: row.metrics.conversions_value),
+    ('metrics.avg_cpc', 'metrics.average_cpc', lambda row: row.metrics.average_cpc / 1000000),
+    ('metrics.ctr', 'metrics.ctr', lambda row: row.metrics.ctr),
+    ('metrics.avg_cost', 'metrics.average_cost', lambda row: row.metrics.average_cost / 1000000),
+    ('metrics.cost_per_conversion', ('metrics.cost_per_conversion', 'metrics.conversions'), lambda row: row.metrics.cost_per_conversion / 1000000 if row.metrics.conversions > 0 else 0),
+    ('optimization_score', 'campaign.optimization_score', lambda row: row.campaign.optimization_score),
+    ('bidding_strategy', 'campaign.bidding_strategy_type', lambda row: row.campaign.bidding_strategy_type),
+    ('target_cpa', 'campaign.target_cpa.target_cpa_micros', lambda row: row.campaign.target_cpa.target_cpa_micros / 1000000 if row.campaign.target_cpa.target_cpa_micros else None),
+    ('category_bids', 'campaign.local_services_campaign_settings.category_bids', lambda row: row.campaign.local_services_campaign_settings.category_bids)
+))
+
+LEAD_INSIGHTS_SCHEMA = RowSchema((
+    ('lead_info.type', 'local_services_lead.lead_type', lambda row: row.local_services_lead.lead_type),
+    ('lead_info.category', 'local_services_lead.category_id', lambda row: row.local_services_lead.category_id),
+    ('lead_info.service', 'local_services_lead.service_id', lambda row: row.local_services_lead.service_id),
+    ('lead_info.status', 'local_services_lead.lead_status', lambda row: row.local_services_lead.lead_status),
+    ('lead_info.charged', 'local_services_lead.lead_charged', lambda row: row.local_services_lead.lead_charged),
+    ('lead_info.credit_state', 'local_services_lead.credit_details.credit_state', lambda row: row.local_services_lead.credit_details.credit_state),
+    ('timing.date', 'segments.date', lambda row: row.segments.date),
+    ('timing.hour', 'segments.hour', lambda row: row.segments.hour),
+    ('timing.day_of_week', 'segments.day_of_week', lambda row: row.segments.day_of_week),
+    ('metrics.cost', 'metrics.cost_micros', lambda row: row.metrics.cost_micros / 1000000),
+    ('metrics.conversions', 'metrics.conversions', lambda row: row.metrics.conversions),
+    ('metrics.conversion_value', 'metrics.conversions_value', lambda row: row.metrics.conversions_value),
+    ('verification_status.license_status', 'customer.local_services_settings.granular_license_statuses', lambda row: row.customer.local_services_settings.granular_license_statuses),
+    ('verification_status.insurance_status', 'customer.local_services_settings.granular_insurance_statuses', lambda row: row.customer.local_services_settings.granular_insurance_statuses)
+))
+
+GEOGRAPHIC_SCHEMA = RowSchema((
+    ('campaign.id', 'campaign.id', lambda row: row.campaign.id),
+    ('campaign.name', 'campaign.name', lambda row: row.campaign.name),
+    ('location.name', 'location_view.location_name', lambda row: row.location_view.location_name),
+    ('location.targeting_type', 'location_view.targeting_location_type', lambda row: row.location_view.targeting_location_type),
+    ('location.country_id', 'geographic_view.country_criterion_id', lambda row: row.geographic_view.country_criterion_id),
+    ('location.location_type', 'geographic_view.location_type', lambda row: row.geographic_view.location_type),
+    ('location.canonical_name', 'geographic_view.canonical_name', lambda row: row.geographic_view.canonical_name),
+    ('metrics.impressions', 'metrics.impressions', lambda row: row.metrics.impressions),
+    ('metrics.clicks', 'metrics.clicks', lambda row: row.metrics.clicks),
+    ('metrics.cost', 'metrics.cost_micros', lambda row: row.metrics.cost_micros / 1000000),
+    ('metrics.conversions', 'metrics.conversions', lambda row: row.metrics.conversions),
+    ('metrics.conversion_value', 'metrics.conversions_value', lambda row: row.metrics.conversions_value)
+))
+
+# Entity attributes repeated on every row, sent once per entity in normalized responses
+CAMPAIGN_PERFORMANCE_DIMENSIONS = {
+    'campaigns': ('campaign_id', ('campaign_name', 'status', 'optimization_score', 'bidding_strategy', 'target_cpa', 'category_bids'))
+}
+LEAD_INSIGHTS_DIMENSIONS = {
+    'customer': (None, ('verification_status.license_status', 'verification_status.insurance_status'))
+}
+GEOGRAPHIC_DIMENSIONS = {
+    'campaigns': ('campaign.id', ('campaign.name',))
+}
+
+LOCAL_SERVICES_CAMPAIGN = "campaign.advertising_channel_type = 'LOCAL_SERVICES'"
+SEGMENT_DATE_RANGE = 'segments.date BETWEEN {start_date:date} AND {end_date:date}'
+
+LEAD_STATISTICS_QUERY = GaqlQuery(
+    'lead', LEAD_STATISTICS_SCHEMA.gaql_fields,
+    where=('lead.creation_date_time BETWEEN {start_date:date} AND {end_date:date}', 'lead.type = {lead_type:enum}'),
+    order_by='lead.creation_date_time DESC'
+)
+
+LEAD_CONVERSATIONS_QUERY = GaqlQuery(
+    'lead',
+    ('lead.id', 'lead.conversation.type', 'lead.conversation.message_content', 'lead.conversation.timestamp'),
+    where=('lead.id = {lead_id:string}',)
+)
+
+EMPLOYEE_DATA_QUERY = GaqlQuery('employee', ('employee.id', 'employee.name', 'employee.role', 'employee.status'))
+
+CAMPAIGN_ID_QUERY = GaqlQuery('campaign', ('campaign.id', 'campaign.name'), where=(LOCAL_SERVICES_CAMPAIGN,), limit=1)
+
+CAMPAIGN_DATA_QUERY = GaqlQuery(
+    'campaign',
+    (
+        'campaign.id', 'campaign.name', 'campaign.status', 'campaign_budget.id', 'campaign_budget.period',
+        'campaign_budget.amount_micros', 'campaign_budget.type', 'campaign.local_services_campaign_settings.category_bids'
+    ),
+    where=(LOCAL_SERVICES_CAMPAIGN,)
+)
+
+DETAILED_LEAD_QUERY = GaqlQuery(
+    'local_services_lead', DETAILED_LEAD_SCHEMA.gaql_fields,
+    where=('local_services_lead.creation_date_time BETWEEN {start_date:date} AND {end_date:date}',)
+)
+
+LEAD_CONVERSATIONS_DETAILED_QUERY = GaqlQuery(
+    'local_services_lead_conversation',
+    (
+        'local_services_lead_conversation.id',
+        'local_services_lead_conversation.conversation_channel',
+        'local_services_lead_conversation.participant_type',
+        'local_services_lead_conversation.lead',
+        'local_services_lead_conversation.event_date_time',
+        'local_services_lead_conversation.phone_call_details.call_duration_millis',
+        'local_services_lead_conversation.phone_call_details.call_recording_url',
+        'local_services_lead_conversation.message_details.text',
+        'local_services_lead_conversation.message_details.attachment_urls'
+    ),
+    where=('local_services_lead_conversation.lead = {lead_id:string}',)
+)
+
+LEAD_CONVERSATIONS_BATCH_QUERY = GaqlQuery(
+    'local_services_lead_conversation', LEAD_CONVERSATIONS_DETAILED_QUERY.fields,
+    where=('local_services_lead_conversation.lead IN {leads:string_list}',)
+)
+
+# Leads per IN list, keeping batched conversation queries well inside the API's query size limits
+LEAD_CONVERSATIONS_CHUNK_SIZE = 500
+
+VERIFICATION_ARTIFACTS_QUERY = GaqlQuery(
+    'local_services_verification_artifact',
+    (
+        'local_services_verification_artifact.id',
+        'local_services_verification_artifact.creation_date_time',
+        'local_services_verification_artifact.status',
+        'local_services_verification_artifact.artifact_type',
+        'local_services_verification_artifact.license_verification_artifact.license_type',
+        'local_services_verification_artifact.license_verification_artifact.license_number',
+        'local_services_verification_artifact.license_verification_artifact.licensee_first_name',
+        'local_services_verification_artifact.license_verification_artifact.licensee_last_name',
+        'local_services_verification_artifact.license_verification_artifact.rejection_reason',
+        'local_services_verification_artifact.insurance_verification_artifact.insurance_type',
+        'local_services_verification_artifact.insurance_verification_artifact.rejection_reason'
+    ),
+    where=('local_services_verification_artifact.artifact_type = {artifact_type:enum}',)
+)
+
+EMPLOYEES_QUERY = GaqlQuery(
+    'local_services_employee',
+    (
+        'local_services_employee.status',
+        'local_services_employee.type',
+        'local_services_employee.university_degrees',
+        'local_services_employee.residencies',
+        'local_services_employee.fellowships',
+        'local_services_employee.job_title',
+        'local_services_employee.year_started_practicing',
+        'local_services_employee.languages_spoken',
+        'local_services_employee.first_name',
+        'local_services_employee.middle_name',
+        'local_services_employee.last_name'
+    )
+)
+
+CAMPAIGN_PERFORMANCE_QUERY = GaqlQuery(
+    'campaign', CAMPAIGN_PERFORMANCE_SCHEMA.gaql_fields,
+    where=(LOCAL_SERVICES_CAMPAIGN, SEGMENT_DATE_RANGE),
+    order_by='segments.date DESC'
+)
+
+LEAD_INSIGHTS_QUERY = GaqlQuery('local_services_lead', LEAD_INSIGHTS_SCHEMA.gaql_fields, where=(SEGMENT_DATE_RANGE,))
+
+GEOGRAPHIC_QUERY = GaqlQuery('geographic_view', GEOGRAPHIC_SCHEMA.gaql_fields, where=(LOCAL_SERVICES_CAMPAIGN, SEGMENT_DATE_RANGE))
+
+COMPETITOR_INSIGHTS_QUERY = GaqlQuery(
+    'campaign',
+    (
+        'campaign.id',
+        'campaign.name',
+        'campaign.optimization_score',
+        'campaign.optimization_score_weight',
+        'campaign.bidding_strategy_type',
+        'campaign.target_cpa.target_cpa_micros',
+        'campaign.local_services_campaign_settings.category_bids',
+        'metrics.search_impression_share',
+        'metrics.search_rank_lost_impression_share',
+        'metrics.search_budget_lost_impression_share',
+        'metrics.average_cpc',
+        'metrics.ctr',
+        'metrics.conversions',
+        'metrics.conversion_rate'
+    ),
+    where=(LOCAL_SERVICES_CAMPAIGN,)
+)
+
+# The client library (and, through get_service, each API version's service
+# modules) takes most of the startup time, so it is imported on first use or
+# ahead of time by preload.preload(). Tests and benchmarks may replace it.
+GoogleAdsClientLib = None
+
+_PROTO_PLUS_TYPES = {}
+
+
+def client_library():
+    """The google-ads GoogleAdsClient class, imported on first use."""
+    global GoogleAdsClientLib
+    if GoogleAdsClientLib is None:
+        from google.ads.googleads.client import GoogleAdsClient as GoogleAdsClientLib
+    return GoogleAdsClientLib
+
+
+def google_ads_exception():
+    """The GoogleAdsException class, imported on first use."""
+    from google.ads.googleads.errors import GoogleAdsException
+    return GoogleAdsException
+
+
+
+def proto_plus_row(row):
+    """Wrap a raw protobuf GoogleAdsRow in its proto-plus type, without copying it."""
+    name = row.DESCRIPTOR.full_name
+    row_type = _PROTO_PLUS_TYPES.get(name)
+    if row_type is None:
+        # google.ads.googleads.vNN.services.GoogleAdsRow -> ...vNN.services.types.google_ads_service
+        package, type_name = name.rsplit('.', 1)
+        module = importlib.import_module(f"{package}.types.google_ads_service")
+        row_type = _PROTO_PLUS_TYPES[name] = getattr(module, type_name)
+    return row_type.wrap(row)
+
 
 class GoogleAdsClient:
-    def __init__(self, credentials=None):
-        """Initialize Google Ads client with credentials."""
+    def __init__(self, credentials=None, cache=None, sync=None, tenant=None, guard=None, rollups=None, use_proto_plus=True):
+        """Initialize Google Ads client with credentials, an optional ResultCache, DayPartitionSync, UpstreamGuard and RollupStore.
+
+        When tenant is given, cached results, synced partitions and rollups
+        are scoped to it so tenants sharing a store never see each other's data.
+        With use_proto_plus False the API returns raw protobuf rows, which
+        schema-based fetchers convert with compiled accessors instead of
+        going through proto-plus marshalling; fetchers return the same values.
+        """
         self.client = None
         self.credentials = credentials
+        self.cache = cache
+        self.sync = sync
+        self.tenant = tenant
+        self.guard = guard
+        self.rollups = rollups
+        self.use_proto_plus = use_proto_plus
+
+        # Service stubs (and their gRPC channels) are created once per client
+        self._services = {}
+        self._services_lock = threading.Lock()
+
+        # Identical fetches already in flight are shared instead of re-run
+        self.single_flight = SingleFlight(on_coalesced=lambda key: COALESCED_FETCHES.inc(fetcher=key[0]))
+
+        # Per-thread accumulator of time spent waiting on the API during a fetch
+        self._timing = threading.local()
 
     def initialize_client(self, credentials=None):
         """Initialize the client with provided credentials."""
         if credentials:
             self.credentials = credentials
-        
+
         if not self.credentials:
             return False
 
@@ -24,10 +310,11 @@ class GoogleAdsClient:
                 'client_id': self.credentials.get('client_id'),
                 'client_secret': self.credentials.get('client_secret'),
                 'refresh_token': self.credentials.get('refresh_token'),
-                'use_proto_plus': True
+                'use_proto_plus': self.use_proto_plus
             }
-            
-            self.client = GoogleAdsClientLib.load_from_dict(config)
+
+            self.client = client_library().load_from_dict(config)
+            self._services = {}
             return True
         except Exception as e:
             print(f"Error initializing client: {str(e)}")
@@ -39,733 +326,719 @@ class GoogleAdsClient:
 
     def get_lead_statistics(self, customer_id, query_type='today', start_date=None, end_date=None, lead_type=None):
         """Get lead statistics based on query type and filters."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            # Build date range condition
-            date_condition = self._build_date_condition(query_type, start_date, end_date)
-            
-            # Build lead type condition
-            lead_type_condition = ""
-            if lead_type:
-                lead_type_condition = f" AND lead.type = '{lead_type}'"
-            
-            query = f"""
-                SELECT
-                    lead.id,
-                    lead.lead_id,
-                    lead.type,
-                    lead.status,
-                    lead.creation_date_time,
-                    lead.category,
-                    lead.service,
-                    lead.business_name,
-                    lead.contact_info.phone_number,
-                    lead.contact_info.email,
-                    lead.credit_info.credit_state,
-                    lead.credit_info.update_time,
-                    metrics.cost_micros,
-                    metrics.conversions
-                FROM lead
-                WHERE {date_condition}{lead_type_condition}
-                ORDER BY lead.creation_date_time DESC
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            leads = []
-            for row in response:
-                lead = row.lead
-                leads.append({
-                    'id': lead.id,
-                    'lead_id': lead.lead_id,
-                    'type': lead.type,
-                    'status': lead.status,
-                    'creation_time': lead.creation_date_time,
-                    'category': lead.category,
-                    'service': lead.service,
-                    'business_name': lead.business_name,
-                    'phone': lead.contact_info.phone_number,
-                    'email': lead.contact_info.email,
-                    'credit_state': lead.credit_info.credit_state,
-                    'credit_update_time': lead.credit_info.update_time,
-                    'cost': row.metrics.cost_micros / 1000000,
-                    'conversions': row.metrics.conversions
-                })
-            
-            # Calculate statistics
-            stats = self._calculate_statistics(leads)
-            
-            return {
-                'leads': leads,
-                'statistics': stats
-            }
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
+        leads = self._fetch(
+            'lead_statistics', customer_id,
+            self._lead_statistics_query(query_type, start_date, end_date, lead_type),
+            LEAD_STATISTICS_SCHEMA, (start_date, end_date)
+        )
+
+        # Calculate statistics
+        stats = self._calculate_statistics(leads)
+
+        return {
+            'leads': leads.to_records(),
+            'statistics': stats
+        }
+
+    def stream_lead_statistics(self, customer_id, query_type='today', start_date=None, end_date=None, lead_type=None, batch_size=None):
+        """Stream leads matching the query type and filters."""
+        return self._stream(customer_id, self._lead_statistics_query(query_type, start_date, end_date, lead_type), LEAD_STATISTICS_SCHEMA, batch_size)
+
+    def _lead_statistics_query(self, query_type='today', start_date=None, end_date=None, lead_type=None):
+        """Build the GAQL query for lead statistics."""
+        start, end = self._date_range(query_type, start_date, end_date)
+        return LEAD_STATISTICS_QUERY.build(start_date=start, end_date=end, lead_type=lead_type or None)
 
     def get_lead_conversations(self, customer_id, lead_id):
         """Get conversation details for a specific lead."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            query = f"""
-                SELECT
-                    lead.id,
-                    lead.conversation.type,
-                    lead.conversation.message_content,
-                    lead.conversation.timestamp
-                FROM lead
-                WHERE lead.id = '{lead_id}'
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            conversations = []
-            for row in response:
-                conv = row.lead.conversation
-                conversations.append({
-                    'type': conv.type,
-                    'content': conv.message_content,
-                    'timestamp': conv.timestamp
-                })
-                
-            return conversations
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
+        return self._fetch('lead_conversations', customer_id, self._lead_conversations_query(lead_id), self._lead_conversation_row)
+
+    def stream_lead_conversations(self, customer_id, lead_id, batch_size=None):
+        """Stream conversation details for a specific lead."""
+        return self._stream(customer_id, self._lead_conversations_query(lead_id), self._lead_conversation_row, batch_size)
+
+    def _lead_conversations_query(self, lead_id):
+        """Build the GAQL query for lead conversations."""
+        return LEAD_CONVERSATIONS_QUERY.build(lead_id=lead_id)
+
+    def _lead_conversation_row(self, row):
+        conv = row.lead.conversation
+        return {
+            'type': conv.type,
+            'content': conv.message_content,
+            'timestamp': conv.timestamp
+        }
 
     def get_employee_data(self, customer_id):
         """Get employee information."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            query = """
-                SELECT
-                    employee.id,
-                    employee.name,
-                    employee.role,
-                    employee.status
-                FROM employee
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            employees = []
-            for row in response:
-                emp = row.employee
-                employees.append({
-                    'id': emp.id,
-                    'name': emp.name,
-                    'role': emp.role,
-                    'status': emp.status
-                })
-                
-            return employees
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
+        return self._fetch('employee_data', customer_id, self._employee_data_query(), self._employee_data_row)
+
+    def stream_employee_data(self, customer_id, batch_size=None):
+        """Stream employee information."""
+        return self._stream(customer_id, self._employee_data_query(), self._employee_data_row, batch_size)
+
+    def _employee_data_query(self):
+        """Build the GAQL query for employee data."""
+        return EMPLOYEE_DATA_QUERY.build()
+
+    def _employee_data_row(self, row):
+        emp = row.employee
+        return {
+            'id': emp.id,
+            'name': emp.name,
+            'role': emp.role,
+            'status': emp.status
+        }
 
     def get_campaign_id(self, customer_id):
         """Get Local Services campaign ID."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            query = """
-                SELECT
-                    campaign.id,
-                    campaign.name
-                FROM campaign
-                WHERE campaign.advertising_channel_type = 'LOCAL_SERVICES'
-                LIMIT 1
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            for row in response:
-                return row.campaign.id
-                
-            return None
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
+        for campaign_id in self._stream(customer_id, CAMPAIGN_ID_QUERY.build(), lambda row: row.campaign.id):
+            return campaign_id
+
+        return None
 
     def get_campaign_data(self, customer_id):
         """Get Local Services campaign and budget information."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            query = """
-                SELECT
-                    campaign.id,
-                    campaign.name,
-                    campaign.status,
-                    campaign_budget.id,
-                    campaign_budget.period,
-                    campaign_budget.amount_micros,
-                    campaign_budget.type,
-                    campaign.local_services_campaign_settings.category_bids
-                FROM campaign
-                WHERE campaign.advertising_channel_type = 'LOCAL_SERVICES'
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            campaigns = []
-            for row in response:
-                campaign = row.campaign
-                budget = row.campaign_budget
-                campaigns.append({
-                    'id': campaign.id,
-                    'name': campaign.name,
-                    'status': campaign.status,
-                    'budget_id': budget.id,
-                    'budget_period': budget.period,
-                    'budget_amount': budget.amount_micros / 1000000,
-                    'budget_type': budget.type,
-                    'category_bids': campaign.local_services_campaign_settings.category_bids
-                })
-            
-            return campaigns
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
-
-    def get_detailed_lead_data(self, customer_id, query_type='today', start_date=None, end_date=None):
-        """Get comprehensive lead information including contact details and credit information."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            date_condition = self._build_date_condition(query_type, start_date, end_date)
-            
-            query = f"""
-                SELECT
-                    local_services_lead.lead_type,
-                    local_services_lead.category_id,
-                    local_services_lead.service_id,
-                    local_services_lead.contact_details,
-                    local_services_lead.lead_status,
-                    local_services_lead.creation_date_time,
-                    local_services_lead.locale,
-                    local_services_lead.lead_charged,
-                    local_services_lead.credit_details.credit_state,
-                    local_services_lead.credit_details.credit_state_last_update_date_time
-                FROM local_services_lead
-                WHERE {date_condition}
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            leads = []
-            for row in response:
-                lead = row.local_services_lead
-                leads.append({
-                    'lead_type': lead.lead_type,
-                    'category_id': lead.category_id,
-                    'service_id': lead.service_id,
-                    'contact_details': lead.contact_details,
-                    'lead_status': lead.lead_status,
-                    'creation_time': lead.creation_date_time,
-                    'locale': lead.locale,
-                    'lead_charged': lead.lead_charged,
-                    'credit_state': lead.credit_details.credit_state,
-                    'credit_update_time': lead.credit_details.credit_state_last_update_date_time
-                })
-            
-            return leads
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
+        return self._fetch('campaign_data', customer_id, self._campaign_data_query(), self._campaign_data_row)
+
+    def stream_campaign_data(self, customer_id, batch_size=None):
+        """Stream Local Services campaign and budget information."""
+        return self._stream(customer_id, self._campaign_data_query(), self._campaign_data_row, batch_size)
+
+    def _campaign_data_query(self):
+        """Build the GAQL query for campaign data."""
+        return CAMPAIGN_DATA_QUERY.build()
+
+    def _campaign_data_row(self, row):
+        campaign = row.campaign
+        budget = row.campaign_budget
+        return {
+            'id': campaign.id,
+            'name': campaign.name,
+            'status': campaign.status,
+            'budget_id': budget.id,
+            'budget_period': budget.period,
+            'budget_amount': budget.amount_micros / 1000000,
+            'budget_type': budget.type,
+            'category_bids': campaign.local_services_campaign_settings.category_bids
+        }
+
+    def get_detailed_lead_data(self, customer_id, query_type='today', start_date=None, end_date=None, as_columns=False, fields=None):
+        """Get comprehensive lead information including contact details and credit information.
+
+        Returns a ColumnarRows instead of a list of dicts when as_columns is True.
+        fields limits the result (and the GAQL SELECT) to those output fields.
+        """
+        schema = DETAILED_LEAD_SCHEMA.project(fields)
+        leads = self._fetch(
+            'detailed_lead_data', customer_id,
+            self._detailed_lead_data_query(query_type, start_date, end_date, schema.gaql_fields),
+            schema, (start_date, end_date)
+        )
+        return leads if as_columns else leads.to_records()
+
+    def stream_detailed_lead_data(self, customer_id, query_type='today', start_date=None, end_date=None, batch_size=None, fields=None):
+        """Stream comprehensive lead information including contact details and credit information."""
+        schema = DETAILED_LEAD_SCHEMA.project(fields)
+        return self._stream(customer_id, self._detailed_lead_data_query(query_type, start_date, end_date, schema.gaql_fields), schema, batch_size)
+
+    def _detailed_lead_data_query(self, query_type='today', start_date=None, end_date=None, fields=None):
+        """Build the GAQL query for detailed lead data."""
+        start, end = self._date_range(query_type, start_date, end_date)
+        return DETAILED_LEAD_QUERY.build(fields, start_date=start, end_date=end)
 
     def get_lead_conversations_detailed(self, customer_id, lead_id=None):
         """Get detailed conversation data including phone calls and messages."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            lead_condition = f"WHERE local_services_lead_conversation.lead = '{lead_id}'" if lead_id else ""
-            
-            query = f"""
-                SELECT
-                    local_services_lead_conversation.id,
-                    local_services_lead_conversation.conversation_channel,
-                    local_services_lead_conversation.participant_type,
-                    local_services_lead_conversation.lead,
-                    local_services_lead_conversation.event_date_time,
-                    local_services_lead_conversation.phone_call_details.call_duration_millis,
-                    local_services_lead_conversation.phone_call_details.call_recording_url,
-                    local_services_lead_conversation.message_details.text,
-                    local_services_lead_conversation.message_details.attachment_urls
-                FROM local_services_lead_conversation
-                {lead_condition}
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            conversations = []
-            for row in response:
-                conv = row.local_services_lead_conversation
-                conversations.append({
-                    'id': conv.id,
-                    'channel': conv.conversation_channel,
-                    'participant_type': conv.participant_type,
-                    'lead_id': conv.lead,
-                    'event_time': conv.event_date_time,
-                    'call_duration': conv.phone_call_details.call_duration_millis if conv.conversation_channel == 'PHONE_CALL' else None,
-                    'call_recording_url': conv.phone_call_details.call_recording_url if conv.conversation_channel == 'PHONE_CALL' else None,
-                    'message_text': conv.message_details.text if conv.conversation_channel == 'MESSAGE' else None,
-                    'attachment_urls': conv.message_details.attachment_urls if conv.conversation_channel == 'MESSAGE' else None
-                })
-            
-            return conversations
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
+        return self._fetch('lead_conversations_detailed', customer_id, self._lead_conversations_detailed_query(lead_id), self._conversation_detailed_row)
+
+    def stream_lead_conversations_detailed(self, customer_id, lead_id=None, batch_size=None):
+        """Stream detailed conversation data including phone calls and messages."""
+        return self._stream(customer_id, self._lead_conversations_detailed_query(lead_id), self._conversation_detailed_row, batch_size)
+
+    def _lead_conversations_detailed_query(self, lead_id=None):
+        """Build the GAQL query for lead conversations detailed."""
+        return LEAD_CONVERSATIONS_DETAILED_QUERY.build(lead_id=lead_id or None)
+
+    def get_conversations_by_lead(self, customer_id, lead_ids, chunk_size=LEAD_CONVERSATIONS_CHUNK_SIZE):
+        """Get detailed conversations for many leads with one query per chunk_size leads.
+
+        lead_ids may be lead IDs or local services lead resource names.
+        Returns {lead_id: [conversation, ...]} with an entry, possibly
+        empty, for every requested lead.
+        """
+        keys = {self._lead_resource_name(customer_id, lead_id): lead_id for lead_id in dict.fromkeys(lead_ids)}
+        conversations = {lead_id: [] for lead_id in keys.values()}
+
+        resources = list(keys)
+        for start in range(0, len(resources), chunk_size):
+            chunk = resources[start:start + chunk_size]
+            query = LEAD_CONVERSATIONS_BATCH_QUERY.build(leads=chunk)
+            for conversation in self._fetch('lead_conversations_detailed', customer_id, query, self._conversation_detailed_row):
+                lead_id = keys.get(conversation['lead_id'])
+                if lead_id is not None:
+                    conversations[lead_id].append(conversation)
+
+        return conversations
+
+    def _lead_resource_name(self, customer_id, lead_id):
+        """Resource name of a local services lead, as the conversation's lead field holds it."""
+        lead_id = str(lead_id)
+        if '/' in lead_id:
+            return lead_id
+        return f"customers/{str(customer_id).replace('-', '')}/localServicesLeads/{lead_id}"
+
+    def _conversation_detailed_row(self, row):
+        conv = row.local_services_lead_conversation
+        return {
+            'id': conv.id,
+            'channel': conv.conversation_channel,
+            'participant_type': conv.participant_type,
+            'lead_id': conv.lead,
+            'event_time': conv.event_date_time,
+            'call_duration': conv.phone_call_details.call_duration_millis if conv.conversation_channel == 'PHONE_CALL' else None,
+            'call_recording_url': conv.phone_call_details.call_recording_url if conv.conversation_channel == 'PHONE_CALL' else None,
+            'message_text': conv.message_details.text if conv.conversation_channel == 'MESSAGE' else None,
+            'attachment_urls': conv.message_details.attachment_urls if conv.conversation_channel == 'MESSAGE' else None
+        }
 
     def get_verification_artifacts(self, customer_id, artifact_type=None):
         """Get verification artifacts for licenses, insurance, and background checks."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            type_condition = f"WHERE local_services_verification_artifact.artifact_type = '{artifact_type}'" if artifact_type else ""
-            
-            query = f"""
-                SELECT
-                    local_services_verification_artifact.id,
-                    local_services_verification_artifact.creation_date_time,
-                    local_services_verification_artifact.status,
-                    local_services_verification_artifact.artifact_type,
-                    local_services_verification_artifact.license_verification_artifact.license_type,
-                    local_services_verification_artifact.license_verification_artifact.license_number,
-                    local_services_verification_artifact.license_verification_artifact.licensee_first_name,
-                    local_services_verification_artifact.license_verification_artifact.licensee_last_name,
-                    local_services_verification_artifact.license_verification_artifact.rejection_reason,
-                    local_services_verification_artifact.insurance_verification_artifact.insurance_type,
-                    local_services_verification_artifact.insurance_verification_artifact.rejection_reason
-                FROM local_services_verification_artifact
-                {type_condition}
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            artifacts = []
-            for row in response:
-                artifact = row.local_services_verification_artifact
-                artifacts.append({
-                    'id': artifact.id,
-                    'creation_time': artifact.creation_date_time,
-                    'status': artifact.status,
-                    'type': artifact.artifact_type,
-                    'license_info': {
-                        'type': artifact.license_verification_artifact.license_type,
-                        'number': artifact.license_verification_artifact.license_number,
-                        'first_name': artifact.license_verification_artifact.licensee_first_name,
-                        'last_name': artifact.license_verification_artifact.licensee_last_name,
-                        'rejection_reason': artifact.license_verification_artifact.rejection_reason
-                    } if artifact.artifact_type == 'LICENSE' else None,
-                    'insurance_info': {
-                        'type': artifact.insurance_verification_artifact.insurance_type,
-                        'rejection_reason': artifact.insurance_verification_artifact.rejection_reason
-                    } if artifact.artifact_type == 'INSURANCE' else None
-                })
-            
-            return artifacts
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
+        return self._fetch('verification_artifacts', customer_id, self._verification_artifacts_query(artifact_type), self._verification_artifact_row)
+
+    def stream_verification_artifacts(self, customer_id, artifact_type=None, batch_size=None):
+        """Stream verification artifacts for licenses, insurance, and background checks."""
+        return self._stream(customer_id, self._verification_artifacts_query(artifact_type), self._verification_artifact_row, batch_size)
+
+    def _verification_artifacts_query(self, artifact_type=None):
+        """Build the GAQL query for verification artifacts."""
+        return VERIFICATION_ARTIFACTS_QUERY.build(artifact_type=artifact_type or None)
+
+    def _verification_artifact_row(self, row):
+        artifact = row.local_services_verification_artifact
+        return {
+            'id': artifact.id,
+            'creation_time': artifact.creation_date_time,
+            'status': artifact.status,
+            'type': artifact.artifact_type,
+            'license_info': {
+                'type': artifact.license_verification_artifact.license_type,
+                'number': artifact.license_verification_artifact.license_number,
+                'first_name': artifact.license_verification_artifact.licensee_first_name,
+                'last_name': artifact.license_verification_artifact.licensee_last_name,
+                'rejection_reason': artifact.license_verification_artifact.rejection_reason
+            } if artifact.artifact_type == 'LICENSE' else None,
+            'insurance_info': {
+                'type': artifact.insurance_verification_artifact.insurance_type,
+                'rejection_reason': artifact.insurance_verification_artifact.rejection_reason
+            } if artifact.artifact_type == 'INSURANCE' else None
+        }
 
     def get_employees(self, customer_id):
         """Get information about Local Services employees."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            query = """
-                SELECT
-                    local_services_employee.status,
-                    local_services_employee.type,
-                    local_services_employee.university_degrees,
-                    local_services_employee.residencies,
-                    local_services_employee.fellowships,
-                    local_services_employee.job_title,
-                    local_services_employee.year_started_practicing,
-                    local_services_employee.languages_spoken,
-                    local_services_employee.first_name,
-                    local_services_employee.middle_name,
-                    local_services_employee.last_name
-                FROM local_services_employee
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            employees = []
-            for row in response:
-                employee = row.local_services_employee
-                employees.append({
-                    'status': employee.status,
-                    'type': employee.type,
-                    'degrees': employee.university_degrees,
-                    'residencies': employee.residencies,
-                    'fellowships': employee.fellowships,
-                    'job_title': employee.job_title,
-                    'year_started': employee.year_started_practicing,
-                    'languages': employee.languages_spoken,
-                    'first_name': employee.first_name,
-                    'middle_name': employee.middle_name,
-                    'last_name': employee.last_name
-                })
-            
-            return employees
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
-
-    def get_campaign_performance(self, customer_id, start_date=None, end_date=None):
-        """Get detailed campaign performance metrics."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            date_range = ""
-            if start_date and end_date:
-                date_range = f"AND segments.date BETWEEN '{start_date}' AND '{end_date}'"
-            
-            query = f"""
-                SELECT
-                    campaign.id,
-                    campaign.name,
-                    campaign.status,
-                    metrics.impressions,
-                    metrics.clicks,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.conversions_value,
-                    metrics.average_cpc,
-                    metrics.ctr,
-                    metrics.average_cost,
-                    metrics.cost_per_conversion,
-                    segments.date,
-                    campaign.optimization_score,
-                    campaign.bidding_strategy_type,
-                    campaign.target_cpa.target_cpa_micros,
-                    campaign.local_services_campaign_settings.category_bids
-                FROM campaign
-                WHERE campaign.advertising_channel_type = 'LOCAL_SERVICES'
-                {date_range}
-                ORDER BY segments.date DESC
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            performance_data = []
-            for row in response:
-                campaign = row.campaign
-                metrics = row.metrics
-                segments = row.segments
-                
-                performance_data.append({
-                    'campaign_id': campaign.id,
-                    'campaign_name': campaign.name,
-                    'status': campaign.status,
-                    'date': segments.date,
-                    'metrics': {
-                        'impressions': metrics.impressions,
-                        'clicks': metrics.clicks,
-                        'cost': metrics.cost_micros / 1000000,
-                        'conversions': metrics.conversions,
-                        'conversion_value': metrics.conversions_value,
-                        'avg_cpc': metrics.average_cpc / 1000000,
-                        'ctr': metrics.ctr,
-                        'avg_cost': metrics.average_cost / 1000000,
-                        'cost_per_conversion': metrics.cost_per_conversion / 1000000 if metrics.conversions > 0 else 0
-                    },
-                    'optimization_score': campaign.optimization_score,
-                    'bidding_strategy': campaign.bidding_strategy_type,
-                    'target_cpa': campaign.target_cpa.target_cpa_micros / 1000000 if campaign.target_cpa else None,
-                    'category_bids': campaign.local_services_campaign_settings.category_bids
-                })
-            
-            return performance_data
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
-
-    def get_lead_insights(self, customer_id, start_date=None, end_date=None):
-        """Get comprehensive lead insights including trends and patterns."""
-        if not self.is_initialized():
-            raise Exception("Client is not initialized")
-        
+        return self._fetch('employees', customer_id, self._employees_query(), self._employee_row)
+
+    def stream_employees(self, customer_id, batch_size=None):
+        """Stream information about Local Services employees."""
+        return self._stream(customer_id, self._employees_query(), self._employee_row, batch_size)
+
+    def _employees_query(self):
+        """Build the GAQL query for employees."""
+        return EMPLOYEES_QUERY.build()
+
+    def _employee_row(self, row):
+        employee = row.local_services_employee
+        return {
+            'status': employee.status,
+            'type': employee.type,
+            'degrees': employee.university_degrees,
+            'residencies': employee.residencies,
+            'fellowships': employee.fellowships,
+            'job_title': employee.job_title,
+            'year_started': employee.year_started_practicing,
+            'languages': employee.languages_spoken,
+            'first_name': employee.first_name,
+            'middle_name': employee.middle_name,
+            'last_name': employee.last_name
+        }
+
+    def get_campaign_performance(self, customer_id, start_date=None, end_date=None, as_columns=False, fields=None, normalized=False):
+        """Get detailed campaign performance metrics.
+
+        Returns a ColumnarRows instead of a list of dicts when as_columns is True.
+        fields limits the result (and the GAQL SELECT) to those output fields
+        plus 'date'. normalized returns a NormalizedRows with the repeated
+        entity attributes moved into CAMPAIGN_PERFORMANCE_DIMENSIONS.
+        """
+        performance_data = self._fetch_days(
+            'campaign_performance', customer_id, start_date, end_date,
+            self._campaign_performance_query, CAMPAIGN_PERFORMANCE_SCHEMA,
+            'date', fields, reverse=True
+        )
+        if normalized:
+            return performance_data.normalize(CAMPAIGN_PERFORMANCE_DIMENSIONS)
+        return performance_data if as_columns else performance_data.to_records()
+
+    def stream_campaign_performance(self, customer_id, start_date=None, end_date=None, batch_size=None, fields=None):
+        """Stream detailed campaign performance metrics."""
+        schema = CAMPAIGN_PERFORMANCE_SCHEMA.project(fields)
+        return self._stream(customer_id, self._campaign_performance_query(start_date, end_date, schema.gaql_fields), schema, batch_size)
+
+    def _campaign_performance_query(self, start_date=None, end_date=None, fields=None):
+        """Build the GAQL query for campaign performance."""
+        return CAMPAIGN_PERFORMANCE_QUERY.build(fields, start_date=start_date or None, end_date=end_date or None)
+
+    def get_lead_insights(self, customer_id, start_date=None, end_date=None, as_columns=False, fields=None, normalized=False):
+        """Get comprehensive lead insights including trends and patterns.
+
+        Returns a ColumnarRows instead of a list of dicts when as_columns is True.
+        fields limits the result (and the GAQL SELECT) to those output fields
+        plus 'timing.date'. normalized returns a NormalizedRows with the repeated
+        entity attributes moved into LEAD_INSIGHTS_DIMENSIONS.
+        """
+        leads_data = self._fetch_days(
+            'lead_insights', customer_id, start_date, end_date,
+            self._lead_insights_query, LEAD_INSIGHTS_SCHEMA,
+            'timing.date', fields
+        )
+        if normalized:
+            return leads_data.normalize(LEAD_INSIGHTS_DIMENSIONS)
+        return leads_data if as_columns else leads_data.to_records()
+
+    def stream_lead_insights(self, customer_id, start_date=None, end_date=None, batch_size=None, fields=None):
+        """Stream lead insights rows including trends and patterns."""
+        schema = LEAD_INSIGHTS_SCHEMA.project(fields)
+        return self._stream(customer_id, self._lead_insights_query(start_date, end_date, schema.gaql_fields), schema, batch_size)
+
+    def get_dashboard(self, customer_id, start_date, end_date):
+        """Dashboard totals, breakdowns, daily trend and cost by category for a date range.
+
+        Answered from the rollup cubes when a RollupStore is configured:
+        only days the cubes do not have final yet are fetched, so settled
+        ranges need no upstream calls. Otherwise computed from raw rows.
+        """
+        if self.rollups is None:
+            performance = self.get_campaign_performance(customer_id, start_date, end_date, as_columns=True)
+            leads = self.get_lead_insights(customer_id, start_date, end_date, as_columns=True)
+            return dashboard_metrics(performance, leads, start_date, end_date)
+
+        self._fill_rollups(customer_id, start_date, end_date, ('campaign_performance', 'lead_insights'))
+        return self.rollups.dashboard(self._scoped(customer_id), start_date, end_date)
+
+    def get_lead_trend(self, customer_id, start_date, end_date, granularity='day', **filters):
+        """Leads, cost and conversions per day, hour or day_of_week, from the rollup cubes.
+
+        filters (category_id, lead_type, lead_status, charged) restrict the
+        trend. Without a RollupStore only the unfiltered daily lead count
+        is available, computed from raw rows.
+        """
+        if self.rollups is None:
+            if granularity != 'day' or any(value is not None for value in filters.values()):
+                raise ValueError("Hourly, weekday and filtered trends require the rollup store")
+            trend = lead_trend(self.get_lead_insights(customer_id, start_date, end_date, as_columns=True), start_date, end_date)
+            return {'granularity': 'day', 'labels': trend['dates'], 'leads': trend['leads']}
+
+        self._fill_rollups(customer_id, start_date, end_date, ('lead_insights',))
+        return self.rollups.trend(self._scoped(customer_id), start_date, end_date, granularity, **filters)
+
+    def _fill_rollups(self, customer_id, start_date, end_date, resources):
+        """Fetch (and so roll up) each run of days the cubes do not have final yet."""
+        cubes = {'campaign_performance': ('campaigns', self.get_campaign_performance), 'lead_insights': ('leads', self.get_lead_insights)}
+        for resource in resources:
+            cube, fetch = cubes[resource]
+            for run_start, run_end in self.rollups.stale_runs(cube, self._scoped(customer_id), start_date, end_date):
+                fetch(customer_id, run_start, run_end, as_columns=True)
+
+    def _lead_insights_query(self, start_date=None, end_date=None, fields=None):
+        """Build the GAQL query for lead insights."""
+        return LEAD_INSIGHTS_QUERY.build(fields, start_date=start_date or None, end_date=end_date or None)
+
+    def get_geographic_performance(self, customer_id, start_date=None, end_date=None, as_columns=False, fields=None, normalized=False):
+        """Get geographic performance data for Local Services campaigns.
+
+        Returns a ColumnarRows instead of a list of dicts when as_columns is True.
+        fields limits the result (and the GAQL SELECT) to those output fields.
+        normalized returns a NormalizedRows with campaign names moved into
+        GEOGRAPHIC_DIMENSIONS.
+        """
+        schema = GEOGRAPHIC_SCHEMA.project(fields)
+        geo_data = self._fetch(
+            'geographic_performance', customer_id,
+            self._geographic_performance_query(start_date, end_date, schema.gaql_fields),
+            schema, (start_date, end_date)
+        )
+        if normalized:
+            return geo_data.normalize(GEOGRAPHIC_DIMENSIONS)
+        return geo_data if as_columns else geo_data.to_records()
+
+    def stream_geographic_performance(self, customer_id, start_date=None, end_date=None, batch_size=None, fields=None):
+        """Stream geographic performance data for Local Services campaigns."""
+        schema = GEOGRAPHIC_SCHEMA.project(fields)
+        return self._stream(customer_id, self._geographic_performance_query(start_date, end_date, schema.gaql_fields), schema, batch_size)
+
+    def _geographic_performance_query(self, start_date=None, end_date=None, fields=None):
+        """Build the GAQL query for geographic performance."""
+        return GEOGRAPHIC_QUERY.build(fields, start_date=start_date or None, end_date=end_date or None)
+
+    def get_competitor_insights(self, customer_id):
+        """Get competitive insights and market position data."""
+        return self._fetch('competitor_insights', customer_id, self._competitor_insights_query(), self._competitor_row)
+
+    def stream_competitor_insights(self, customer_id, batch_size=None):
+        """Stream competitive insights and market position data."""
+        return self._stream(customer_id, self._competitor_insights_query(), self._competitor_row, batch_size)
+
+    def _competitor_insights_query(self):
+        """Build the GAQL query for competitor insights."""
+        return COMPETITOR_INSIGHTS_QUERY.build()
+
+    def _competitor_row(self, row):
+        campaign = row.campaign
+        metrics = row.metrics
+
+        return {
+            'campaign_info': {
+                'id': campaign.id,
+                'name': campaign.name,
+                'optimization_score': campaign.optimization_score,
+                'optimization_weight': campaign.optimization_score_weight,
+                'bidding_strategy': campaign.bidding_strategy_type,
+                'target_cpa': campaign.target_cpa.target_cpa_micros / 1000000 if campaign.target_cpa else None,
+                'category_bids': campaign.local_services_campaign_settings.category_bids
+            },
+            'market_metrics': {
+                'impression_share': metrics.search_impression_share,
+                'rank_lost_share': metrics.search_rank_lost_impression_share,
+                'budget_lost_share': metrics.search_budget_lost_impression_share,
+                'avg_cpc': metrics.average_cpc / 1000000,
+                'ctr': metrics.ctr,
+                'conversions': metrics.conversions,
+                'conversion_rate': metrics.conversion_rate
+            }
+        }
+
+    def batch_fetch(self, fetcher, customer_ids, max_concurrency=4, **kwargs):
+        """Run a get_* fetcher across many customers, yielding results as they complete.
+
+        At most max_concurrency customers are queried at once. Each item is
+        {'customer_id', 'result', 'summary'} or, when that customer failed,
+        {'customer_id', 'error'}; one failure never affects the others.
+        """
+        fetch = getattr(self, f'get_{fetcher}', None)
+        if fetch is None:
+            raise Exception(f"Unknown fetcher: {fetcher}")
+
+        pool = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix='ads-batch')
         try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            date_range = ""
-            if start_date and end_date:
-                date_range = f"AND segments.date BETWEEN '{start_date}' AND '{end_date}'"
-            
-            query = f"""
-                SELECT
-                    local_services_lead.lead_type,
-                    local_services_lead.category_id,
-                    local_services_lead.service_id,
-                    local_services_lead.lead_status,
-                    local_services_lead.lead_charged,
-                    local_services_lead.credit_details.credit_state,
-                    segments.date,
-                    segments.hour,
-                    segments.day_of_week,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.conversions_value,
-                    customer.local_services_settings.granular_license_statuses,
-                    customer.local_services_settings.granular_insurance_statuses
-                FROM local_services_lead
-                WHERE 1=1 {date_range}
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            leads_data = []
-            for row in response:
-                lead = row.local_services_lead
-                segments = row.segments
-                metrics = row.metrics
-                customer = row.customer
-                
-                leads_data.append({
-                    'lead_info': {
-                        'type': lead.lead_type,
-                        'category': lead.category_id,
-                        'service': lead.service_id,
-                        'status': lead.lead_status,
-                        'charged': lead.lead_charged,
-                        'credit_state': lead.credit_details.credit_state
-                    },
-                    'timing': {
-                        'date': segments.date,
-                        'hour': segments.hour,
-                        'day_of_week': segments.day_of_week
-                    },
-                    'metrics': {
-                        'cost': metrics.cost_micros / 1000000,
-                        'conversions': metrics.conversions,
-                        'conversion_value': metrics.conversions_value
-                    },
-                    'verification_status': {
-                        'license_status': customer.local_services_settings.granular_license_statuses,
-                        'insurance_status': customer.local_services_settings.granular_insurance_statuses
+            futures = {pool.submit(bind(fetch), customer_id, **kwargs): customer_id for customer_id in customer_ids}
+
+            for future in as_completed(futures):
+                customer_id = futures[future]
+                try:
+                    result = future.result()
+                    yield {
+                        'customer_id': customer_id,
+                        'result': result,
+                        'summary': self.summarize_rows(result)
                     }
-                })
-            
-            return leads_data
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
-
-    def get_geographic_performance(self, customer_id, start_date=None, end_date=None):
-        """Get geographic performance data for Local Services campaigns."""
+                except Exception as e:
+                    yield {'customer_id': customer_id, 'error': str(e)}
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def summarize_rows(self, rows):
+        """Sum additive metrics (impressions, clicks, cost, conversions) across fetched rows."""
+        if isinstance(rows, dict):
+            rows = rows.get('leads', [])
+
+        summary = {'rows': 0}
+        for metric in ADDITIVE_METRICS:
+            summary[metric] = 0
+
+        for row in rows or []:
+            summary['rows'] += 1
+            if not isinstance(row, dict):
+                continue
+            metrics = row.get('metrics') if isinstance(row.get('metrics'), dict) else row
+            for metric in ADDITIVE_METRICS:
+                value = metrics.get(metric)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    summary[metric] += value
+
+        return summary
+
+    def summarize_portfolio(self, results):
+        """Merge per-customer batch_fetch results into portfolio-level totals."""
+        portfolio = {'customers': 0, 'failed_customers': 0, 'rows': 0}
+        for metric in ADDITIVE_METRICS:
+            portfolio[metric] = 0
+
+        for item in results:
+            if 'error' in item:
+                portfolio['failed_customers'] += 1
+                continue
+
+            portfolio['customers'] += 1
+            for key, value in item['summary'].items():
+                portfolio[key] += value
+
+        return portfolio
+
+    def data_version(self, resource, customer_id, start_date=None, end_date=None, fields=None):
+        """Version of a campaign_performance, lead_insights or geographic_performance result, without fetching it.
+
+        Names the result cache entry get_<resource>(customer_id, start_date,
+        end_date, fields=fields) would serve and when it was fetched; None
+        without a cache or when that entry is not cached and fresh.
+        """
+        if self.cache is None:
+            return None
+
+        build_query, schema, date_field = {
+            'campaign_performance': (self._campaign_performance_query, CAMPAIGN_PERFORMANCE_SCHEMA, 'date'),
+            'lead_insights': (self._lead_insights_query, LEAD_INSIGHTS_SCHEMA, 'timing.date'),
+            'geographic_performance': (self._geographic_performance_query, GEOGRAPHIC_SCHEMA, None)
+        }[resource]
+        if fields:
+            schema = schema.project(set(fields) | ({date_field} if date_field else set()))
+
+        key = self.cache.make_key(self._scoped(customer_id), build_query(start_date, end_date, schema.gaql_fields), (start_date, end_date))
+        fetched_at = self.cache.version(resource, key)
+        return None if fetched_at is None else f"{key}@{fetched_at!r}"
+
+    def _fetch(self, resource, customer_id, query, convert, date_window=None):
+        """Fetch all rows for a query, going through the result cache when configured.
+
+        convert is either a row converter, giving a list of rows, or a
+        RowSchema, giving a ColumnarRows.
+        """
+        def fetch():
+            return self._collect(customer_id, query, convert)
+
+        return self._cached(resource, customer_id, query, date_window, fetch)
+
+    def _collect(self, customer_id, query, convert):
+        """Run a query and convert all of its rows."""
+        if isinstance(convert, RowSchema):
+            if not self.is_initialized():
+                raise Exception("Client is not initialized")
+            rows = self._search_rows(customer_id, query)
+            return convert.collect(rows) if self.use_proto_plus else convert.collect_raw(rows)
+
+        return list(self._stream(customer_id, query, convert))
+
+    def _fetch_days(self, resource, customer_id, start_date, end_date, build_query, schema, date_field, fields=None, reverse=False):
+        """Fetch a segments.date-segmented resource, syncing only unsettled days when a DayPartitionSync is configured.
+
+        A projection (fields) always keeps date_field and is synced into its
+        own partitions, so a narrow fetch never stands in for a full one.
+        """
+        partition = resource
+        if fields:
+            schema = schema.project(set(fields) | {date_field})
+            partition = f"{resource}[{','.join(schema.fields)}]"
+
+        query = build_query(start_date, end_date, schema.gaql_fields)
+
+        if self.sync is None or not (start_date and end_date):
+            def fetch():
+                return self._collect(customer_id, query, schema)
+        else:
+            def fetch_range(range_start, range_end):
+                return self._collect(customer_id, build_query(range_start, range_end, schema.gaql_fields), schema)
+
+            def fetch():
+                return self.sync.sync(partition, self._scoped(customer_id), start_date, end_date, fetch_range, date_field, reverse)
+
+        rows, fetched_at = self._cached(resource, customer_id, query, (start_date, end_date), fetch, timestamped=True)
+
+        # Every full-range result feeds the rollup cubes for days they do not have final yet,
+        # dated by when it was fetched: a cached result may predate a day's settlement, and
+        # one the cubes already rolled up (a cache hit) is skipped
+        if self.rollups is not None and start_date and end_date:
+            self.rollups.ingest(resource, self._scoped(customer_id), start_date, end_date, rows, fetched_at)
+
+        return rows
+
+    def _cached(self, resource, customer_id, query, date_window, fetch, timestamped=False):
+        """Serve fetch() through the result cache when one is configured.
+
+        Concurrent calls for the same customer, query and date window wait
+        on a single upstream fetch and share its result. With timestamped,
+        returns (result, fetched_at): when the result was fetched upstream,
+        which for a cached result can be well before this call.
+        """
         if not self.is_initialized():
             raise Exception("Client is not initialized")
-        
+
+        fetched_by = set()
+
+        def measured_fetch():
+            fetched_by.add(threading.get_ident())
+            return self._measured(resource, fetch)
+
+        def run():
+            if self.cache is None:
+                fetched_at = time.time()
+                return measured_fetch(), fetched_at
+
+            result = self.cache.get_or_fetch(
+                resource, self._scoped(customer_id), query, date_window, measured_fetch, timestamped=True
+            )
+            CACHE_REQUESTS.inc(fetcher=resource, result='miss' if threading.get_ident() in fetched_by else 'hit')
+            return result
+
+        started = time.perf_counter()
+        key = (resource, customer_id, ' '.join(query.split()), tuple(date_window or ()))
+        result, fetched_at = self.single_flight.do(key, run)
+        FETCH_SECONDS.observe(time.perf_counter() - started, fetcher=resource, phase='total')
+
+        return (result, fetched_at) if timestamped else result
+
+    def _measured(self, resource, fetch):
+        """Run fetch() and record its upstream time, conversion time and row count."""
+        self._timing.upstream = 0.0
+        started = time.perf_counter()
         try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            date_range = ""
-            if start_date and end_date:
-                date_range = f"AND segments.date BETWEEN '{start_date}' AND '{end_date}'"
-            
-            query = f"""
-                SELECT
-                    campaign.id,
-                    campaign.name,
-                    location_view.location_name,
-                    location_view.targeting_location_type,
-                    geographic_view.country_criterion_id,
-                    geographic_view.location_type,
-                    geographic_view.canonical_name,
-                    metrics.impressions,
-                    metrics.clicks,
-                    metrics.cost_micros,
-                    metrics.conversions,
-                    metrics.conversions_value
-                FROM geographic_view
-                WHERE campaign.advertising_channel_type = 'LOCAL_SERVICES'
-                {date_range}
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            geo_data = []
-            for row in response:
-                campaign = row.campaign
-                location = row.location_view
-                geo_view = row.geographic_view
-                metrics = row.metrics
-                
-                geo_data.append({
-                    'campaign': {
-                        'id': campaign.id,
-                        'name': campaign.name
-                    },
-                    'location': {
-                        'name': location.location_name,
-                        'targeting_type': location.targeting_location_type,
-                        'country_id': geo_view.country_criterion_id,
-                        'location_type': geo_view.location_type,
-                        'canonical_name': geo_view.canonical_name
-                    },
-                    'metrics': {
-                        'impressions': metrics.impressions,
-                        'clicks': metrics.clicks,
-                        'cost': metrics.cost_micros / 1000000,
-                        'conversions': metrics.conversions,
-                        'conversion_value': metrics.conversions_value
-                    }
-                })
-            
-            return geo_data
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
+            result = fetch()
+            elapsed = time.perf_counter() - started
+            upstream = self._timing.upstream
+        finally:
+            self._timing.upstream = None
 
-    def get_competitor_insights(self, customer_id):
-        """Get competitive insights and market position data."""
+        FETCH_SECONDS.observe(upstream, fetcher=resource, phase='upstream')
+        FETCH_SECONDS.observe(max(0.0, elapsed - upstream), fetcher=resource, phase='conversion')
+        FETCH_ROWS.observe(len(result), fetcher=resource)
+
+        return result
+
+    def _stream(self, customer_id, query, convert, batch_size=None):
+        """Run a query through search_stream and lazily convert its rows.
+
+        convert is a row converter or a RowSchema. Rows are yielded one at
+        a time, or as lists of at most batch_size rows when batch_size is
+        given.
+        """
         if not self.is_initialized():
             raise Exception("Client is not initialized")
-        
-        try:
-            ga_service = self.client.get_service("GoogleAdsService")
-            
-            query = """
-                SELECT
-                    campaign.id,
-                    campaign.name,
-                    campaign.optimization_score,
-                    campaign.optimization_score_weight,
-                    campaign.bidding_strategy_type,
-                    campaign.target_cpa.target_cpa_micros,
-                    campaign.local_services_campaign_settings.category_bids,
-                    metrics.search_impression_share,
-                    metrics.search_rank_lost_impression_share,
-                    metrics.search_budget_lost_impression_share,
-                    metrics.average_cpc,
-                    metrics.ctr,
-                    metrics.conversions,
-                    metrics.conversion_rate
-                FROM campaign
-                WHERE campaign.advertising_channel_type = 'LOCAL_SERVICES'
-            """
-            
-            response = ga_service.search(customer_id=customer_id, query=query)
-            
-            competitor_data = []
-            for row in response:
-                campaign = row.campaign
-                metrics = row.metrics
-                
-                competitor_data.append({
-                    'campaign_info': {
-                        'id': campaign.id,
-                        'name': campaign.name,
-                        'optimization_score': campaign.optimization_score,
-                        'optimization_weight': campaign.optimization_score_weight,
-                        'bidding_strategy': campaign.bidding_strategy_type,
-                        'target_cpa': campaign.target_cpa.target_cpa_micros / 1000000 if campaign.target_cpa else None,
-                        'category_bids': campaign.local_services_campaign_settings.category_bids
-                    },
-                    'market_metrics': {
-                        'impression_share': metrics.search_impression_share,
-                        'rank_lost_share': metrics.search_rank_lost_impression_share,
-                        'budget_lost_share': metrics.search_budget_lost_impression_share,
-                        'avg_cpc': metrics.average_cpc / 1000000,
-                        'ctr': metrics.ctr,
-                        'conversions': metrics.conversions,
-                        'conversion_rate': metrics.conversion_rate
-                    }
-                })
-            
-            return competitor_data
-            
-        except GoogleAdsException as ex:
-            self._handle_error(ex)
-
-    def _build_date_condition(self, query_type, start_date=None, end_date=None):
-        """Build date condition for query based on query type."""
+
+        if isinstance(convert, RowSchema):
+            convert = convert.record if self.use_proto_plus else convert.record_raw
+        elif not self.use_proto_plus:
+            # Hand-written converters expect proto-plus rows; wrapping a raw row does not copy it
+            row_converter = convert
+            convert = lambda row: row_converter(proto_plus_row(row))
+
+        rows = (convert(row) for row in self._search_rows(customer_id, query))
+        if batch_size:
+            return self._batched(rows, batch_size)
+        return rows
+
+    def _service(self, name):
+        """Return the cached service stub for name, creating it on first use."""
+        service = self._services.get(name)
+        if service is None:
+            with self._services_lock:
+                service = self._services.get(name)
+                if service is None:
+                    service = self._services[name] = self.client.get_service(name)
+        return service
+
+    def _scoped(self, customer_id):
+        """The customer ID as stored in the cache and partition store."""
+        if self.tenant is None:
+            return customer_id
+        return f"{self.tenant}/{customer_id}"
+
+    def _search_rows(self, customer_id, query):
+        """Yield raw API rows for a query, surfacing API errors as exceptions.
+
+        With an UpstreamGuard, every attempt is rate limited and checked
+        against the circuit breaker, and errors raised before the first
+        batch arrives are retried with backoff.
+        """
+        developer_token = (self.credentials or {}).get('developer_token')
+        attempt = 0
+
+        while True:
+            if self.guard is not None:
+                self.guard.before_call(developer_token, customer_id)
+
+            started = False
+            try:
+                waiting = time.perf_counter()
+                ga_service = self._service("GoogleAdsService")
+                batches = iter(ga_service.search_stream(customer_id=customer_id, query=query))
+
+                while True:
+                    batch = next(batches, None)
+                    self._add_upstream_time(time.perf_counter() - waiting)
+                    if batch is None:
+                        break
+
+                    started = True
+                    yield from batch.results
+                    waiting = time.perf_counter()
+
+            except google_ads_exception() as ex:
+                for code in error_codes(ex):
+                    UPSTREAM_ERRORS.inc(code=code)
+
+                if self.guard is None:
+                    self._handle_error(ex)
+
+                delay = self.guard.on_error(developer_token, ex, attempt, retryable=not started)
+                if delay is None:
+                    self._handle_error(ex)
+
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if self.guard is not None:
+                self.guard.on_success(developer_token)
+            return
+
+    def _add_upstream_time(self, seconds):
+        """Add API wait time to the fetch being measured on this thread, if any."""
+        if getattr(self._timing, 'upstream', None) is not None:
+            self._timing.upstream += seconds
+
+    def _batched(self, rows, batch_size):
+        """Group an iterator of rows into lists of at most batch_size rows."""
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _date_range(self, query_type, start_date=None, end_date=None):
+        """Resolve a query type to a (start, end) date pair, or (None, None) for no date filtering."""
         today = datetime.now().date()
-        
+
         if query_type == 'custom' and start_date and end_date:
-            return f"lead.creation_date_time BETWEEN '{start_date}' AND '{end_date}'"
-        
+            return start_date, end_date
+
         date_ranges = {
             'today': (today, today),
             'yesterday': (today - timedelta(days=1), today - timedelta(days=1)),
             'this_week': (today - timedelta(days=today.weekday()), today),
             'this_month': (today.replace(day=1), today)
         }
-        
-        if query_type in date_ranges:
-            start, end = date_ranges[query_type]
-            return f"lead.creation_date_time BETWEEN '{start}' AND '{end}'"
-            
-        return "TRUE"  # Default to no date filtering
+
+        return date_ranges.get(query_type, (None, None))
 
     def _calculate_statistics(self, leads):
         """Calculate various statistics from lead data."""
-        if not leads:
-            return {}
-            
-        df = pd.DataFrame(leads)
-        
-        stats = {
-            'total_leads': len(leads),
-            'total_cost': df['cost'].sum(),
-            'total_conversions': df['conversions'].sum(),
-            'lead_types': df['type'].value_counts().to_dict(),
-            'lead_status': df['status'].value_counts().to_dict(),
-            'categories': df['category'].value_counts().to_dict(),
-            'credit_states': df['credit_state'].value_counts().to_dict()
-        }
-        
-        if stats['total_leads'] > 0:
-            stats['avg_cost_per_lead'] = stats['total_cost'] / stats['total_leads']
-            stats['conversion_rate'] = (stats['total_conversions'] / stats['total_leads']) * 100
-        
-        return stats
+        return lead_metrics(leads, LEAD_STATISTICS_FIELDS)
 
     def _handle_error(self, ex):
         """Handle Google Ads API exceptions."""
         error_message = []
-        
+
         for error in ex.failure.errors:
             error_message.append(f"Error: {error.message}")
             if error.location:
                 for field_path_element in error.location.field_path_elements:
                     error_message.append(f"\tField: {field_path_element.field_name}")
-        
+
         raise Exception(' '.join(error_message))
@@ -0,0 +1,44 @@
+import threading
+
+from .google_ads_client import LEAD_CONVERSATIONS_CHUNK_SIZE
+
+
+class LeadConversationLoader:
+    """Batch and memoize lead conversation lookups for one customer, in the style of DataLoader.
+
+    Create one per request. load_many() fetches every lead it has not
+    seen yet with batched IN queries (one per chunk_size leads), and
+    remembers the result, so views that need conversations for a page of
+    leads make one or a few round trips instead of one per lead.
+    """
+
+    def __init__(self, client, customer_id, chunk_size=LEAD_CONVERSATIONS_CHUNK_SIZE):
+        self.client = client
+        self.customer_id = customer_id
+        self.chunk_size = chunk_size
+        self.stats = {'requested': 0, 'fetched': 0}
+
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    def load(self, lead_id):
+        """Conversations for one lead."""
+        return self.load_many([lead_id])[str(lead_id)]
+
+    def load_many(self, lead_ids):
+        """{lead_id: [conversation, ...]} for every lead in lead_ids."""
+        lead_ids = [str(lead_id) for lead_id in lead_ids]
+
+        with self._lock:
+            missing = [lead_id for lead_id in dict.fromkeys(lead_ids) if lead_id not in self._memo]
+            self.stats['requested'] += len(lead_ids)
+            if missing:
+                self._memo.update(self.client.get_conversations_by_lead(self.customer_id, missing, self.chunk_size))
+                self.stats['fetched'] += len(missing)
+
+            return {lead_id: self._memo[lead_id] for lead_id in lead_ids}
+
+    def prime(self, lead_id, conversations):
+        """Remember conversations already fetched elsewhere for lead_id."""
+        with self._lock:
+            self._memo.setdefault(str(lead_id), conversations)
@@ -0,0 +1,68 @@
+import base64
+import heapq
+import json
+
+
+def encode_cursor(key):
+    """Opaque cursor for a (sort value, id) keyset position."""
+    return base64.urlsafe_b64encode(json.dumps(list(key), separators=(',', ':')).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, types=None):
+    """The (sort value, id) position in a cursor from encode_cursor.
+
+    types, when given, is the expected (sort value type, id type). Raises
+    ValueError for a malformed cursor or one whose values have other types.
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+    if not isinstance(key, list) or len(key) != 2:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+
+    # bool is an int subclass, but never a valid position
+    if types is not None and any(type(value) is bool or not isinstance(value, kind) for value, kind in zip(key, types)):
+        raise ValueError(f"Invalid cursor for this sort order: {cursor!r}")
+    return tuple(key)
+
+
+def comparable(value):
+    """Sort and filter form of a field value: enum names for enums, strings otherwise."""
+    return getattr(value, 'name', str(value))
+
+
+def keyset_page(rows, sort_field, id_field, limit, cursor=None, descending=True, filters=None):
+    """One page of a ColumnarRows ordered by (sort_field, id_field), after the cursor's position.
+
+    filters maps a field to the set of accepted values (compared by
+    comparable). Only the rows past the cursor are considered and only
+    the page is ordered, with a bounded heap, so deep pages cost one scan
+    and no full sort. Returns (page ColumnarRows, next cursor or None,
+    number of rows matching the filters).
+    """
+    sort_values = rows.column(sort_field)
+    ids = rows.column(id_field)
+    filters = {field: (rows.column(field), accepted) for field, accepted in (filters or {}).items()}
+    # Positions compare with (comparable(sort value), id) keys, so a cursor must hold the same types
+    id_type = next((type(value) for value in ids if value is not None), None)
+    after = decode_cursor(cursor, (str, id_type) if id_type else None) if cursor else None
+
+    matched = 0
+    candidates = []
+    for index in range(len(rows)):
+        if any(comparable(column[index]) not in accepted for column, accepted in filters.values()):
+            continue
+        matched += 1
+
+        key = (comparable(sort_values[index]), ids[index])
+        if after is not None and (key >= after if descending else key <= after):
+            continue
+        candidates.append((key, index))
+
+    select = heapq.nlargest if descending else heapq.nsmallest
+    page = select(limit + 1, candidates)
+
+    next_cursor = encode_cursor(page[limit - 1][0]) if len(page) > limit else None
+    return rows.take([index for _, index in page[:limit]]), next_cursor, matched
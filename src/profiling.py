@@ -0,0 +1,296 @@
+import contextvars
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+
+MODES = ('cpu', 'memory')
+REQUEST_ID = re.compile(r'^[0-9a-f]{32}$')
+
+_current = contextvars.ContextVar('request_profile', default=None)
+_memory_lock = threading.Lock()
+
+
+def bind(fn):
+    """Wrap fn so that, when called on another thread, it is profiled as part of the current request.
+
+    Returns fn unchanged when the current request is not being profiled.
+    """
+    profile = _current.get()
+    if profile is None:
+        return fn
+
+    @wraps(fn)
+    def profiled(*args, **kwargs):
+        token = _current.set(profile)
+        try:
+            with profile.attached():
+                return fn(*args, **kwargs)
+        finally:
+            _current.reset(token)
+
+    return profiled
+
+
+class RequestProfile:
+    """Profile of one request across its own thread and the worker threads it fans out to.
+
+    cpu runs cProfile on every participating thread (merged into one
+    function table) and samples their stacks into collapsed-stack counts
+    for flame graphs. memory diffs tracemalloc snapshots taken around the
+    request; tracemalloc is process wide, so only one memory profile runs
+    at a time and it includes allocations made by concurrent requests.
+    """
+
+    def __init__(self, request_id, modes, sample_interval=0.005, memory_frames=10, top=40):
+        self.request_id = request_id
+        self.modes = [mode for mode in MODES if mode in modes]
+        self.sample_interval = sample_interval
+        self.memory_frames = memory_frames
+        self.top = top
+        self.notes = []
+
+        self._lock = threading.Lock()
+        self._threads = {}
+        self._stats = None
+        self._stacks = Counter()
+        self._samples = 0
+        self._stop = threading.Event()
+        self._sampler = None
+        self._snapshot = None
+        self._started_tracing = False
+
+    def start(self):
+        """Start profiling the calling thread."""
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+
+        if 'memory' in self.modes:
+            if _memory_lock.acquire(blocking=False):
+                self._started_tracing = not tracemalloc.is_tracing()
+                if self._started_tracing:
+                    tracemalloc.start(self.memory_frames)
+                tracemalloc.reset_peak()
+                self._snapshot = tracemalloc.take_snapshot()
+            else:
+                self.notes.append('memory: another memory profile was running')
+
+        _current.set(self)
+        self._request_thread = self._attach()
+
+        if 'cpu' in self.modes:
+            self._sampler = threading.Thread(target=self._sample, name='profile-sampler', daemon=True)
+            self._sampler.start()
+
+    def finish(self):
+        """Stop profiling and return the report."""
+        _current.set(None)
+        self._detach(self._request_thread)
+        duration = time.perf_counter() - self._started
+
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+
+        report = {
+            'request_id': self.request_id,
+            'started_at': self.started_at,
+            'duration_seconds': duration,
+            'modes': self.modes,
+            'notes': self.notes
+        }
+        if 'cpu' in self.modes:
+            report['sample_interval'] = self.sample_interval
+            report['samples'] = self._samples
+            report['collapsed'] = self.collapsed()
+            report['functions'] = self._function_table()
+        if self._snapshot is not None:
+            report['memory'] = self._memory_report()
+        return report
+
+    @contextmanager
+    def attached(self):
+        """Profile the calling thread until the block exits."""
+        state = self._attach()
+        try:
+            yield
+        finally:
+            self._detach(state)
+
+    def collapsed(self):
+        """Collapsed stacks ("root;...;leaf count" per line), as read by flamegraph.pl and speedscope."""
+        with self._lock:
+            stacks = sorted(self._stacks.items(), key=lambda item: -item[1])
+        return '\n'.join(f"{stack} {count}" for stack, count in stacks)
+
+    def _attach(self):
+        ident = threading.get_ident()
+        with self._lock:
+            self._threads[ident] = self._threads.get(ident, 0) + 1
+
+        profiler = None
+        if 'cpu' in self.modes and sys.getprofile() is None:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError as e:
+                # Interpreters where cProfile is process wide allow one profiler at a time
+                self.notes.append(f'cpu: {e}')
+                profiler = None
+        return ident, profiler
+
+    def _detach(self, state):
+        ident, profiler = state
+        if profiler is not None:
+            profiler.disable()
+            stats = pstats.Stats(profiler)
+            with self._lock:
+                if self._stats is None:
+                    self._stats = stats
+                else:
+                    self._stats.add(stats)
+
+        with self._lock:
+            self._threads[ident] -= 1
+            if not self._threads[ident]:
+                del self._threads[ident]
+
+    def _sample(self):
+        while not self._stop.wait(self.sample_interval):
+            with self._lock:
+                idents = list(self._threads)
+            frames = sys._current_frames()
+
+            stacks = []
+            for ident in idents:
+                frame = frames.get(ident)
+                if frame is not None:
+                    stacks.append(_collapse(frame))
+
+            with self._lock:
+                self._samples += 1
+                self._stacks.update(stacks)
+
+    def _function_table(self):
+        if self._stats is None:
+            return ''
+        out = io.StringIO()
+        self._stats.stream = out
+        self._stats.sort_stats('cumulative').print_stats(self.top)
+        return out.getvalue()
+
+    def _memory_report(self):
+        try:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            if self._started_tracing:
+                tracemalloc.stop()
+            _memory_lock.release()
+
+        # The profiler's own bookkeeping is not part of the request
+        ignore = [tracemalloc.Filter(False, module.__file__) for module in (tracemalloc, pstats, sys.modules[__name__])]
+        differences = snapshot.filter_traces(ignore).compare_to(self._snapshot.filter_traces(ignore), 'traceback')
+        return {
+            'peak_bytes': peak,
+            'traced_bytes': current,
+            'top_allocations': [{
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff,
+                'size': stat.size,
+                'traceback': [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback]
+            } for stat in differences[:self.top] if stat.size_diff > 0]
+        }
+
+
+class ProfileStore:
+    """Bounded on-disk ring buffer of request profiles, one JSON file per request id.
+
+    Writing a profile beyond max_profiles deletes the oldest. Files are
+    written atomically, so several worker processes can share a directory.
+    """
+
+    def __init__(self, directory, max_profiles=50):
+        self.directory = directory
+        self.max_profiles = max_profiles
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, report):
+        path = self._path(report['request_id'])
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as f:
+            json.dump(report, f)
+        os.replace(temporary, path)
+        self._prune()
+
+    def get(self, request_id):
+        """The stored report for request_id, or None."""
+        if not REQUEST_ID.match(request_id):
+            return None
+        try:
+            with open(self._path(request_id)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def list(self):
+        """Summaries of the stored profiles, newest first."""
+        summaries = []
+        for path in self._files():
+            try:
+                with open(path) as f:
+                    report = json.load(f)
+            except (OSError, ValueError):
+                continue
+            summaries.append({
+                key: report.get(key)
+                for key in ('request_id', 'started_at', 'duration_seconds', 'modes', 'method', 'path', 'route', 'status')
+            })
+        return summaries
+
+    def _files(self):
+        paths = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json') and REQUEST_ID.match(name[:-5]):
+                path = os.path.join(self.directory, name)
+                try:
+                    paths.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        return [path for _, path in sorted(paths, reverse=True)]
+
+    def _prune(self):
+        for path in self._files()[self.max_profiles:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _path(self, request_id):
+        return os.path.join(self.directory, f"{request_id}.json")
+
+
+def parse_modes(value):
+    """Profile modes from a header or query value: 'cpu', 'memory', 'cpu,memory', or '1'/'all' for both."""
+    value = (value or '').strip().lower()
+    if value in ('1', 'true', 'all'):
+        return list(MODES)
+    return [mode for mode in MODES if mode in value.replace(' ', '').split(',')]
+
+
+def _collapse(frame):
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ';'.join(reversed(names))
@@ -0,0 +1,117 @@
+import re
+import threading
+from datetime import date, datetime
+
+PLACEHOLDER = re.compile(r'\{(\w+):(\w+)\}')
+DATE_VALUE = re.compile(r'^\d{4}-\d{2}-\d{2}( \d{2}:\d{2}:\d{2})?$')
+ENUM_VALUE = re.compile(r'^[A-Z][A-Z0-9_]*$')
+FIELD_NAME = re.compile(r'^[a-z_]+(\.[a-z_]+)+$')
+
+
+def gaql_literal(value, kind):
+    """Render a parameter value as an escaped GAQL literal of the given kind.
+
+    Kinds: 'date' (YYYY-MM-DD, optionally with a time), 'enum' (an
+    UPPER_CASE enum name), 'int' and 'string', or any of them with a
+    '_list' suffix for a non-empty list rendered as an IN list. Raises
+    ValueError for values that do not match their kind.
+    """
+    if kind.endswith('_list'):
+        if isinstance(value, (str, bytes)) or not value:
+            raise ValueError(f"Invalid list value: {value!r}")
+        return f"({', '.join(gaql_literal(item, kind[:-5]) for item in value)})"
+
+    if kind == 'date':
+        if isinstance(value, datetime):
+            value = value.strftime('%Y-%m-%d %H:%M:%S')
+        elif isinstance(value, date):
+            value = value.isoformat()
+        value = str(value)
+        if not DATE_VALUE.match(value):
+            raise ValueError(f"Invalid date value: {value!r}")
+        return f"'{value}'"
+
+    if kind == 'enum':
+        value = getattr(value, 'name', value)
+        if not isinstance(value, str) or not ENUM_VALUE.match(value):
+            raise ValueError(f"Invalid enum value: {value!r}")
+        return f"'{value}'"
+
+    if kind == 'int':
+        if isinstance(value, bool) or not str(value).lstrip('-').isdigit():
+            raise ValueError(f"Invalid integer value: {value!r}")
+        return str(int(value))
+
+    if kind == 'string':
+        escaped = str(value).replace('\\', '\\\\').replace("'", "\\'")
+        return f"'{escaped}'"
+
+    raise ValueError(f"Unknown parameter kind: {kind}")
+
+
+class GaqlQuery:
+    """A GAQL query template for one resource.
+
+    Conditions may contain typed placeholders such as
+    '{start_date:date}'; a condition is included only when all of its
+    parameters are given. The query text for each combination of
+    projected fields and active conditions is compiled once and cached,
+    so equal requests always produce identical GAQL.
+    """
+
+    def __init__(self, resource, fields, where=(), order_by=None, limit=None):
+        self.resource = resource
+        self.fields = tuple(fields)
+        self.where = tuple(where)
+        self.order_by = order_by
+        self.limit = limit
+
+        self._condition_params = tuple(tuple(PLACEHOLDER.findall(condition)) for condition in self.where)
+        self._compiled = {}
+        self._lock = threading.Lock()
+
+    def build(self, fields=None, **params):
+        """Render the query, selecting only fields (default: all) with params bound."""
+        fields = tuple(fields) if fields else self.fields
+        active = tuple(
+            index for index, condition_params in enumerate(self._condition_params)
+            if all(params.get(name) is not None for name, _ in condition_params)
+        )
+
+        template = self._compiled.get((fields, active))
+        if template is None:
+            template = self._compile(fields, active)
+
+        values = {}
+        for index in active:
+            for name, kind in self._condition_params[index]:
+                values[name] = gaql_literal(params[name], kind)
+
+        return template.format(**values)
+
+    def _compile(self, fields, active):
+        for field in fields:
+            if not FIELD_NAME.match(field):
+                raise ValueError(f"Invalid field name: {field!r}")
+
+        select = list(dict.fromkeys(fields))
+        if self.order_by:
+            order_field = self.order_by.split()[0]
+            if order_field not in select:
+                select.append(order_field)
+
+        parts = [f"SELECT {', '.join(select)}", f"FROM {self.resource}"]
+
+        conditions = [PLACEHOLDER.sub(r'{\1}', self.where[index]) for index in active]
+        if conditions:
+            parts.append(f"WHERE {' AND '.join(conditions)}")
+        if self.order_by:
+            parts.append(f"ORDER BY {self.order_by}")
+        if self.limit:
+            parts.append(f"LIMIT {int(self.limit)}")
+
+        template = ' '.join(parts)
+        with self._lock:
+            self._compiled[(fields, active)] = template
+
+        return template
@@ -0,0 +1,317 @@
+from itertools import chain
+
+
+class ColumnarRows:
+    """Column-oriented fetch result: one list of values per field.
+
+    Fields are dotted output paths such as 'lead_info.type'. Nested dict
+    records (the JSON view) and DataFrames are only built on demand, so
+    holding a large result costs one list slot per value instead of one
+    or more dicts per row.
+    """
+
+    __slots__ = ('fields', 'columns', '_paths')
+
+    def __init__(self, fields, columns=None):
+        self.fields = tuple(fields)
+        self.columns = columns if columns is not None else {field: [] for field in self.fields}
+        self._paths = tuple(tuple(field.split('.')) for field in self.fields)
+
+    def __len__(self):
+        if not self.fields:
+            return 0
+        return len(self.columns[self.fields[0]])
+
+    def __iter__(self):
+        """Yield each row as a nested dict."""
+        for values in zip(*(self.columns[field] for field in self.fields)):
+            yield build_record(self._paths, values)
+
+    def column(self, field):
+        """Return the list of values for one field."""
+        return self.columns[field]
+
+    def append(self, values):
+        """Append one row given its values in field order."""
+        for field, value in zip(self.fields, values):
+            self.columns[field].append(value)
+
+    def take(self, indices):
+        """Return a new ColumnarRows holding only the rows at indices."""
+        return ColumnarRows(
+            self.fields,
+            {field: [self.columns[field][index] for index in indices] for field in self.fields}
+        )
+
+    def map_values(self, fn):
+        """Return a new ColumnarRows with fn applied to every value."""
+        return ColumnarRows(
+            self.fields,
+            {field: [fn(value) for value in self.columns[field]] for field in self.fields}
+        )
+
+    def to_records(self):
+        """Return the rows as a list of nested dicts."""
+        return list(self)
+
+    def to_dataframe(self):
+        """Return the rows as a DataFrame with one column per dotted field."""
+        import pandas as pd
+        return pd.DataFrame(self.columns, columns=list(self.fields))
+
+    def normalize(self, dimensions):
+        """Move repeated entity attributes out of the rows into dimension tables.
+
+        dimensions maps a table name to (key field, attribute fields); a
+        None key means the attributes are the same for every row (e.g.
+        customer settings) and go out once. Attributes are taken from the
+        first row of each key. Tables whose key or attributes are not in
+        this result are skipped. Returns a NormalizedRows.
+        """
+        tables = {}
+        keys = {}
+        moved = set()
+        for name, (key, attributes) in dimensions.items():
+            attributes = [field for field in attributes if field in self.columns]
+            if not attributes or (key is not None and key not in self.columns):
+                continue
+
+            paths = [tuple(field.split('.')) for field in attributes]
+            columns = [self.columns[field] for field in attributes]
+            if key is None:
+                tables[name] = build_record(paths, [column[0] for column in columns]) if len(self) else {}
+            else:
+                first = {}
+                for index, value in enumerate(self.columns[key]):
+                    first.setdefault(value, index)
+                tables[name] = {value: build_record(paths, [column[index] for column in columns]) for value, index in first.items()}
+
+            keys[name] = key
+            moved.update(attributes)
+
+        fields = [field for field in self.fields if field not in moved]
+        return NormalizedRows(ColumnarRows(fields, {field: self.columns[field] for field in fields}), tables, keys, self.fields)
+
+    @classmethod
+    def concat(cls, parts):
+        """Concatenate ColumnarRows that share the same fields."""
+        parts = [part for part in parts if part.fields]
+        if not parts:
+            return cls(())
+
+        result = cls(parts[0].fields)
+        for part in parts:
+            for field in result.fields:
+                result.columns[field].extend(part.columns[field])
+
+        return result
+
+
+class NormalizedRows:
+    """Fact rows carrying only keys and metrics, plus the dimension tables built by ColumnarRows.normalize().
+
+    to_payload() is the JSON view: {'normalized': True, 'keys': {table:
+    key field}, 'dimensions': {table: {key: attributes}}, 'fields': [...],
+    'values': [one list per field]}. Rows go out column by column so
+    field names are not repeated either. A table with a None key holds
+    the attributes themselves.
+    """
+
+    __slots__ = ('rows', 'dimensions', 'keys', 'fields')
+
+    def __init__(self, rows, dimensions, keys, fields):
+        self.rows = rows
+        self.dimensions = dimensions
+        self.keys = keys
+        self.fields = tuple(fields)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def map_values(self, fn):
+        """Return a new NormalizedRows with fn applied to every row and dimension value."""
+        return NormalizedRows(
+            self.rows.map_values(fn),
+            {name: _map_record(table, fn, self.keys[name] is not None) for name, table in self.dimensions.items()},
+            self.keys,
+            self.fields
+        )
+
+    def to_payload(self):
+        return {
+            'normalized': True,
+            'keys': dict(self.keys),
+            'dimensions': self.dimensions,
+            'fields': list(self.rows.fields),
+            'values': [self.rows.columns[field] for field in self.rows.fields]
+        }
+
+    def denormalize(self):
+        """Rebuild the ColumnarRows this was normalized from."""
+        columns = dict(self.rows.columns)
+        for name, table in self.dimensions.items():
+            key = self.keys[name]
+            records = [table] * len(self.rows) if key is None else [table[value] for value in self.rows.columns[key]]
+            for field in self.fields:
+                if field not in columns and _has_path(records[0] if records else {}, field):
+                    path = field.split('.')
+                    columns[field] = [_get_path(record, path) for record in records]
+
+        for field in self.fields:
+            columns.setdefault(field, [])
+        return ColumnarRows(self.fields, columns)
+
+
+# Enum number -> name tables, built once per protobuf enum type
+_ENUM_NAMES = {}
+
+
+class RowSchema:
+    """Precompiled (output path, GAQL fields, accessor) triples used to convert API rows.
+
+    Accessors read proto-plus rows. For raw protobuf rows
+    (use_proto_plus=False) raw_accessors() compiles variants that map enum
+    numbers to their names and copy repeated fields into lists.
+    """
+
+    def __init__(self, fields):
+        fields = tuple(fields)
+        self.fields = tuple(path for path, _, _ in fields)
+        self.sources = {path: (source,) if isinstance(source, str) else tuple(source) for path, source, _ in fields}
+        self.accessors = tuple(accessor for _, _, accessor in fields)
+        self._entries = fields
+        self._paths = tuple(tuple(path.split('.')) for path in self.fields)
+        self._raw_accessors = {}
+
+    @property
+    def gaql_fields(self):
+        """The GAQL fields to SELECT to fill every output field, in order."""
+        return tuple(dict.fromkeys(source for path in self.fields for source in self.sources[path]))
+
+    def project(self, fields):
+        """Return a RowSchema limited to the given output fields, keeping schema order."""
+        if not fields:
+            return self
+
+        unknown = set(fields) - set(self.fields)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+        return RowSchema(entry for entry in self._entries if entry[0] in fields)
+
+    def raw_accessors(self, descriptor):
+        """Accessors for raw protobuf rows of the message type described by descriptor, compiled once per type."""
+        accessors = self._raw_accessors.get(descriptor.full_name)
+        if accessors is None:
+            accessors = self._raw_accessors[descriptor.full_name] = tuple(
+                _raw_accessor(accessor, _field_descriptor(descriptor, self.sources[path]))
+                for path, accessor in zip(self.fields, self.accessors)
+            )
+        return accessors
+
+    def record(self, row, accessors=None):
+        """Convert one API row into a nested dict."""
+        return build_record(self._paths, [accessor(row) for accessor in accessors or self.accessors])
+
+    def record_raw(self, row):
+        """Convert one raw protobuf API row into a nested dict."""
+        return self.record(row, self.raw_accessors(row.DESCRIPTOR))
+
+    def collect(self, rows, accessors=None):
+        """Convert API rows straight into a ColumnarRows without building per-row dicts."""
+        result = ColumnarRows(self.fields)
+        pairs = tuple(zip([result.columns[field].append for field in self.fields], accessors or self.accessors))
+
+        for row in rows:
+            for append, accessor in pairs:
+                append(accessor(row))
+
+        return result
+
+    def collect_raw(self, rows):
+        """collect() for raw protobuf rows, compiling accessors for the row type of the first row."""
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return ColumnarRows(self.fields)
+
+        return self.collect(chain((first,), rows), self.raw_accessors(first.DESCRIPTOR))
+
+
+def build_record(paths, values):
+    """Build a nested dict from split dotted paths and their values."""
+    record = {}
+    for path, value in zip(paths, values):
+        target = record
+        for key in path[:-1]:
+            target = target.setdefault(key, {})
+        target[path[-1]] = value
+
+    return record
+
+
+def _field_descriptor(descriptor, sources):
+    """The FieldDescriptor an output field reads, when it reads exactly one GAQL field."""
+    if len(sources) != 1:
+        return None
+
+    field = None
+    for name in sources[0].split('.'):
+        if descriptor is None:
+            return None
+        field = descriptor.fields_by_name.get(name)
+        if field is None:
+            return None
+        descriptor = field.message_type
+
+    return field
+
+
+def _raw_accessor(accessor, field):
+    """Wrap a proto-plus accessor so it returns the same values when reading a raw protobuf row."""
+    if field is None:
+        return accessor
+
+    repeated = field.is_repeated if hasattr(field, 'is_repeated') else field.label == field.LABEL_REPEATED
+
+    if field.enum_type is not None:
+        names = _ENUM_NAMES.get(field.enum_type.full_name)
+        if names is None:
+            names = _ENUM_NAMES[field.enum_type.full_name] = {value.number: value.name for value in field.enum_type.values}
+        lookup = names.get
+
+        if repeated:
+            return lambda row: [lookup(value, value) for value in accessor(row)]
+
+        def enum_accessor(row):
+            value = accessor(row)
+            return lookup(value, value)
+
+        return enum_accessor
+
+    if repeated:
+        return lambda row: list(accessor(row))
+
+    return accessor
+
+
+def _map_record(value, fn, keyed=False):
+    if keyed:
+        return {fn(key): _map_record(record, fn) for key, record in value.items()}
+    if isinstance(value, dict):
+        return {key: _map_record(item, fn) for key, item in value.items()}
+    return fn(value)
+
+
+def _get_path(record, path):
+    for key in path:
+        record = record[key]
+    return record
+
+
+def _has_path(record, field):
+    for key in field.split('.'):
+        if not isinstance(record, dict) or key not in record:
+            return False
+        record = record[key]
+    return True
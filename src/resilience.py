@@ -0,0 +1,241 @@
+import math
+import random
+import threading
+import time
+
+THROTTLED_QUOTA_ERRORS = ('RESOURCE_EXHAUSTED', 'RESOURCE_TEMPORARILY_EXHAUSTED')
+TRANSIENT_INTERNAL_ERRORS = ('INTERNAL_ERROR', 'TRANSIENT_ERROR', 'DEADLINE_EXCEEDED')
+TRANSIENT_STATUS_CODES = ('UNAVAILABLE', 'DEADLINE_EXCEEDED', 'INTERNAL')
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while its circuit breaker is open."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Google Ads API is throttling requests; retry in {math.ceil(retry_after)} seconds")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at rate tokens per second, holding at most burst tokens."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available. Returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Reserve the token now so concurrent callers queue up behind each other
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+class CircuitBreaker:
+    """Fail fast while the API is throttling.
+
+    Opens after failure_threshold consecutive throttled calls, or at once
+    when the API asks for a longer pause than reset_timeout, and stays
+    open for reset_timeout seconds or the API's suggested delay, whichever
+    is longer. The first throttled call after it reopens trips it again.
+    """
+
+    def __init__(self, failure_threshold=3, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._open_until = 0
+        self._half_open = False
+        self._lock = threading.Lock()
+
+    def check(self):
+        """Raise CircuitOpenError while the breaker is open."""
+        remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            raise CircuitOpenError(remaining)
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._half_open = False
+
+    def record_throttle(self, retry_delay=None):
+        """Count a throttled call; returns True when this opened the breaker."""
+        with self._lock:
+            self._failures += 1
+            long_pause = retry_delay is not None and retry_delay > self.reset_timeout
+            if not (self._half_open or long_pause or self._failures >= self.failure_threshold):
+                return False
+
+            self._open_until = time.monotonic() + max(self.reset_timeout, retry_delay or 0)
+            self._failures = 0
+            self._half_open = True
+            return True
+
+    def is_open(self):
+        return self._open_until > time.monotonic()
+
+
+class UpstreamGuard:
+    """Pacing, retry and circuit breaking shared by every client calling the Google Ads API.
+
+    Calls are paced by one token bucket per developer token and one per
+    customer. Failed calls are retried with jittered exponential backoff,
+    never sooner than the retry delay the API suggests, and a circuit
+    breaker per developer token fails fast while quota is exhausted.
+    """
+
+    def __init__(self, developer_rate=10, developer_burst=20, customer_rate=2, customer_burst=5,
+                 max_attempts=4, base_delay=1, max_delay=30, breaker_threshold=3, breaker_reset=30):
+        self.developer_rate = developer_rate
+        self.developer_burst = developer_burst
+        self.customer_rate = customer_rate
+        self.customer_burst = customer_burst
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self.stats = {
+            'calls': 0, 'retries': 0, 'throttled': 0, 'rejected': 0,
+            'breaker_trips': 0, 'paced': 0, 'paced_seconds': 0.0
+        }
+
+        self._lock = threading.Lock()
+        self._developer_buckets = {}
+        self._customer_buckets = {}
+        self._breakers = {}
+
+    def before_call(self, developer_token, customer_id):
+        """Fail fast if the developer token's breaker is open, otherwise wait for both rate limits."""
+        try:
+            self._breaker(developer_token).check()
+        except CircuitOpenError:
+            self.stats['rejected'] += 1
+            raise
+
+        waited = self._bucket(self._developer_buckets, developer_token, self.developer_rate, self.developer_burst).acquire()
+        waited += self._bucket(self._customer_buckets, customer_id, self.customer_rate, self.customer_burst).acquire()
+
+        self.stats['calls'] += 1
+        if waited:
+            self.stats['paced'] += 1
+            self.stats['paced_seconds'] += waited
+
+    def on_success(self, developer_token):
+        self._breaker(developer_token).record_success()
+
+    def on_error(self, developer_token, ex, attempt, retryable=True):
+        """Record a failed call and return the seconds to wait before retrying it, or None to give up.
+
+        retryable should be False once rows have already been handed to
+        the caller, since a retry would repeat them. Gives up as well while
+        the developer token's breaker is open, including when this error
+        opened it, so the caller fails fast instead of sleeping into it.
+        """
+        transient, throttled, retry_delay = error_details(ex)
+        breaker = self._breaker(developer_token)
+
+        if throttled:
+            self.stats['throttled'] += 1
+            if breaker.record_throttle(retry_delay):
+                self.stats['breaker_trips'] += 1
+
+        if breaker.is_open():
+            return None
+        if not (retryable and transient) or attempt + 1 >= self.max_attempts:
+            return None
+        if retry_delay is not None and retry_delay > self.max_delay:
+            return None
+
+        self.stats['retries'] += 1
+        return self.backoff(attempt, retry_delay)
+
+    def backoff(self, attempt, retry_delay=None):
+        """Full-jitter exponential backoff, or the API's retry delay plus jitter when it gave one."""
+        if retry_delay:
+            return retry_delay + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _breaker(self, developer_token):
+        breaker = self._breakers.get(developer_token)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    developer_token, CircuitBreaker(self.breaker_threshold, self.breaker_reset)
+                )
+        return breaker
+
+    def _bucket(self, buckets, key, rate, burst):
+        bucket = buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = buckets.setdefault(key, TokenBucket(rate, burst))
+        return bucket
+
+
+def error_details(ex):
+    """Classify a GoogleAdsException as (transient, throttled, retry_delay_seconds or None)."""
+    transient = throttled = False
+    retry_delay = None
+
+    code = getattr(getattr(ex, 'error', None), 'code', None)
+    status = getattr(code(), 'name', None) if callable(code) else None
+    if status == 'RESOURCE_EXHAUSTED':
+        transient = throttled = True
+    elif status in TRANSIENT_STATUS_CODES:
+        transient = True
+
+    failure = getattr(ex, 'failure', None)
+    for error in getattr(failure, 'errors', None) or ():
+        error_code = error.error_code
+        if _enum_name(getattr(error_code, 'quota_error', None)) in THROTTLED_QUOTA_ERRORS:
+            transient = throttled = True
+        if _enum_name(getattr(error_code, 'internal_error', None)) in TRANSIENT_INTERNAL_ERRORS:
+            transient = True
+
+        delay = _seconds(error.details.quota_error_details.retry_delay)
+        if delay:
+            retry_delay = max(retry_delay or 0, delay)
+
+    return transient, throttled, retry_delay
+
+
+def error_codes(ex):
+    """Names of a GoogleAdsException's error codes, e.g. 'quota_error.RESOURCE_EXHAUSTED'."""
+    codes = []
+    failure = getattr(ex, 'failure', None)
+    for error in getattr(failure, 'errors', None) or ():
+        error_code = error.error_code
+        message = type(error_code).pb(error_code) if hasattr(type(error_code), 'pb') else error_code
+        field = message.WhichOneof('error_code')
+        if field:
+            codes.append(f"{field}.{_enum_name(getattr(error_code, field))}")
+
+    if not codes:
+        code = getattr(getattr(ex, 'error', None), 'code', None)
+        codes.append(getattr(code(), 'name', 'UNKNOWN') if callable(code) else 'UNKNOWN')
+
+    return codes
+
+
+def _enum_name(value):
+    return getattr(value, 'name', value)
+
+
+def _seconds(duration):
+    """Seconds in a Duration, whether proto-plus marshalled it to a timedelta or not."""
+    if hasattr(duration, 'total_seconds'):
+        return duration.total_seconds()
+    return duration.seconds + duration.nanos / 1e9
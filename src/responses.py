@@ -0,0 +1,91 @@
+import enum
+import gzip
+import hashlib
+import json
+
+from .records import ColumnarRows, NormalizedRows
+from .serialization import to_plain
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed
+MIN_COMPRESS_BYTES = 1024
+
+
+def json_default(value):
+    """Encode values the serializer has no native form for: rows, enums (by name), proto messages and timestamps."""
+    if isinstance(value, NormalizedRows):
+        return to_plain(value).to_payload()
+    if isinstance(value, ColumnarRows):
+        return to_plain(value).to_records()
+    if isinstance(value, enum.Enum):
+        return value.name
+
+    # Timestamps (including proto-plus DatetimeWithNanoseconds) as ISO 8601, messages as dicts
+    return to_plain(value)
+
+
+def dumps(value, sort_keys=False, indent=False):
+    """Serialize value to JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=json_default, option=option)
+
+    return json.dumps(
+        value, default=json_default, sort_keys=sort_keys, indent=2 if indent else None,
+        separators=None if indent else (',', ':'), ensure_ascii=False
+    ).encode('utf-8')
+
+
+def loads(data):
+    """Parse JSON from bytes or str, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def strong_etag(body):
+    """Strong entity tag for a response body: the same bytes always give the same tag."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def negotiate_encoding(accept_encoding):
+    """The best content coding both sides support ('br', 'gzip' or None) for an Accept-Encoding header."""
+    accepted = {}
+    for item in (accept_encoding or '').split(','):
+        name, _, params = item.strip().partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+
+    candidates = (['br'] if brotli is not None else []) + ['gzip']
+    wildcard = accepted.get('*', 0.0)
+    ranked = [(accepted.get(name, wildcard), -index, name) for index, name in enumerate(candidates)]
+    quality, _, name = max(ranked)
+    return name if quality > 0 else None
+
+
+def compress(body, encoding, level=None):
+    """Compress body with a coding from negotiate_encoding."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=5 if level is None else level)
+    return gzip.compress(body, compresslevel=6 if level is None else level, mtime=0)
@@ -0,0 +1,284 @@
+import hashlib
+import secrets
+import threading
+import time
+
+from .serialization import decode_rows, encode_rows, to_plain
+from .storage import connect
+
+
+class ResultCache:
+    """On-disk SQLite cache for fetcher results.
+
+    Results are stored column-oriented (one list of values per field) and
+    compressed. Entries are keyed by customer ID, normalized GAQL text and
+    date window, expire after a per-resource TTL and are evicted least
+    recently used first once the cache grows past max_bytes.
+
+    The database is shared by every worker process using the same path.
+    A miss takes a lease on its key first, so of all the processes and
+    threads missing the same entry only the lease holder calls upstream;
+    the others wait for its result.
+    """
+
+    DEFAULT_TTLS = {
+        'lead_statistics': 300,
+        'lead_insights': 300,
+        'detailed_lead_data': 300,
+        'lead_conversations': 300,
+        'lead_conversations_detailed': 300,
+        'campaign_performance': 900,
+        'geographic_performance': 900,
+        'competitor_insights': 3600,
+        'campaign_data': 3600,
+        'verification_artifacts': 3600,
+        'employee_data': 86400,
+        'employees': 86400
+    }
+
+    def __init__(self, path, max_bytes=256 * 1024 * 1024, default_ttl=600, ttls=None, stale_ttl=3600,
+                 lease_timeout=60, poll_interval=0.05):
+        """Open (or create) the cache database at path.
+
+        Entries older than their TTL but younger than TTL + stale_ttl are
+        served immediately while a background refresh replaces them. A
+        fetch lease not released within lease_timeout seconds (its holder
+        died) can be taken over; waiters check every poll_interval seconds.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(self.DEFAULT_TTLS, **(ttls or {}))
+        self.stale_ttl = stale_ttl
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self.stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'shared_fetches': 0, 'evictions': 0}
+
+        self._lock = threading.Lock()
+        self._refreshing = set()
+
+        self._conn = connect(path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                resource TEXT NOT NULL,
+                customer_id TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                payload BLOB NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at)")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS leases (
+                key TEXT PRIMARY KEY,
+                holder TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def ttl_for(self, resource):
+        """Return the freshness TTL in seconds for a resource."""
+        return self.ttls.get(resource, self.default_ttl)
+
+    def make_key(self, customer_id, query, date_window=None):
+        """Build a stable cache key from customer ID, normalized query and date window."""
+        normalized_query = ' '.join(query.split())
+        start_date, end_date = date_window or (None, None)
+        raw = f"{customer_id}|{normalized_query}|{start_date}|{end_date}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, resource, key):
+        """Return (rows, is_fresh) for a cached entry, or None when missing or expired."""
+        entry = self._entry(resource, key)
+        return None if entry is None else entry[:2]
+
+    def _entry(self, resource, key):
+        """Return (rows, is_fresh, created_at) for a cached entry, or None when missing or expired."""
+        with self._lock:
+            entry = self._conn.execute(
+                "SELECT created_at, payload FROM results WHERE key = ?", (key,)
+            ).fetchone()
+
+            if entry is None:
+                return None
+
+            created_at, payload = entry
+            age = time.time() - created_at
+            ttl = self.ttl_for(resource)
+
+            if age > ttl + self.stale_ttl:
+                return None
+
+            self._conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+
+        return decode_rows(payload), age <= ttl, created_at
+
+    def version(self, resource, key):
+        """When the entry for key was fetched, or None unless it is cached and fresh. Reads no payload."""
+        with self._lock:
+            entry = self._conn.execute("SELECT created_at FROM results WHERE key = ?", (key,)).fetchone()
+
+        if entry is None or time.time() - entry[0] > self.ttl_for(resource):
+            return None
+        return entry[0]
+
+    def set(self, resource, key, customer_id, rows, fetched_at=None):
+        """Store rows for a key and evict old entries if the cache is over budget.
+
+        fetched_at (default: now) is when the rows were fetched; it dates the entry.
+        """
+        payload = encode_rows(rows)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, resource, str(customer_id), fetched_at or now, now, len(payload), payload)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def get_or_fetch(self, resource, customer_id, query, date_window, fetch, timestamped=False):
+        """Serve rows from the cache, calling fetch() on a miss.
+
+        Stale entries are returned as-is and refreshed in the background.
+        Fresh results are normalized to plain types so cached and uncached
+        responses look the same. With timestamped, returns (rows, fetched_at),
+        fetched_at being the time.time() at which the rows were fetched.
+        """
+        key = self.make_key(customer_id, query, date_window)
+        rows, fetched_at = self._get_or_fetch(resource, key, customer_id, fetch)
+        return (rows, fetched_at) if timestamped else rows
+
+    def _get_or_fetch(self, resource, key, customer_id, fetch):
+        cached = self._entry(resource, key)
+
+        if cached is not None:
+            rows, is_fresh, fetched_at = cached
+            if is_fresh:
+                self.stats['hits'] += 1
+            else:
+                self.stats['stale_hits'] += 1
+                self._refresh_in_background(resource, key, customer_id, fetch)
+            return rows, fetched_at
+
+        # Another worker may be fetching this entry already: wait for it rather than calling upstream too
+        lease = self._acquire_lease(key)
+        while lease is None:
+            cached = self._wait_for(resource, key)
+            if cached is not None:
+                self.stats['shared_fetches'] += 1
+                return cached
+            lease = self._acquire_lease(key)
+
+        try:
+            # The previous holder may have stored it between our lookup and the lease
+            cached = self._entry(resource, key)
+            if cached is not None and cached[1]:
+                self.stats['shared_fetches'] += 1
+                return cached[0], cached[2]
+
+            self.stats['misses'] += 1
+            fetched_at = time.time()
+            rows = to_plain(fetch())
+            self.set(resource, key, customer_id, rows, fetched_at)
+        finally:
+            self._release_lease(key, lease)
+        return rows, fetched_at
+
+    def invalidate(self, customer_id=None):
+        """Drop cached entries for one customer, or everything."""
+        with self._lock:
+            if customer_id is None:
+                self._conn.execute("DELETE FROM results")
+            else:
+                self._conn.execute("DELETE FROM results WHERE customer_id = ?", (str(customer_id),))
+            self._conn.commit()
+
+    def size(self):
+        """Return the total payload size of the cache in bytes."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def _refresh_in_background(self, resource, key, customer_id, fetch):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        # One refresh across all workers; the others keep serving the stale entry meanwhile
+        lease = self._acquire_lease(key)
+        if lease is None:
+            with self._lock:
+                self._refreshing.discard(key)
+            return
+
+        def refresh():
+            try:
+                fetched_at = time.time()
+                self.set(resource, key, customer_id, to_plain(fetch()), fetched_at)
+            except Exception as e:
+                print(f"Error refreshing cached {resource}: {str(e)}")
+            finally:
+                self._release_lease(key, lease)
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _acquire_lease(self, key):
+        """Take the fetch lease on key unless another live holder has it. Returns its token, or None."""
+        token = secrets.token_hex(8)
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                INSERT INTO leases VALUES (?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET holder = excluded.holder, expires_at = excluded.expires_at
+                WHERE leases.expires_at < ?
+                """,
+                (key, token, now + self.lease_timeout, now)
+            )
+            self._conn.commit()
+        return token if cursor.rowcount == 1 else None
+
+    def _release_lease(self, key, token):
+        with self._lock:
+            self._conn.execute("DELETE FROM leases WHERE key = ? AND holder = ?", (key, token))
+            self._conn.commit()
+
+    def _wait_for(self, resource, key):
+        """Poll for the entry another lease holder is fetching.
+
+        Returns (rows, fetched_at) once stored, or None when the lease was
+        released (or expired) without a fresh entry, so the caller should retry.
+        """
+        while True:
+            time.sleep(self.poll_interval)
+            cached = self._entry(resource, key)
+            if cached is not None and cached[1]:
+                return cached[0], cached[2]
+
+            with self._lock:
+                lease = self._conn.execute(
+                    "SELECT 1 FROM leases WHERE key = ? AND expires_at >= ?", (key, time.time())
+                ).fetchone()
+            if lease is None:
+                return None
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in self._conn.execute("SELECT key, size FROM results ORDER BY accessed_at").fetchall():
+            self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            self.stats['evictions'] += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
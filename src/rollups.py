@@ -0,0 +1,348 @@
+import threading
+import time
+from datetime import date
+
+from .aggregation import _label, _numeric, _ranked
+from .storage import connect
+from .sync_engine import as_date, day_range, day_runs, is_settled
+
+# Where each rolled-up field lives in the lead_insights and campaign_performance results
+LEAD_ROLLUP_FIELDS = {
+    'date': 'timing.date',
+    'hour': 'timing.hour',
+    'category_id': 'lead_info.category',
+    'lead_type': 'lead_info.type',
+    'lead_status': 'lead_info.status',
+    'charged': 'lead_info.charged',
+    'credit_state': 'lead_info.credit_state',
+    'cost': 'metrics.cost',
+    'conversions': 'metrics.conversions',
+    'conversion_value': 'metrics.conversion_value'
+}
+
+CAMPAIGN_ROLLUP_FIELDS = {
+    'date': 'date',
+    'campaign_id': 'campaign_id',
+    'impressions': 'metrics.impressions',
+    'clicks': 'metrics.clicks',
+    'cost': 'metrics.cost',
+    'conversions': 'metrics.conversions',
+    'conversion_value': 'metrics.conversion_value'
+}
+
+LEAD_DIMENSIONS = ('category_id', 'lead_type', 'lead_status', 'charged')
+DIMENSION_COLUMNS = LEAD_DIMENSIONS + ('credit_state', 'hour', 'campaign_id')
+LEAD_MEASURES = ('cost', 'conversions', 'conversion_value')
+CAMPAIGN_MEASURES = ('impressions', 'clicks', 'cost', 'conversions', 'conversion_value')
+
+# Dashboard breakdown name -> daily cube column
+BREAKDOWNS = {
+    'lead_types': 'lead_type',
+    'lead_status': 'lead_status',
+    'categories': 'category_id',
+    'credit_states': 'credit_state'
+}
+
+# Dimension columns are declared without a type, so SQLite hands keys back as they were stored
+# (an id stays an int, a label a str) and dashboards match the raw aggregation
+# Bumped whenever the cube layout or labels change: cubes built by an older version are dropped and rolled up again
+SCHEMA_VERSION = 4
+
+WEEKDAYS = ('MONDAY', 'TUESDAY', 'WEDNESDAY', 'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY')
+
+
+class RollupStore:
+    """Pre-aggregated lead and campaign cubes per customer, built as results are fetched.
+
+    Leads are rolled up into a daily cube keyed by category_id, lead_type,
+    lead_status, charged and credit_state and an hourly cube keyed by the
+    same dimensions except credit_state; campaign performance into a daily
+    cube per campaign. Coverage is tracked per customer per day, and a day
+    is final once it was rolled up more than settlement_days after it
+    ended, so dashboards over settled ranges need no upstream calls.
+    """
+
+    def __init__(self, path, settlement_days=3):
+        """Open (or create) the rollup store at path."""
+        self.path = path
+        self.settlement_days = settlement_days
+        self.stats = {'days_ingested': 0, 'rows_ingested': 0}
+
+        self._lock = threading.Lock()
+
+        self._conn = connect(path)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._conn.executescript("""
+                DROP TABLE IF EXISTS lead_daily;
+                DROP TABLE IF EXISTS lead_hourly;
+                DROP TABLE IF EXISTS campaign_daily;
+                DROP TABLE IF EXISTS coverage;
+            """)
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS lead_daily (
+                customer_id TEXT NOT NULL, day TEXT NOT NULL,
+                category_id, lead_type, lead_status, charged INTEGER, credit_state,
+                leads INTEGER NOT NULL, cost REAL NOT NULL, conversions REAL NOT NULL, conversion_value REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS lead_daily_day ON lead_daily (customer_id, day);
+            CREATE TABLE IF NOT EXISTS lead_hourly (
+                customer_id TEXT NOT NULL, day TEXT NOT NULL, hour INTEGER,
+                category_id, lead_type, lead_status, charged INTEGER,
+                leads INTEGER NOT NULL, cost REAL NOT NULL, conversions REAL NOT NULL, conversion_value REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS lead_hourly_day ON lead_hourly (customer_id, day);
+            CREATE TABLE IF NOT EXISTS campaign_daily (
+                customer_id TEXT NOT NULL, day TEXT NOT NULL, campaign_id,
+                impressions REAL NOT NULL, clicks REAL NOT NULL, cost REAL NOT NULL,
+                conversions REAL NOT NULL, conversion_value REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS campaign_daily_day ON campaign_daily (customer_id, day);
+            CREATE TABLE IF NOT EXISTS coverage (
+                cube TEXT NOT NULL,
+                customer_id TEXT NOT NULL,
+                day TEXT NOT NULL,
+                rolled_up_at TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (cube, customer_id, day)
+            );
+        """)
+        self._conn.commit()
+
+    def ingest(self, resource, customer_id, start_date, end_date, rows, fetched_at=None):
+        """Roll a lead_insights or campaign_performance result for start_date..end_date into the cubes.
+
+        fetched_at (a time.time() timestamp, default now) is when the rows
+        were fetched upstream; a day only becomes final when that was past
+        its settlement window. Only days that are not final yet, and were
+        not already rolled up from a fetch at least as recent (a cache hit
+        hands back the same fetch again), are rolled up. Results of other resources, or projections missing a
+        rolled-up field, are ignored.
+        """
+        if resource == 'lead_insights':
+            cube, fields = 'leads', LEAD_ROLLUP_FIELDS
+        elif resource == 'campaign_performance':
+            cube, fields = 'campaigns', CAMPAIGN_ROLLUP_FIELDS
+        else:
+            return
+
+        if not set(fields.values()) <= set(rows.fields):
+            return
+
+        if fetched_at is None:
+            fetched_at = time.time()
+
+        stale_days = {day.isoformat() for day in self.stale_days(cube, customer_id, start_date, end_date)}
+        if stale_days:
+            with self._lock:
+                fetched = dict(self._conn.execute(
+                    "SELECT day, fetched_at FROM coverage WHERE cube = ? AND customer_id = ? AND day BETWEEN ? AND ?",
+                    (cube, str(customer_id), min(stale_days), max(stale_days))
+                ).fetchall())
+            stale_days = {day for day in stale_days if fetched.get(day, float('-inf')) < fetched_at}
+        if not stale_days:
+            return
+
+        import pandas as pd
+
+        # Cube keys are labelled before pandas sees them: it would turn enum columns into plain ints
+        frame = pd.DataFrame({
+            name: [_dimension(value) for value in rows.column(field)] if name in DIMENSION_COLUMNS else rows.column(field)
+            for name, field in fields.items()
+        })
+        frame['day'] = frame.pop('date').astype('string').str.slice(0, 10)
+        frame = frame[frame['day'].isin(stale_days)]
+
+        if cube == 'leads':
+            tables = {
+                'lead_daily': self._rollup(frame, ('day',) + LEAD_DIMENSIONS + ('credit_state',), LEAD_MEASURES),
+                'lead_hourly': self._rollup(frame, ('day', 'hour') + LEAD_DIMENSIONS, LEAD_MEASURES)
+            }
+        else:
+            tables = {'campaign_daily': self._rollup(frame, ('day', 'campaign_id'), CAMPAIGN_MEASURES, count=False)}
+
+        self._replace(cube, str(customer_id), sorted(stale_days), tables, fetched_at)
+        self.stats['days_ingested'] += len(stale_days)
+        self.stats['rows_ingested'] += len(frame)
+
+    def stale_days(self, cube, customer_id, start_date, end_date):
+        """The days in start_date..end_date that the cube has not rolled up after they settled."""
+        days = day_range(start_date, end_date)
+        if not days:
+            return []
+
+        with self._lock:
+            stored = self._conn.execute(
+                "SELECT day, rolled_up_at FROM coverage WHERE cube = ? AND customer_id = ? AND day BETWEEN ? AND ?",
+                (cube, str(customer_id), days[0].isoformat(), days[-1].isoformat())
+            ).fetchall()
+
+        final = {day for day, rolled_up_at in stored if is_settled(day, rolled_up_at, self.settlement_days)}
+        return [day for day in days if day.isoformat() not in final]
+
+    def stale_runs(self, cube, customer_id, start_date, end_date):
+        """stale_days grouped into ('YYYY-MM-DD', 'YYYY-MM-DD') runs of consecutive days."""
+        return [
+            (start.isoformat(), end.isoformat())
+            for start, end in day_runs(self.stale_days(cube, customer_id, start_date, end_date))
+        ]
+
+    def dashboard(self, customer_id, start_date, end_date):
+        """Dashboard aggregates for the range, in the shape and order of aggregation.dashboard_metrics."""
+        window = (str(customer_id), as_date(start_date).isoformat(), as_date(end_date).isoformat())
+        where = "WHERE customer_id = ? AND day BETWEEN ? AND ?"
+
+        total_leads, total_cost = self._query(f"SELECT COALESCE(SUM(leads), 0), COALESCE(SUM(cost), 0) FROM lead_daily {where}", window)[0]
+        impressions = self._query(f"SELECT COALESCE(SUM(impressions), 0) FROM campaign_daily {where}", window)[0][0]
+
+        breakdowns = {
+            name: dict(_ranked(self._query(
+                f"SELECT {column}, SUM(leads) FROM lead_daily {where} AND {column} IS NOT NULL GROUP BY {column}", window
+            )))
+            for name, column in BREAKDOWNS.items()
+        }
+
+        costs = _ranked(self._query(
+            f"SELECT category_id, SUM(cost) FROM lead_daily {where} AND category_id IS NOT NULL GROUP BY category_id", window
+        ))
+
+        return {
+            'metrics': {
+                'total_leads': total_leads,
+                'total_cost': total_cost,
+                'conversion_rate': (total_leads / impressions * 100) if impressions > 0 else 0,
+                'avg_cost_per_lead': total_cost / total_leads if total_leads > 0 else 0
+            },
+            'breakdowns': breakdowns,
+            'trend_data': self._daily_trend(window),
+            'cost_distribution': {
+                'categories': [category for category, _ in costs],
+                'values': [value for _, value in costs]
+            }
+        }
+
+    def trend(self, customer_id, start_date, end_date, granularity='day', **filters):
+        """Leads, cost and conversions per day, hour or day_of_week over the range.
+
+        filters restrict the rollup to given values of the lead dimensions
+        (category_id, lead_type, lead_status, charged).
+        """
+        window = (str(customer_id), as_date(start_date).isoformat(), as_date(end_date).isoformat())
+        conditions = ["customer_id = ?", "day BETWEEN ? AND ?"]
+        params = list(window)
+        for dimension, value in filters.items():
+            if dimension not in LEAD_DIMENSIONS:
+                raise ValueError(f"Unknown dimension: {dimension}")
+            if value is None:
+                continue
+            if dimension == 'charged':
+                conditions.append("charged = ?")
+                params.append(int(value))
+            else:
+                # Filter values arrive as strings, whatever the type of the stored key
+                conditions.append(f"CAST({dimension} AS TEXT) = ?")
+                params.append(str(value))
+
+        group = {'day': 'day', 'hour': 'hour', 'day_of_week': 'day'}.get(granularity)
+        if group is None:
+            raise ValueError(f"Unknown granularity: {granularity}")
+
+        table = 'lead_hourly' if granularity == 'hour' else 'lead_daily'
+        stored = self._query(
+            f"SELECT {group}, SUM(leads), SUM(cost), SUM(conversions) FROM {table} "
+            f"WHERE {' AND '.join(conditions)} GROUP BY {group} ORDER BY {group}",
+            params
+        )
+
+        if granularity == 'day':
+            labels = [day.isoformat() for day in day_range(start_date, end_date)]
+            totals = {day: values for day, *values in stored}
+        elif granularity == 'hour':
+            labels = list(range(24))
+            totals = {hour: values for hour, *values in stored}
+        else:
+            labels = list(WEEKDAYS)
+            totals = {}
+            for day, *values in stored:
+                weekday = WEEKDAYS[date.fromisoformat(day).weekday()]
+                totals[weekday] = [a + b for a, b in zip(totals.get(weekday, (0, 0, 0)), values)]
+
+        series = [totals.get(label, (0, 0, 0)) for label in labels]
+        return {
+            'granularity': granularity,
+            'labels': labels,
+            'leads': [values[0] for values in series],
+            'cost': [values[1] for values in series],
+            'conversions': [values[2] for values in series]
+        }
+
+    def invalidate(self, customer_id=None):
+        """Drop the rollups for a customer, or everything."""
+        where = " WHERE customer_id = ?" if customer_id is not None else ""
+        params = [str(customer_id)] if customer_id is not None else []
+        with self._lock:
+            for table in ('lead_daily', 'lead_hourly', 'campaign_daily', 'coverage'):
+                self._conn.execute(f"DELETE FROM {table}{where}", params)
+            self._conn.commit()
+
+    def _daily_trend(self, window):
+        counts = dict(self._query(
+            "SELECT day, SUM(leads) FROM lead_daily WHERE customer_id = ? AND day BETWEEN ? AND ? GROUP BY day", window
+        ))
+        dates = [day.isoformat() for day in day_range(window[1], window[2])]
+        return {'dates': dates, 'leads': [counts.get(day, 0) for day in dates]}
+
+    def _rollup(self, frame, keys, measures, count=True):
+        """Group frame by keys (already labelled by _dimension) and sum measures (plus a row count as leads) into insertable tuples."""
+        frame = frame.copy()
+        for measure in measures:
+            frame[measure] = _numeric(frame[measure].to_numpy())
+
+        grouped = frame.groupby(list(keys), dropna=False, sort=False)
+        totals = grouped[list(measures)].sum()
+        if count:
+            totals.insert(0, 'leads', grouped.size())
+
+        return [
+            tuple(_plain(value) for value in key + tuple(values))
+            for key, values in zip(totals.index, totals.itertuples(index=False))
+        ]
+
+    def _replace(self, cube, customer_id, days, tables, fetched_at):
+        """Replace the cube rows and coverage for days in one transaction, dated by when the rows were fetched."""
+        rolled_up_at = date.fromtimestamp(fetched_at).isoformat()
+        placeholders = ', '.join('?' * len(days))
+
+        with self._lock:
+            with self._conn:
+                for table, rows in tables.items():
+                    self._conn.execute(f"DELETE FROM {table} WHERE customer_id = ? AND day IN ({placeholders})", [customer_id] + days)
+                    if rows:
+                        marks = ', '.join('?' * (len(rows[0]) + 1))
+                        self._conn.executemany(f"INSERT INTO {table} VALUES ({marks})", [(customer_id,) + row for row in rows])
+
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO coverage VALUES (?, ?, ?, ?, ?)",
+                    [(cube, customer_id, day, rolled_up_at, fetched_at) for day in days]
+                )
+
+    def _query(self, sql, params):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+
+def _dimension(value):
+    """Cube key for a dimension value: enum names, 0/1 for flags, None for missing."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return int(value)
+    value = _label(value)
+    return value if isinstance(value, (int, str)) else str(value)
+
+
+def _plain(value):
+    """Python scalar for a numpy scalar, None for NaN group keys."""
+    value = value.item() if hasattr(value, 'item') else value
+    return None if isinstance(value, float) and value != value else value
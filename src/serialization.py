@@ -0,0 +1,80 @@
+import enum
+import json
+import zlib
+from collections.abc import Mapping
+from datetime import date, datetime
+
+from .records import ColumnarRows, NormalizedRows
+
+
+def to_plain(value):
+    """Convert API values (proto-plus enums, messages, repeated fields) into plain Python types."""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+
+    if isinstance(value, enum.Enum):
+        return value.name
+
+    if isinstance(value, (int, float)):
+        return value
+
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+
+    if isinstance(value, (ColumnarRows, NormalizedRows)):
+        return value.map_values(to_plain)
+
+    if isinstance(value, Mapping):
+        return {str(key): to_plain(item) for key, item in value.items()}
+
+    # proto-plus messages expose to_dict on their class
+    if hasattr(type(value), 'to_dict') and hasattr(type(value), 'pb'):
+        return type(value).to_dict(value, use_integers_for_enums=False)
+
+    # Raw protobuf messages (use_proto_plus=False), rendered like proto-plus to_dict
+    if hasattr(value, 'DESCRIPTOR') and hasattr(value, 'ListFields'):
+        from google.protobuf.json_format import MessageToDict
+        try:
+            return MessageToDict(value, preserving_proto_field_name=True, always_print_fields_with_no_presence=True)
+        except TypeError:
+            # protobuf releases before 5.26 name the option including_default_value_fields
+            return MessageToDict(value, preserving_proto_field_name=True, including_default_value_fields=True)
+
+    if hasattr(value, '__iter__'):
+        return [to_plain(item) for item in value]
+
+    return str(value)
+
+
+def encode_rows(rows):
+    """Serialize rows column by column and compress them."""
+    rows = to_plain(rows)
+
+    if isinstance(rows, ColumnarRows):
+        data = {'fields': list(rows.fields), 'values': [rows.columns[field] for field in rows.fields]}
+        return zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+
+    columns = list(rows[0].keys()) if rows and isinstance(rows[0], dict) else []
+
+    if columns and all(isinstance(row, dict) and list(row.keys()) == columns for row in rows):
+        data = {'columns': columns, 'values': [[row[column] for row in rows] for column in columns]}
+    else:
+        data = {'rows': rows}
+
+    return zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+
+
+def decode_rows(payload):
+    """Inverse of encode_rows."""
+    data = json.loads(zlib.decompress(payload).decode('utf-8'))
+
+    if 'rows' in data:
+        return data['rows']
+
+    if 'fields' in data:
+        return ColumnarRows(data['fields'], dict(zip(data['fields'], data['values'])))
+
+    return [dict(zip(data['columns'], values)) for values in zip(*data['values'])]
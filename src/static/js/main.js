@@ -3,6 +3,12 @@ let charts = {};
 let dataTable;
 let map;
 
+// Leads table: only the visible rows are in the DOM, and pages are fetched as it scrolls
+const LEAD_ROW_HEIGHT = 36;
+const LEAD_PAGE_SIZE = 200;
+const LEAD_OVERSCAN = 10;
+let leadList = null;
+
 // Initialize all components when document is ready
 $(document).ready(function() {
     // Initialize date range picker
@@ -103,8 +109,8 @@ function loadDashboard() {
     
     $.get('/api/dashboard', getQueryParams())
         .done(function(data) {
-            $('#totalLeads').text(data.total_leads);
-            $('#conversionRate').text(data.conversion_rate + '%');
+            $('#totalLeads').text(data.metrics.total_leads);
+            $('#conversionRate').text(data.metrics.conversion_rate.toFixed(2) + '%');
             // Add more dashboard metrics as needed
         })
         .fail(handleApiError);
@@ -114,12 +120,22 @@ function loadLeads() {
     if (!validateInputs()) return;
     $('.data-container').hide();
     $('#leadsData').show();
-    
-    $.get('/api/leads', getQueryParams())
-        .done(function(data) {
-            displayLeadsTable(data);
-        })
-        .fail(handleApiError);
+
+    displayLeadsTable(Object.assign(getQueryParams(), getLeadFilters()));
+}
+
+function getLeadFilters() {
+    const filters = {
+        sort: $('#leadSort').val(),
+        order: $('#leadOrder').val(),
+        type: $('#leadTypeFilter').val(),
+        status: $('#leadStatusFilter').val(),
+        category: $('#leadCategoryFilter').val()
+    };
+    Object.keys(filters).forEach(key => {
+        if (!filters[key]) delete filters[key];
+    });
+    return filters;
 }
 
 function loadCampaigns() {
@@ -127,9 +143,15 @@ function loadCampaigns() {
     $('.data-container').hide();
     $('#campaignsData').show();
     
-    $.get('/api/campaigns', getQueryParams())
+    $.ajax({
+        url: '/api/campaigns/performance',
+        method: 'POST',
+        contentType: 'application/json',
+        data: JSON.stringify(Object.assign(getQueryParams(), {normalized: true}))
+    })
         .done(function(data) {
-            displayCampaignMetrics(data);
+            // performance and leads arrive normalized; the dashboard metrics alongside them do not
+            displayCampaignMetrics(expandNormalized(data));
         })
         .fail(handleApiError);
 }
@@ -177,31 +199,136 @@ function getQueryParams() {
     };
 }
 
-function displayLeadsTable(data) {
-    const table = $('<table>').addClass('table table-striped');
-    const thead = $('<thead>').append(
-        $('<tr>').append(
-            $('<th>').text('Date'),
-            $('<th>').text('Lead Type'),
-            $('<th>').text('Status'),
-            $('<th>').text('Details')
+// Normalized payloads ({normalized, keys, dimensions, fields, values}) send rows column by
+// column and entity attributes once per key; rebuild full nested rows from them
+function denormalize(payload) {
+    const paths = payload.fields.map(field => field.split('.'));
+    const names = Object.keys(payload.dimensions);
+    const count = payload.values.length ? payload.values[0].length : 0;
+    const rows = [];
+
+    for (let index = 0; index < count; index++) {
+        const row = {};
+        paths.forEach((path, column) => {
+            let target = row;
+            path.slice(0, -1).forEach(part => { target = target[part] = target[part] || {}; });
+            target[path[path.length - 1]] = payload.values[column][index];
+        });
+
+        names.forEach(name => {
+            const key = payload.keys[name];
+            const attributes = key === null
+                ? payload.dimensions[name]
+                : payload.dimensions[name][String(key.split('.').reduce((value, part) => value && value[part], row))];
+            $.extend(true, row, attributes);
+        });
+        rows.push(row);
+    }
+    return rows;
+}
+
+// Expand every normalized payload among a response's top-level values
+function expandNormalized(data) {
+    if (data && data.normalized) return denormalize(data);
+    Object.keys(data || {}).forEach(name => {
+        if (data[name] && data[name].normalized) data[name] = denormalize(data[name]);
+    });
+    return data;
+}
+
+function displayLeadsTable(params) {
+    const header = $('<table>').addClass('table mb-0 leads-table').append(
+        $('<thead>').append(
+            $('<tr>').append(
+                $('<th>').text('Date'),
+                $('<th>').text('Lead Type'),
+                $('<th>').text('Status'),
+                $('<th>').text('Category'),
+                $('<th>').text('Charged')
+            )
         )
     );
-    
     const tbody = $('<tbody>');
-    data.leads.forEach(lead => {
-        tbody.append(
-            $('<tr>').append(
-                $('<td>').text(lead.date),
-                $('<td>').text(lead.type),
-                $('<td>').text(lead.status),
-                $('<td>').text(lead.details)
+    const rows = $('<table>').addClass('table table-striped leads-table leads-window').append(tbody);
+    const spacer = $('<div>').addClass('leads-spacer').append(rows);
+    const viewport = $('<div>').addClass('leads-viewport').append(spacer);
+    const summary = $('<p>').addClass('text-muted small mt-2');
+
+    $('#leadsTable').empty().append(header, viewport, summary);
+
+    // A new listing replaces the old one; responses for the old one are ignored
+    const list = leadList = {
+        params: params,
+        leads: [],
+        cursor: null,
+        total: 0,
+        done: false,
+        loading: false,
+        viewport: viewport,
+        spacer: spacer,
+        rows: rows,
+        tbody: tbody,
+        summary: summary
+    };
+
+    viewport.on('scroll', () => renderLeadWindow(list));
+    fetchLeadPage(list);
+}
+
+function fetchLeadPage(list) {
+    if (list.loading || list.done) return;
+    list.loading = true;
+
+    const params = Object.assign({}, list.params, { limit: LEAD_PAGE_SIZE });
+    if (list.cursor) params.cursor = list.cursor;
+
+    $.get('/api/leads', params)
+        .done(function(data) {
+            if (list !== leadList) return;
+            list.leads = list.leads.concat(data.leads);
+            list.cursor = data.next_cursor;
+            list.total = data.total;
+            list.done = !data.next_cursor;
+            list.loading = false;
+            list.spacer.css('height', list.total * LEAD_ROW_HEIGHT);
+            renderLeadWindow(list);
+        })
+        .fail(function(error) {
+            list.loading = false;
+            handleApiError(error);
+        });
+}
+
+function renderLeadWindow(list) {
+    const viewport = list.viewport;
+    const first = Math.max(0, Math.floor(viewport.scrollTop() / LEAD_ROW_HEIGHT) - LEAD_OVERSCAN);
+    const last = Math.min(
+        list.leads.length,
+        Math.ceil((viewport.scrollTop() + viewport.height()) / LEAD_ROW_HEIGHT) + LEAD_OVERSCAN
+    );
+
+    // Keyset pages can only be fetched in order, so fetch ahead of the window
+    if (last + LEAD_OVERSCAN >= list.leads.length) {
+        fetchLeadPage(list);
+    }
+
+    const rows = [];
+    for (let index = first; index < last; index++) {
+        const lead = list.leads[index];
+        rows.push(
+            $('<tr>').css('height', LEAD_ROW_HEIGHT).append(
+                $('<td>').text(lead.creation_time),
+                $('<td>').text(lead.lead_type),
+                $('<td>').text(lead.lead_status),
+                $('<td>').text(lead.category_id),
+                $('<td>').text(lead.lead_charged ? 'Yes' : 'No')
             )
         );
-    });
-    
-    table.append(thead, tbody);
-    $('#leadsTable').empty().append(table);
+    }
+
+    list.rows.css('transform', `translateY(${first * LEAD_ROW_HEIGHT}px)`);
+    list.tbody.empty().append(rows);
+    list.summary.text(`${list.leads.length} of ${list.total} leads loaded`);
 }
 
 function displayCampaignMetrics(data) {
@@ -0,0 +1,71 @@
+import os
+import sqlite3
+import threading
+
+# Seconds a writer waits for another process's write lock before failing
+BUSY_TIMEOUT = 30
+
+
+class SharedConnection:
+    """SQLite connection that can be shared by threads and survives fork().
+
+    The database runs in WAL mode, so worker processes read concurrently
+    while one of them writes, and waits up to BUSY_TIMEOUT seconds for the
+    write lock instead of failing. A connection is never used across
+    fork(): a child process (a gunicorn worker forked from a preloaded
+    master) transparently opens its own on first use.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._pid = None
+        self._conn = None
+        self._open_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.connection()
+
+    def connection(self):
+        """The sqlite3 connection for the current process."""
+        if self._pid != os.getpid():
+            with self._open_lock:
+                if self._pid != os.getpid():
+                    # The parent's connection is left alone: closing it here could disturb the parent's locks
+                    conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    self._conn = conn
+                    self._pid = os.getpid()
+        return self._conn
+
+    def execute(self, *args):
+        return self.connection().execute(*args)
+
+    def executemany(self, *args):
+        return self.connection().executemany(*args)
+
+    def executescript(self, script):
+        return self.connection().executescript(script)
+
+    def commit(self):
+        self.connection().commit()
+
+    def rollback(self):
+        self.connection().rollback()
+
+    def close(self):
+        if self._pid == os.getpid():
+            self._conn.close()
+            self._pid = None
+
+    def __enter__(self):
+        return self.connection().__enter__()
+
+    def __exit__(self, *exc_info):
+        return self.connection().__exit__(*exc_info)
+
+
+def connect(path):
+    """Open (or create) the SQLite database at path for use by several threads and worker processes."""
+    return SharedConnection(path)
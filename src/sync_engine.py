@@ -0,0 +1,151 @@
+import threading
+from datetime import date, datetime, timedelta
+
+from .records import ColumnarRows
+from .serialization import decode_rows, encode_rows, to_plain
+from .storage import connect
+
+
+class DayPartitionSync:
+    """Incremental sync of date-segmented results, stored per customer per day.
+
+    A day is final once it was fetched more than settlement_days after it
+    ended. Final days are served from the store; missing days and days that
+    were still settling when fetched are re-queried, one API call per run
+    of consecutive days.
+    """
+
+    def __init__(self, path, settlement_days=3):
+        """Open (or create) the partition store at path."""
+        self.path = path
+        self.settlement_days = settlement_days
+        self.stats = {'days_fetched': 0, 'days_reused': 0, 'queries': 0}
+
+        self._lock = threading.Lock()
+
+        self._conn = connect(path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS partitions (
+                resource TEXT NOT NULL,
+                customer_id TEXT NOT NULL,
+                day TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                PRIMARY KEY (resource, customer_id, day)
+            )
+        """)
+        self._conn.commit()
+
+    def sync(self, resource, customer_id, start_date, end_date, fetch_range, date_field, reverse=False):
+        """Return a ColumnarRows for start_date..end_date, fetching only days that are not final.
+
+        fetch_range(start, end) must return a ColumnarRows for an inclusive
+        date range whose date_field column holds 'YYYY-MM-DD' dates.
+        """
+        days = day_range(start_date, end_date)
+        final_days = self._final_days(resource, customer_id, days)
+        stale_days = [day for day in days if day not in final_days]
+
+        for run_start, run_end in day_runs(stale_days):
+            rows = to_plain(fetch_range(run_start.isoformat(), run_end.isoformat()))
+            self.stats['queries'] += 1
+            self._store(resource, customer_id, day_range(run_start, run_end), rows, date_field)
+
+        self.stats['days_fetched'] += len(stale_days)
+        self.stats['days_reused'] += len(days) - len(stale_days)
+
+        return self._load(resource, customer_id, days, reverse)
+
+    def invalidate(self, customer_id=None, resource=None):
+        """Drop stored partitions for a customer and/or resource, or everything."""
+        conditions = []
+        params = []
+        if customer_id is not None:
+            conditions.append("customer_id = ?")
+            params.append(str(customer_id))
+        if resource is not None:
+            conditions.append("resource = ?")
+            params.append(resource)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            self._conn.execute(f"DELETE FROM partitions{where}", params)
+            self._conn.commit()
+
+    def _final_days(self, resource, customer_id, days):
+        """Return the stored days that were fetched after their settlement window."""
+        if not days:
+            return set()
+
+        with self._lock:
+            stored = self._conn.execute(
+                "SELECT day, fetched_at FROM partitions WHERE resource = ? AND customer_id = ? AND day BETWEEN ? AND ?",
+                (resource, str(customer_id), days[0].isoformat(), days[-1].isoformat())
+            ).fetchall()
+
+        return {date.fromisoformat(day) for day, fetched_at in stored if is_settled(day, fetched_at, self.settlement_days)}
+
+    def _store(self, resource, customer_id, days, rows, date_field):
+        """Split rows by day and replace the partitions for every day in the run."""
+        by_day = {day.isoformat(): [] for day in days}
+        for index, row_date in enumerate(rows.column(date_field) if rows.fields else []):
+            row_date = str(row_date)[:10]
+            if row_date in by_day:
+                by_day[row_date].append(index)
+
+        fetched_at = date.today().isoformat()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO partitions VALUES (?, ?, ?, ?, ?)",
+                [(resource, str(customer_id), day, fetched_at, encode_rows(rows.take(indices))) for day, indices in by_day.items()]
+            )
+            self._conn.commit()
+
+    def _load(self, resource, customer_id, days, reverse):
+        """Merge the stored partitions for days into one ColumnarRows."""
+        if not days:
+            return ColumnarRows(())
+
+        with self._lock:
+            stored = self._conn.execute(
+                "SELECT day, payload FROM partitions WHERE resource = ? AND customer_id = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (resource, str(customer_id), days[0].isoformat(), days[-1].isoformat())
+            ).fetchall()
+
+        if reverse:
+            stored.reverse()
+
+        return ColumnarRows.concat(decode_rows(payload) for _, payload in stored)
+
+
+def day_range(start_date, end_date):
+    """List every date from start_date to end_date inclusive."""
+    start = as_date(start_date)
+    end = as_date(end_date)
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+def day_runs(days):
+    """Group sorted dates into (start, end) runs of consecutive days."""
+    runs = []
+    for day in days:
+        if runs and day - runs[-1][1] == timedelta(days=1):
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+
+    return [tuple(run) for run in runs]
+
+
+def as_date(value):
+    """A date from a date, datetime or 'YYYY-MM-DD...' string."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+
+def is_settled(day, fetched_at, settlement_days):
+    """Whether data for day fetched on fetched_at was past its settlement window."""
+    return as_date(fetched_at) > as_date(day) + timedelta(days=settlement_days)
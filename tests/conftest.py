@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'benchmarks'))
+
+from fake_ads import FakeGoogleAdsClientLib, FakeGoogleAdsService
+
+from src.google_ads_client import GoogleAdsClient
+from src.result_cache import ResultCache
+from src.rollups import RollupStore
+from src.sync_engine import DayPartitionSync
+
+CUSTOMER_ID = '1234567890'
+
+
+@pytest.fixture
+def make_client(tmp_path_factory):
+    """Build GoogleAdsClients on the synthetic GoogleAdsService, each with its stores in a fresh directory."""
+    def make(rows=300, cache=False, sync=False, rollups=False, service=None):
+        tmp_path = tmp_path_factory.mktemp('client')
+        client = GoogleAdsClient(
+            credentials={'developer_token': 'test'},
+            cache=ResultCache(str(tmp_path / 'results.sqlite3')) if cache else None,
+            sync=DayPartitionSync(str(tmp_path / 'partitions.sqlite3')) if sync else None,
+            rollups=RollupStore(str(tmp_path / 'rollups.sqlite3')) if rollups else None
+        )
+        client.client = FakeGoogleAdsClientLib(service or FakeGoogleAdsService(rows=rows))
+        return client
+
+    return make
@@ -0,0 +1,56 @@
+"""QueryExecutor fails fast on the first failing or late call."""
+import threading
+import time
+
+import pytest
+
+from src.concurrency import QueryExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = QueryExecutor(max_workers=2)
+    yield executor
+    executor.shutdown(wait=False)
+
+
+def test_results_by_name(executor):
+    assert executor.run_parallel({'a': lambda: 1, 'b': lambda: 2}) == {'a': 1, 'b': 2}
+
+
+def test_first_error_does_not_wait_for_slower_calls(executor):
+    release = threading.Event()
+
+    def fail():
+        raise ValueError('bad query')
+
+    started = time.monotonic()
+    with pytest.raises(ValueError, match='bad query'):
+        executor.run_parallel({'slow': lambda: release.wait(5), 'failing': fail})
+    assert time.monotonic() - started < 1
+    release.set()
+
+
+def test_queued_calls_are_cancelled_after_an_error(executor):
+    release = threading.Event()
+    ran = []
+
+    def fail():
+        raise ValueError('bad query')
+
+    with pytest.raises(ValueError):
+        executor.run_parallel({
+            'slow': lambda: release.wait(5),
+            'failing': fail,
+            'queued': lambda: ran.append('queued')
+        })
+    release.set()
+    executor.shutdown(wait=True)
+    assert ran == []
+
+
+def test_timeout_names_the_late_call(executor):
+    release = threading.Event()
+    with pytest.raises(TimeoutError, match="'slow'"):
+        executor.run_parallel({'slow': lambda: release.wait(5), 'fast': lambda: 1}, timeouts={'slow': 0.1})
+    release.set()
@@ -0,0 +1,83 @@
+"""The campaign performance route: its normalized mode, as the dashboard requests and expands it, and its errors."""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, 'benchmarks'))
+
+# No on-disk state, no upstream pacing
+for name in ('ENABLE_CACHE', 'ENABLE_SYNC', 'ENABLE_ROLLUPS', 'ENABLE_CREDENTIAL_STORE'):
+    os.environ[name] = 'false'
+for name in ('RATE_LIMIT_DEVELOPER_QPS', 'RATE_LIMIT_DEVELOPER_BURST', 'RATE_LIMIT_CUSTOMER_QPS', 'RATE_LIMIT_CUSTOMER_BURST'):
+    os.environ[name] = '1000000'
+
+from fake_ads import FakeGoogleAdsService, install
+
+install(FakeGoogleAdsService(rows=200))
+
+from src.app import app
+
+BODY = {'customer_id': '1234567890', 'start_date': '2024-01-01', 'end_date': '2024-01-31'}
+
+
+def denormalize(payload):
+    """Python twin of denormalize() in static/js/main.js."""
+    rows = []
+    count = len(payload['values'][0]) if payload['values'] else 0
+    for index in range(count):
+        row = {}
+        for field, values in zip(payload['fields'], payload['values']):
+            *parents, leaf = field.split('.')
+            target = row
+            for part in parents:
+                target = target.setdefault(part, {})
+            target[leaf] = values[index]
+
+        for name, key in payload['keys'].items():
+            table = payload['dimensions'][name]
+            attributes = table if key is None else table[str(_get(row, key))]
+            _merge(row, attributes)
+        rows.append(row)
+    return rows
+
+
+def _get(row, path):
+    for part in path.split('.'):
+        row = row[part]
+    return row
+
+
+def _merge(target, source):
+    for name, value in source.items():
+        if isinstance(value, dict):
+            _merge(target.setdefault(name, {}), value)
+        else:
+            target[name] = value
+
+
+def test_campaign_performance_normalized_matches_rows():
+    client = app.test_client()
+    assert client.post('/api/initialize', json={'developer_token': 'test', 'refresh_token': 'test'}).json['success']
+
+    plain = client.post('/api/campaigns/performance', json=BODY)
+    normalized = client.post('/api/campaigns/performance', json=dict(BODY, normalized=True))
+    assert plain.status_code == normalized.status_code == 200
+
+    plain, normalized = plain.json, normalized.json
+    for name in ('performance', 'leads'):
+        assert normalized[name]['normalized'] is True
+        assert denormalize(normalized[name]) == plain[name]
+
+    # The dashboard metrics are the same either way
+    assert {k: v for k, v in normalized.items() if k not in ('performance', 'leads')} == \
+        {k: v for k, v in plain.items() if k not in ('performance', 'leads')}
+
+
+def test_campaign_performance_rejects_bad_dates():
+    client = app.test_client()
+    assert client.post('/api/initialize', json={'developer_token': 'test', 'refresh_token': 'test'}).json['success']
+
+    response = client.post('/api/campaigns/performance', json=dict(BODY, end_date='2024-02-30'))
+    assert response.status_code == 400
+    assert 'error' in response.json
@@ -0,0 +1,45 @@
+"""Keyset cursors round-trip and reject positions they cannot compare."""
+import pytest
+
+from src.pagination import decode_cursor, encode_cursor, keyset_page
+from src.records import ColumnarRows
+
+
+def leads(count=25):
+    return ColumnarRows(('id', 'timing.date'), {
+        'id': list(range(1, count + 1)),
+        'timing.date': [f"2024-01-{day % 5 + 1:02d}" for day in range(count)]
+    })
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(('2024-01-03', 17))) == ('2024-01-03', 17)
+    assert decode_cursor(encode_cursor(('2024-01-03', 17)), (str, int)) == ('2024-01-03', 17)
+
+
+@pytest.mark.parametrize('descending', [True, False])
+def test_pages_cover_every_row_once(descending):
+    rows = leads()
+    seen, cursor = [], None
+    while True:
+        page, cursor, total = keyset_page(rows, 'timing.date', 'id', 10, cursor=cursor, descending=descending)
+        seen.extend(page.column('id'))
+        if cursor is None:
+            break
+
+    assert total == len(rows)
+    assert sorted(seen) == rows.column('id')
+    keys = [(rows.column('timing.date')[index - 1], index) for index in seen]
+    assert keys == sorted(keys, reverse=descending)
+
+
+@pytest.mark.parametrize('cursor', ['not a cursor', encode_cursor(('2024-01-03',)), 'bnVsbA'])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError):
+        keyset_page(leads(), 'timing.date', 'id', 10, cursor=cursor)
+
+
+@pytest.mark.parametrize('key', [('2024-01-03', '17'), (20240103, 17), ('2024-01-03', True)])
+def test_cursors_of_other_types_are_rejected(key):
+    with pytest.raises(ValueError):
+        keyset_page(leads(), 'timing.date', 'id', 10, cursor=encode_cursor(key))
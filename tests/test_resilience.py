@@ -0,0 +1,37 @@
+"""The circuit breaker fails fast once the API is throttling."""
+from types import SimpleNamespace
+
+import pytest
+
+from src.resilience import CircuitOpenError, UpstreamGuard
+
+TOKEN = 'developer-token'
+
+
+def rpc_error(status):
+    """A GoogleAdsException-like error carrying only a gRPC status."""
+    return SimpleNamespace(error=SimpleNamespace(code=lambda: SimpleNamespace(name=status)))
+
+
+def test_throttling_opens_the_breaker_and_gives_up():
+    guard = UpstreamGuard(max_attempts=10, base_delay=0, breaker_threshold=2, breaker_reset=60)
+
+    assert guard.on_error(TOKEN, rpc_error('RESOURCE_EXHAUSTED'), 0) is not None
+    assert guard.on_error(TOKEN, rpc_error('RESOURCE_EXHAUSTED'), 1) is None
+    assert guard.stats['breaker_trips'] == 1
+
+
+def test_open_breaker_stops_retries_and_rejects_calls():
+    guard = UpstreamGuard(max_attempts=10, base_delay=0, breaker_threshold=1, breaker_reset=60)
+    guard.on_error(TOKEN, rpc_error('RESOURCE_EXHAUSTED'), 0)
+
+    # Another call's transient error is not retried into the open breaker
+    assert guard.on_error(TOKEN, rpc_error('UNAVAILABLE'), 0) is None
+
+    with pytest.raises(CircuitOpenError):
+        guard.before_call(TOKEN, '1234567890')
+    assert guard.stats['rejected'] == 1
+
+    # Other developer tokens have their own breaker
+    guard.before_call('other-token', '1234567890')
+    assert guard.on_error('other-token', rpc_error('UNAVAILABLE'), 0) is not None
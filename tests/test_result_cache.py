@@ -0,0 +1,102 @@
+"""ResultCache freshness, stale-while-revalidate and cross-process fetch leases."""
+import threading
+import time
+
+import pytest
+
+from src.result_cache import ResultCache
+
+CUSTOMER_ID = '1234567890'
+QUERY = 'SELECT campaign.id FROM campaign'
+WINDOW = ('2024-01-01', '2024-01-31')
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'results.sqlite3')
+
+
+class Upstream:
+    """A fetch that counts its calls and returns a new result each time."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.delay)
+        return [{'id': call}]
+
+
+def test_fresh_entries_are_served_from_cache(path):
+    cache, upstream = ResultCache(path), Upstream()
+
+    first = cache.get_or_fetch('campaign_data', CUSTOMER_ID, QUERY, WINDOW, upstream, timestamped=True)
+    second = cache.get_or_fetch('campaign_data', CUSTOMER_ID, QUERY, WINDOW, upstream, timestamped=True)
+
+    assert first == second == ([{'id': 1}], first[1])
+    assert upstream.calls == 1
+    assert cache.stats['hits'] == 1
+    assert cache.version('campaign_data', cache.make_key(CUSTOMER_ID, QUERY, WINDOW)) == first[1]
+
+
+def test_stale_entries_are_served_while_refreshed(path):
+    cache, upstream = ResultCache(path, ttls={'campaign_data': 60}, stale_ttl=600), Upstream()
+    key = cache.make_key(CUSTOMER_ID, QUERY, WINDOW)
+    cache.set('campaign_data', key, CUSTOMER_ID, [{'id': 0}], fetched_at=time.time() - 120)
+
+    assert cache.version('campaign_data', key) is None
+    assert cache.get_or_fetch('campaign_data', CUSTOMER_ID, QUERY, WINDOW, upstream) == [{'id': 0}]
+    assert cache.stats['stale_hits'] == 1
+
+    deadline = time.monotonic() + 5
+    while cache.get('campaign_data', key) != ([{'id': 1}], True) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get('campaign_data', key) == ([{'id': 1}], True)
+    assert upstream.calls == 1
+
+
+def test_expired_entries_are_fetched_again(path):
+    cache, upstream = ResultCache(path, ttls={'campaign_data': 60}, stale_ttl=60), Upstream()
+    key = cache.make_key(CUSTOMER_ID, QUERY, WINDOW)
+    cache.set('campaign_data', key, CUSTOMER_ID, [{'id': 0}], fetched_at=time.time() - 300)
+
+    assert cache.get('campaign_data', key) is None
+    assert cache.get_or_fetch('campaign_data', CUSTOMER_ID, QUERY, WINDOW, upstream) == [{'id': 1}]
+    assert cache.stats['misses'] == 1
+
+
+def test_one_fetch_for_concurrent_misses_across_processes(path):
+    # One ResultCache per worker process, all on the same database
+    caches = [ResultCache(path, poll_interval=0.01) for _ in range(4)]
+    upstream = Upstream(delay=0.3)
+    results = []
+
+    def call(cache):
+        results.append(cache.get_or_fetch('campaign_data', CUSTOMER_ID, QUERY, WINDOW, upstream))
+
+    threads = [threading.Thread(target=call, args=(cache,)) for cache in caches for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert upstream.calls == 1
+    assert results == [[{'id': 1}]] * len(threads)
+    assert sum(cache.stats['shared_fetches'] + cache.stats['hits'] for cache in caches) == len(threads) - 1
+
+
+def test_lease_of_a_dead_holder_is_taken_over(path):
+    dead = ResultCache(path, lease_timeout=0.2)
+    assert dead._acquire_lease(dead.make_key(CUSTOMER_ID, QUERY, WINDOW)) is not None
+
+    cache, upstream = ResultCache(path, lease_timeout=0.2, poll_interval=0.01), Upstream()
+    started = time.monotonic()
+    assert cache.get_or_fetch('campaign_data', CUSTOMER_ID, QUERY, WINDOW, upstream) == [{'id': 1}]
+
+    assert upstream.calls == 1
+    assert 0.1 < time.monotonic() - started < 5
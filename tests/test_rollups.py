@@ -0,0 +1,60 @@
+"""Rollup cubes answer dashboards and trends like the raw rows do."""
+from datetime import date
+
+import pytest
+from conftest import CUSTOMER_ID
+
+START_DATE = '2024-01-01'
+END_DATE = '2024-01-31'
+
+
+def test_breakdowns_use_enum_names_without_cache(make_client):
+    client = make_client(rollups=True)
+    breakdowns = client.get_dashboard(CUSTOMER_ID, START_DATE, END_DATE)['breakdowns']
+
+    assert set(breakdowns['lead_types']) <= {'PHONE_CALL', 'MESSAGE', 'BOOKING'}
+    assert set(breakdowns['credit_states']) <= {'PENDING', 'CREDITED'}
+    assert all(not key.isdigit() for key in breakdowns['lead_status'])
+
+
+def test_filtered_trend_matches_enum_name_without_cache(make_client):
+    client = make_client(rollups=True)
+    trend = client.get_lead_trend(CUSTOMER_ID, START_DATE, END_DATE, lead_type='PHONE_CALL')
+    breakdowns = client.get_dashboard(CUSTOMER_ID, START_DATE, END_DATE)['breakdowns']
+
+    assert sum(trend['leads']) == breakdowns['lead_types']['PHONE_CALL'] > 0
+
+
+def test_cache_hits_are_not_rolled_up_again(make_client):
+    client = make_client(cache=True, rollups=True)
+    today = date.today().isoformat()
+
+    client.get_lead_insights(CUSTOMER_ID, today, today)
+    ingested = dict(client.rollups.stats)
+    client.get_lead_insights(CUSTOMER_ID, today, today)
+
+    assert ingested['days_ingested'] == 1
+    assert client.rollups.stats == ingested
+
+
+def test_dashboard_matches_raw_aggregation(make_client):
+    raw = make_client(rollups=False).get_dashboard(CUSTOMER_ID, START_DATE, END_DATE)
+
+    for cached in (False, True):
+        rolled_up = make_client(cache=cached, rollups=True).get_dashboard(CUSTOMER_ID, START_DATE, END_DATE)
+
+        for name, breakdown in raw['breakdowns'].items():
+            assert list(rolled_up['breakdowns'][name].items()) == list(breakdown.items())
+        assert rolled_up['cost_distribution']['categories'] == raw['cost_distribution']['categories']
+        assert rolled_up['cost_distribution']['values'] == pytest.approx(raw['cost_distribution']['values'])
+        assert rolled_up['trend_data'] == raw['trend_data']
+        assert rolled_up['metrics'] == pytest.approx(raw['metrics'])
+
+
+def test_hourly_trend_covers_every_lead(make_client):
+    client = make_client(rollups=True)
+    trend = client.get_lead_trend(CUSTOMER_ID, START_DATE, END_DATE, granularity='hour')
+    breakdowns = client.get_dashboard(CUSTOMER_ID, START_DATE, END_DATE)['breakdowns']
+
+    assert trend['labels'] == list(range(24))
+    assert sum(trend['leads']) == sum(breakdowns['lead_types'].values())